@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 import json
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from canonical_json import write_json
 
 # Translation mappings for "Correct Answers"
 translations = {
@@ -24,8 +28,7 @@ def add_questions_section(file_path, language_code):
                 'correctAnswers': translations.get(language_code, 'Correct Answers')
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            write_json(file_path, data, schema=False)
             
             print(f"✅ Added questions.correctAnswers to {language_code}.json")
         else:
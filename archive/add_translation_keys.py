@@ -5,6 +5,10 @@
 
 import json
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from canonical_json import write_json
 
 # 새로운 번역 키들
 new_keys = {
@@ -75,8 +79,7 @@ def add_keys_to_file(language_code, file_path):
             return False
         
         # 파일 저장
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_json(file_path, data, schema=False)
         
         return True
         
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 import json
 import os
+import sys
 from typing import List, Dict
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from canonical_json import write_json
+
 # 다중 정답 질문 ID 목록
 MULTIPLE_ANSWER_QUESTIONS = [
     2, 4, 6, 11, 12, 13, 14, 36, 37, 41, 42, 48, 49, 50, 51, 52, 53, 55, 57, 58, 
@@ -28,8 +32,7 @@ def load_json_file(file_path: str) -> List[Dict]:
 
 def save_json_file(file_path: str, data: List[Dict]):
     """JSON 파일 저장"""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_json(file_path, data)
 
 def combine_wrong_answers(wrong_answers: List[Dict]) -> List[Dict]:
     """기존 3개 오답을 3개 결합된 오답으로 변환"""
@@ -2,6 +2,11 @@
 # -*- coding: utf-8 -*-
 
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from canonical_json import write_json
 
 def create_arabic_translation():
     """
@@ -201,8 +206,7 @@ def create_arabic_translation():
     arabic_questions.sort(key=lambda x: x['id'])
     
     # 파일 저장
-    with open('data/interview_questions_ar.json', 'w', encoding='utf-8') as f:
-        json.dump(arabic_questions, f, ensure_ascii=False, indent=4)
+    write_json('data/interview_questions_ar.json', arabic_questions)
     
     print(f"إجمالي {len(arabic_questions)} سؤال تم حفظه في الملف العربي.")
     return len(arabic_questions)
@@ -3,6 +3,11 @@
 
 import json
 import re
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from canonical_json import write_json
 
 def improve_arabic_translation():
     """
@@ -181,8 +186,7 @@ def improve_arabic_translation():
             wrong['rationale_ar'] = rationale
     
     # 개선된 파일 저장
-    with open('data/interview_questions_ar.json', 'w', encoding='utf-8') as f:
-        json.dump(arabic_questions, f, ensure_ascii=False, indent=4)
+    write_json('data/interview_questions_ar.json', arabic_questions)
     
     print("تم تحسين جودة الترجمة العربية!")
     return len(arabic_questions)
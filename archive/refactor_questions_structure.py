@@ -3,6 +3,10 @@
 
 import json
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from canonical_json import write_json
 
 def refactor_questions_structure():
     """
@@ -26,8 +30,7 @@ def refactor_questions_structure():
         base_structure.append(base_item)
     
     # 기본 구조 파일 저장
-    with open('data/interview_questions_base.json', 'w', encoding='utf-8') as f:
-        json.dump(base_structure, f, ensure_ascii=False, indent=2)
+    write_json('data/interview_questions_base.json', base_structure)
     
     print("✅ 기본 메타데이터 파일 생성 완료: interview_questions_base.json")
     
@@ -57,8 +60,7 @@ def refactor_questions_structure():
         
         korean_data.append(korean_item)
     
-    with open('data/interview_questions_ko.json', 'w', encoding='utf-8') as f:
-        json.dump(korean_data, f, ensure_ascii=False, indent=2)
+    write_json('data/interview_questions_ko.json', korean_data)
     
     print("✅ 한국어 번역 파일 생성 완료: interview_questions_ko.json")
     
@@ -88,8 +90,7 @@ def refactor_questions_structure():
         
         english_data.append(english_item)
     
-    with open('data/interview_questions_en.json', 'w', encoding='utf-8') as f:
-        json.dump(english_data, f, ensure_ascii=False, indent=2)
+    write_json('data/interview_questions_en.json', english_data)
     
     print("✅ 영어 번역 파일 생성 완료: interview_questions_en.json")
     
@@ -139,8 +140,7 @@ def refactor_questions_structure():
                 refactored_data.append(refactored_item)
             
             # 새로운 구조로 저장
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(refactored_data, f, ensure_ascii=False, indent=2)
+            write_json(filepath, refactored_data)
             
             print(f"✅ {lang_code.upper()} 파일 리팩토링 완료: {len(refactored_data)}개 질문")
         else:
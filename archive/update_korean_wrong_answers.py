@@ -5,6 +5,11 @@ Script to update Korean wrongAnswers based on updated English wrongAnswers
 
 import json
 import re
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from canonical_json import write_json
 
 # Questions that need to be updated with their correct answer counts
 QUESTIONS_TO_UPDATE = {
@@ -97,8 +102,7 @@ def load_json_file(filepath):
 
 def save_json_file(data, filepath):
     """Save JSON file with proper formatting"""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    write_json(filepath, data)
 
 def find_question_by_id(questions, question_id):
     """Find question by ID"""
@@ -10,9 +10,14 @@ python3 data/apply_multilingual_translation.py --language zh
 
 import json
 import csv
+import os
 import re
+import sys
 import argparse
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+from canonical_json import write_json
+
 def apply_translation(language_code):
     print("=" * 70)
     print(f"🔄 {language_code.upper()} 번역을 question_story.json에 적용")
@@ -111,8 +116,7 @@ def apply_translation(language_code):
         print(f"  ✅ 챕터 {chapter_id}: {language_code.upper()} 번역 적용 완료")
     
     # 저장
-    with open('data/question_story.json', 'w', encoding='utf-8') as f:
-        json.dump(story, f, ensure_ascii=False, indent=2)
+    write_json('data/question_story.json', story)
     
     print(f"\n💾 question_story.json 저장 완료!")
     print(f"\n📊 결과:")
@@ -10,7 +10,12 @@
 
 import json
 import csv
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+from canonical_json import write_json
 
 print("=" * 70)
 print("🔄 번역된 CSV를 question_story.json에 적용")
@@ -117,8 +122,7 @@ for chapter in story['civicsStory']:
     print(f"  ✅ 챕터 {chapter_id}: 영어 번역 적용 완료")
 
 # 파일 저장
-with open('data/question_story.json', 'w', encoding='utf-8') as f:
-    json.dump(story, f, ensure_ascii=False, indent=2)
+write_json('data/question_story.json', story)
 
 print(f"\n💾 question_story.json 저장 완료!")
 print(f"\n📊 결과:")
@@ -15,7 +15,7 @@ import { SafeAreaView } from 'react-native-safe-area-context';
 import { Ionicons } from '@expo/vector-icons';
 import * as Speech from 'expo-speech';
 import { t, getCurrentLanguage } from '../utils/i18n';
-import explanations from '../data/n400_explanations.json';
+import QuestionLoader from '../utils/questionLoader';
 
 const N400PracticeScreen = ({ navigation }) => {
   const [questions, setQuestions] = useState([]);
@@ -31,7 +31,7 @@ const N400PracticeScreen = ({ navigation }) => {
 
   const loadQuestions = async () => {
     try {
-      const questionsData = require('../data/n400_questions.json');
+      const questionsData = QuestionLoader.loadN400Questions();
       setQuestions(questionsData);
     } catch (error) {
       Alert.alert('Error', 'Failed to load N-400 questions.');
@@ -182,16 +182,7 @@ const N400PracticeScreen = ({ navigation }) => {
   const currentLang = getCurrentLanguage();
 
   const getExplanationForQuestion = () => {
-    try {
-      if (!currentQuestion) return null;
-      const key = currentQuestion.q_id || `idx_${currentIndex}`;
-      const entry = explanations[key];
-      if (!entry) return null;
-      const content = entry[currentLang] || entry['en'];
-      return content || null;
-    } catch (e) {
-      return null;
-    }
+    return currentQuestion ? currentQuestion.explanation : null;
   };
 
   return (
@@ -259,7 +250,7 @@ const N400PracticeScreen = ({ navigation }) => {
             showsVerticalScrollIndicator={true}
           >
             <Text style={styles.questionText}>
-              {`${currentQuestion.question_en}${getCurrentLanguage() !== 'en' && currentQuestion.question_ko ? ` (${currentQuestion.question_ko})` : ''}`}
+              {`${currentQuestion.question_en}${currentQuestion.question !== currentQuestion.question_en ? ` (${currentQuestion.question})` : ''}`}
             </Text>
           </ScrollView>
           {/* Explanation inside the same card (항상 표시) */}
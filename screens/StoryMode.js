@@ -59,11 +59,11 @@ const StoryMode = ({ navigation }) => {
       const questionsData = await QuestionLoader.loadQuestions();
       // 영문 질문 데이터 별도 로드
       const englishQuestionsData = await QuestionLoader.loadQuestionsForLanguage('en');
-      const storyData = require('../data/question_story.json');
+      const storyChapters = QuestionLoader.loadStory();
       
       setQuestions(questionsData || []);
       setEnglishQuestions(englishQuestionsData || []);
-      setStoryData(storyData.civicsStory || []);
+      setStoryData(storyChapters);
     } catch (error) {
       Alert.alert(t('story.loadErrorTitle'), t('story.loadErrorMessage'));
       console.error('Error loading data:', error);
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오프라인 답변 채점 엔진
+- 모든 언어의 correctAnswers를 쉼표 그룹 단위로 분리하여
+  정규화 변형 / 토큰 집합 / 문자 트라이그램 집합으로 미리 컴파일
+- 음성 인식 결과(transcript)나 입력 답변을 신뢰도 점수와 함께 채점
+- 녹음된 transcript 회귀 코퍼스(.jsonl / .csv)를 일괄 채점
+
+사용법:
+  python answer_grader.py                      # 색인 생성 + 자체 검증 + 벤치마크
+  python answer_grader.py corpus.jsonl [out.csv]  # 코퍼스 일괄 채점
+"""
+
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+
+from canonical_json import write_json
+from text_normalize import (
+    LANGUAGES,
+    answer_variants,
+    char_trigrams,
+    normalize_text,
+    split_answer_groups,
+    tokenize,
+)
+
+# 앱의 AI 의미 평가와 같은 75% 기준
+DEFAULT_THRESHOLD = 0.75
+
+# 점수 = 트라이그램 포함률 * 0.6 + 토큰 재현율 * 0.4
+TRIGRAM_WEIGHT = 0.6
+TOKEN_WEIGHT = 0.4
+
+# 공백으로 단어를 구분하지 않는 언어는 부분 문자열로 완전 일치 판정
+NO_SPACE_LANGUAGES = {'zh'}
+
+# 조사가 뒤에 붙는 언어는 단어 시작 위치만 맞으면 완전 일치 ('헌법입니다' ⊃ '헌법')
+WORD_PREFIX_LANGUAGES = {'ko'}
+
+
+def compile_answer(answer_text, lang):
+    """답변 하나를 변형 / 토큰 / 트라이그램으로 컴파일"""
+    variants = answer_variants(answer_text, lang)
+    tokens = set()
+    trigrams = set()
+    for variant in variants:
+        tokens.update(tokenize(variant, lang, normalized=True))
+        trigrams.update(char_trigrams(variant))
+
+    return {
+        'text': answer_text,
+        'variants': variants,
+        'tokens': frozenset(tokens),
+        'trigrams': frozenset(trigrams),
+    }
+
+
+def compile_answers(answer_list, lang):
+    """correctAnswers / wrongAnswers 배열을 쉼표 그룹 단위로 컴파일"""
+    compiled_list = []
+    for answer in answer_list:
+        for group in split_answer_groups(answer.get('text', '')):
+            compiled = compile_answer(group, lang)
+            if compiled['variants']:
+                compiled_list.append(compiled)
+    return compiled_list
+
+
+def compile_question(question, lang):
+    """
+    문제 하나를 컴파일 (동적 답변 문제는 dynamic 표시)
+    오답 보기도 함께 컴파일하여 'Do not vote' ⊃ 'Vote' 같은 오판을 걸러냄
+    (정답과 똑같은 오답 보기는 데이터 충돌이므로 정답 쪽을 우선)
+    """
+    answers = compile_answers(question.get('correctAnswers', []), lang)
+    correct_variants = {v for a in answers for v in a['variants']}
+    distractors = [
+        d for d in compile_answers(question.get('wrongAnswers', []), lang)
+        if not correct_variants.intersection(d['variants'])
+    ]
+
+    return {
+        'id': question['id'],
+        'dynamic': not answers,
+        'answers': answers,
+        'distractors': distractors,
+    }
+
+
+def compile_bank(questions, lang):
+    """문제 은행 전체를 {문제 ID → 컴파일된 문제} 색인으로 변환"""
+    return {q['id']: compile_question(q, lang) for q in questions}
+
+
+def load_bank(data_dir, lang):
+    """interview_questions_<lang>.json 로드"""
+    with open(data_dir / f'interview_questions_{lang}.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_index(data_dir, languages=LANGUAGES):
+    """모든 언어의 채점 색인 생성: {lang → {id → compiled}}"""
+    index = {}
+    for lang in languages:
+        index[lang] = compile_bank(load_bank(data_dir, lang), lang)
+    return index
+
+
+def _serialize_answers(answers):
+    """컴파일된 답변 리스트 → JSON 직렬화 가능한 형태"""
+    return [
+        {
+            'text': a['text'],
+            'variants': a['variants'],
+            'tokens': sorted(a['tokens']),
+            'trigrams': sorted(a['trigrams']),
+        }
+        for a in answers
+    ]
+
+
+def _deserialize_answers(raw_answers):
+    """_serialize_answers의 역변환"""
+    return [
+        {
+            'text': a['text'],
+            'variants': a['variants'],
+            'tokens': frozenset(a['tokens']),
+            'trigrams': frozenset(a['trigrams']),
+        }
+        for a in raw_answers
+    ]
+
+
+def save_index(index, output_file):
+    """색인을 JSON으로 저장 (집합은 정렬된 리스트로)"""
+    serializable = {
+        lang: {
+            str(qid): {
+                'dynamic': entry['dynamic'],
+                'answers': _serialize_answers(entry['answers']),
+                'distractors': _serialize_answers(entry['distractors']),
+            }
+            for qid, entry in bank.items()
+        }
+        for lang, bank in index.items()
+    }
+    write_json(output_file, serializable, pretty=False)
+
+
+def load_index(index_file):
+    """save_index로 저장한 색인 로드"""
+    with open(index_file, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+
+    index = {}
+    for lang, bank in raw.items():
+        index[lang] = {}
+        for qid, entry in bank.items():
+            index[lang][int(qid)] = {
+                'id': int(qid),
+                'dynamic': entry['dynamic'],
+                'answers': _deserialize_answers(entry['answers']),
+                'distractors': _deserialize_answers(entry['distractors']),
+            }
+    return index
+
+
+def prepare_transcript(transcript, lang):
+    """transcript를 한 번만 정규화 / 토큰화 (여러 문제에 재사용 가능)"""
+    normalized = normalize_text(transcript, lang)
+    return {
+        'normalized': normalized,
+        'padded': f' {normalized} ',
+        'tokens': frozenset(tokenize(normalized, lang, normalized=True)),
+        'trigrams': frozenset(char_trigrams(normalized)),
+    }
+
+
+def score_answer(answer, prepared, lang):
+    """
+    컴파일된 답변 하나에 대한 (점수 0.0 ~ 1.0, 판정 방식, 일치 길이)
+    일치 길이는 완전 일치끼리 비교할 때 더 긴 쪽을 우선하기 위한 값
+    """
+    for variant in answer['variants']:
+        if lang in NO_SPACE_LANGUAGES:
+            matched = variant in prepared['normalized']
+        elif lang in WORD_PREFIX_LANGUAGES:
+            matched = f' {variant}' in prepared['padded']
+        else:
+            matched = f' {variant} ' in prepared['padded']
+        if matched:
+            return 1.0, 'exact', len(variant)
+
+    trigrams = answer['trigrams']
+    tokens = answer['tokens']
+    trigram_score = len(trigrams & prepared['trigrams']) / len(trigrams) if trigrams else 0.0
+    token_score = len(tokens & prepared['tokens']) / len(tokens) if tokens else 0.0
+    return TRIGRAM_WEIGHT * trigram_score + TOKEN_WEIGHT * token_score, 'fuzzy', 0
+
+
+def best_match(answers, prepared, lang):
+    """답변 리스트 중 가장 잘 맞는 것: (점수, 방식, 일치 길이, 원문)"""
+    best = (0.0, 'none', 0, None)
+    for answer in answers:
+        score, method, length = score_answer(answer, prepared, lang)
+        if (score, length) > best[:1] + best[2:3]:
+            best = (score, method, length, answer['text'])
+    return best
+
+
+def grade(compiled_question, transcript, lang, threshold=DEFAULT_THRESHOLD, prepared=None):
+    """
+    transcript 하나를 채점
+    반환: {'correct', 'confidence', 'method', 'matched'}
+    - 오답 보기가 정답보다 같거나 더 잘 맞으면 오답 ('Do not vote' vs 'Vote')
+    - 동적 답변 문제(상원의원, 주지사 등)는 correct=None
+    """
+    if compiled_question['dynamic']:
+        return {'correct': None, 'confidence': 0.0, 'method': 'dynamic', 'matched': None}
+
+    if prepared is None:
+        prepared = prepare_transcript(transcript, lang)
+
+    score, method, length, matched = best_match(compiled_question['answers'], prepared, lang)
+    correct = score >= threshold
+
+    if correct and compiled_question['distractors']:
+        wrong_score, _, wrong_length, wrong_text = best_match(
+            compiled_question['distractors'], prepared, lang)
+        if (wrong_score, wrong_length) >= (score, length):
+            correct = False
+            method = 'distractor'
+            matched = wrong_text
+
+    return {
+        'correct': correct,
+        'confidence': round(score, 4),
+        'method': method,
+        'matched': matched,
+    }
+
+
+def grade_batch(index, records, threshold=DEFAULT_THRESHOLD):
+    """
+    코퍼스 일괄 채점
+    records: {'lang', 'id', 'transcript', 'expected'(선택)} 딕셔너리들
+    반환: (결과 리스트, 요약 통계)
+    """
+    results = []
+    stats = {'total': 0, 'labeled': 0, 'agree': 0, 'false_positive': 0,
+             'false_negative': 0, 'dynamic': 0, 'unknown': 0}
+
+    start = time.perf_counter()
+    for record in records:
+        stats['total'] += 1
+        lang = record['lang']
+        qid = int(record['id'])
+        compiled = index.get(lang, {}).get(qid)
+        if compiled is None:
+            stats['unknown'] += 1
+            results.append({**record, 'correct': None, 'confidence': 0.0,
+                             'method': 'unknown', 'matched': None})
+            continue
+
+        result = grade(compiled, record['transcript'], lang, threshold)
+        results.append({**record, **result})
+
+        if result['correct'] is None:
+            stats['dynamic'] += 1
+            continue
+
+        expected = record.get('expected')
+        if expected is None or expected == '':
+            continue
+        if isinstance(expected, str):
+            expected = expected.strip().lower() in ('1', 'true', 'yes', 'y')
+        stats['labeled'] += 1
+        if result['correct'] == expected:
+            stats['agree'] += 1
+        elif result['correct']:
+            stats['false_positive'] += 1
+        else:
+            stats['false_negative'] += 1
+
+    elapsed = time.perf_counter() - start
+    stats['elapsed_sec'] = elapsed
+    stats['us_per_record'] = elapsed / stats['total'] * 1e6 if stats['total'] else 0.0
+    return results, stats
+
+
+def read_corpus(corpus_file):
+    """회귀 코퍼스 읽기 (.jsonl: 한 줄에 하나의 레코드, .csv: lang,id,transcript,expected)"""
+    if corpus_file.suffix == '.jsonl':
+        with open(corpus_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(corpus_file, 'r', encoding='utf-8', newline='') as f:
+            yield from csv.DictReader(f)
+
+
+def write_results(results, output_file):
+    """채점 결과를 CSV로 저장"""
+    fieldnames = ['lang', 'id', 'transcript', 'expected', 'correct', 'confidence', 'method', 'matched']
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def self_check(index, data_dir):
+    """각 문제의 정답 그룹은 정답으로, 오답 보기는 오답으로 채점되는지 확인"""
+    print("\n🔍 자체 검증 (정답 그룹 / 오답 보기)")
+    for lang, bank in index.items():
+        questions = load_bank(data_dir, lang)
+        missed = 0
+        accepted_wrong = 0
+        checked = 0
+        for q in questions:
+            compiled = bank[q['id']]
+            if compiled['dynamic']:
+                continue
+            for answer in compiled['answers']:
+                checked += 1
+                if not grade(compiled, answer['text'], lang)['correct']:
+                    missed += 1
+            for wrong in q.get('wrongAnswers', []):
+                for group in split_answer_groups(wrong.get('text', '')):
+                    if grade(compiled, group, lang)['correct']:
+                        accepted_wrong += 1
+        status = "✅" if missed == 0 else "⚠️ "
+        print(f"  {status} {lang}: 정답 {checked}개 중 미인식 {missed}개, 오답 보기 중 정답 처리 {accepted_wrong}개 (정답과 동일한 보기 포함)")
+
+
+def benchmark(index, data_dir, rounds=5):
+    """정답/오답 보기를 transcript로 사용한 채점 속도 측정"""
+    records = []
+    for lang in index:
+        for q in load_bank(data_dir, lang):
+            records.append({'lang': lang, 'id': q['id'], 'transcript': q['correctAnswers'][0]['text']})
+            for wrong in q.get('wrongAnswers', []):
+                records.append({'lang': lang, 'id': q['id'], 'transcript': wrong['text']})
+
+    best = None
+    for _ in range(rounds):
+        _, stats = grade_batch(index, records)
+        if best is None or stats['us_per_record'] < best:
+            best = stats['us_per_record']
+
+    print(f"\n⏱️  벤치마크: {len(records):,}개 transcript, 건당 {best:.1f} µs")
+
+
+def main():
+    print("=" * 60)
+    print("🎯 오프라인 답변 채점 엔진")
+    print("=" * 60)
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    index_file = data_dir / 'build' / 'answer_grading_index.json'
+
+    start = time.perf_counter()
+    index = build_index(data_dir)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    total_answers = sum(len(e['answers']) for bank in index.values() for e in bank.values())
+    print(f"\n📚 색인 생성: {len(index)}개 언어, 답변 {total_answers:,}개 ({compile_ms:.1f} ms)")
+
+    save_index(index, index_file)
+    print(f"💾 저장됨: {index_file} ({index_file.stat().st_size / 1024:.1f} KB)")
+
+    if len(sys.argv) >= 2:
+        corpus_file = Path(sys.argv[1])
+        output_file = Path(sys.argv[2]) if len(sys.argv) >= 3 else corpus_file.with_suffix('.graded.csv')
+
+        print(f"\n📖 코퍼스 채점: {corpus_file}")
+        results, stats = grade_batch(index, read_corpus(corpus_file))
+        write_results(results, output_file)
+
+        print(f"  • 총 {stats['total']:,}개 (동적 {stats['dynamic']}개, 알 수 없음 {stats['unknown']}개)")
+        if stats['labeled']:
+            agreement = stats['agree'] / stats['labeled'] * 100
+            print(f"  • 라벨 일치율: {agreement:.1f}% ({stats['agree']}/{stats['labeled']})")
+            print(f"  • 오탐(FP): {stats['false_positive']}개, 미탐(FN): {stats['false_negative']}개")
+        print(f"  • 건당 {stats['us_per_record']:.1f} µs")
+        print(f"💾 결과 저장: {output_file}")
+        return
+
+    self_check(index, data_dir)
+    benchmark(index, data_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지역별 답 문제의 주 × 언어별 정답 오버레이 생성
+- utils/questionProcessor.js의 LOCATION_DEPENDENT_QUESTIONS(문제 id → 유형)와
+  us_political_data.json(states, federal)을 결합
+- data/bundles/dynamic_answers.min.json:
+    {"rationales": {"en": "...", ...}, "federal": {"30": ..., ...},
+     "states": {"AL": {"23": "Katie Britt or Tommy Tuberville", ...}, ...}}
+  주와 무관한 답(federal)은 한 번만 저장하고 주별 답과 합쳐서 오버레이를 만듦
+  답 문구(이름)는 언어와 무관하므로 한 번만 저장하고, 주 × 언어 오버레이
+  {문제 id → correctAnswers}는 overlay_for / 앱(questionProcessor.js)에서 세션마다 한 번 만듦
+  → 문제마다 await하지 않고 사용자 주의 오버레이 하나를 적용
+- 하원의원(representative)은 사용자별 값이라 오버레이에 넣지 않고 앱에서 적용
+- 답 문구는 LocationManager.getLocationBasedAnswer와 같음 (상원의원: "A or B"),
+  근거 문구는 locales/<lang>.json의 interview.userSetAnswer
+- 모든 주 × 언어에 대해 원본 데이터와 대조 검증, 실패하면 종료 코드 1
+
+사용법:
+  python build_dynamic_answers.py
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+from canonical_json import write_json
+from question_schema import DYNAMIC_QUESTION_IDS
+from text_normalize import LANGUAGES
+
+# 사용자별로 달라서 주 단위로 미리 만들 수 없는 유형
+USER_SPECIFIC_TYPES = {'representative'}
+
+LOCATION_MAP_RE = re.compile(r'const LOCATION_DEPENDENT_QUESTIONS = \{(.*?)\};', re.S)
+LOCATION_ENTRY_RE = re.compile(r"(\d+)\s*:\s*'(\w+)'")
+
+
+def load_location_questions(processor_js):
+    """questionProcessor.js의 LOCATION_DEPENDENT_QUESTIONS → {id: 유형}"""
+    with open(processor_js, 'r', encoding='utf-8') as f:
+        match = LOCATION_MAP_RE.search(f.read())
+    if not match:
+        raise ValueError(f"LOCATION_DEPENDENT_QUESTIONS를 찾을 수 없음: {processor_js}")
+    return {int(qid): kind for qid, kind in LOCATION_ENTRY_RE.findall(match.group(1))}
+
+
+def answer_text(kind, state_info, federal):
+    """LocationManager.getLocationBasedAnswer와 같은 문구 (값이 없으면 None → 오버레이에서 제외)"""
+    if kind == 'senator':
+        senators = [s for s in state_info.get('senators', []) if s]
+        if len(senators) >= 2:
+            return f"{senators[0]} or {senators[1]}"
+        return senators[0] if senators else None
+    if kind == 'governor':
+        return state_info.get('governor') or None
+    if kind == 'state_capital':
+        return state_info.get('capital') or None
+    if kind == 'speaker':
+        return federal.get('speakerOfHouse') or None
+    if kind == 'president':
+        return federal.get('president') or None
+    if kind == 'vice_president':
+        return federal.get('vicePresident') or None
+    raise ValueError(f"알 수 없는 유형: {kind}")
+
+
+def build_bundle(location_questions, political, rationales):
+    """{'rationales': {lang: 문구}, 'federal': {문제 id: 답 문구}, 'states': {주: {문제 id: 답 문구}}}"""
+    federal = political.get('federal', {})
+
+    def answers_for(state_info):
+        answers = {}
+        for qid, kind in sorted(location_questions.items()):
+            if kind in USER_SPECIFIC_TYPES:
+                continue
+            text = answer_text(kind, state_info, federal)
+            if text:
+                answers[str(qid)] = text
+        return answers
+
+    # 주와 무관한 답은 federal에 한 번만 저장
+    federal_answers = answers_for({})
+    states = {}
+    for code, state_info in political['states'].items():
+        states[code] = {qid: text for qid, text in answers_for(state_info).items() if qid not in federal_answers}
+    return {'rationales': rationales, 'federal': federal_answers, 'states': states}
+
+
+def overlay_for(bundle, state, lang):
+    """주 × 언어 오버레이 {문제 id: correctAnswers} (questionProcessor.js getStateOverlay와 같음)"""
+    rationale = bundle['rationales'].get(lang) or bundle['rationales']['en']
+    answers = {**bundle['federal'], **bundle['states'].get(state, {})}
+    return {int(qid): [{'text': text, 'rationale': rationale}] for qid, text in answers.items()}
+
+
+def verify(bundle, location_questions, political, rationales):
+    """모든 주 × 언어 오버레이를 원본 값과 대조"""
+    errors = []
+    if set(location_questions) != DYNAMIC_QUESTION_IDS:
+        errors.append(f"questionProcessor.js 지역 문제 {sorted(location_questions)} ≠ "
+                      f"question_schema {sorted(DYNAMIC_QUESTION_IDS)}")
+
+    federal = political.get('federal', {})
+    federal_values = {'speaker': 'speakerOfHouse', 'president': 'president', 'vice_president': 'vicePresident'}
+    expected_ids = {q for q, kind in location_questions.items() if kind not in USER_SPECIFIC_TYPES}
+
+    federal_ids = {q for q, kind in location_questions.items() if kind in federal_values}
+    if {int(q) for q in bundle['federal']} != federal_ids:
+        errors.append(f"federal 문제 id {sorted(bundle['federal'])} ≠ {sorted(federal_ids)}")
+
+    missing_states = set(political['states']) - set(bundle['states'])
+    if missing_states:
+        errors.append(f"오버레이 없는 주: {sorted(missing_states)}")
+
+    for lang, rationale in rationales.items():
+        for code, state_info in political['states'].items():
+            overlay = overlay_for(bundle, code, lang)
+            if set(overlay) != expected_ids:
+                errors.append(f"[{lang}] {code}: 문제 id {sorted(overlay)} ≠ {sorted(expected_ids)}")
+            for qid, answers in overlay.items():
+                kind = location_questions[qid]
+                if len(answers) != 1 or answers[0]['rationale'] != rationale:
+                    errors.append(f"[{lang}] {code} Q.{qid}: 정답 형식 / 근거 문구 불일치")
+                    continue
+                text = answers[0]['text']
+                if kind == 'senator':
+                    ok = all(name in text for name in state_info['senators'])
+                elif kind == 'governor':
+                    ok = text == state_info['governor']
+                elif kind == 'state_capital':
+                    ok = text == state_info['capital']
+                else:
+                    ok = text == federal[federal_values[kind]]
+                if not ok:
+                    errors.append(f"[{lang}] {code} Q.{qid} ({kind}): '{text}'")
+    return errors
+
+
+def main():
+    print("=" * 60)
+    print("🗺️  주 × 언어별 지역 답 오버레이 생성")
+    print("=" * 60)
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    bundle_dir = data_dir / 'bundles'
+
+    location_questions = load_location_questions(project_dir / 'utils' / 'questionProcessor.js')
+    with open(data_dir / 'us_political_data.json', 'r', encoding='utf-8') as f:
+        political = json.load(f)
+    rationales = {}
+    for lang in LANGUAGES:
+        with open(project_dir / 'locales' / f'{lang}.json', 'r', encoding='utf-8') as f:
+            rationales[lang] = json.load(f)['interview']['userSetAnswer']
+
+    print(f"📋 지역 문제: {', '.join(f'{q}({k})' for q, k in sorted(location_questions.items()))}")
+    print(f"🏛️  주 {len(political['states'])}개 × 언어 {len(rationales)}개")
+
+    bundle = build_bundle(location_questions, political, rationales)
+    errors = verify(bundle, location_questions, political, rationales)
+    if errors:
+        print(f"\n❌ 검증 실패 {len(errors)}건:")
+        for error in errors[:10]:
+            print(f"  • {error}")
+        sys.exit(1)
+    print("✅ 검증: 모든 주 × 언어 오버레이가 원본 값과 일치")
+
+    output_file = bundle_dir / 'dynamic_answers.min.json'
+    result = write_json(output_file, bundle, pretty=False)
+    print(f"\n💾 {output_file.name}: {result['bytes']:,} B")
+
+
+if __name__ == "__main__":
+    main()
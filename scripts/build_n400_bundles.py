@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+언어별 N-400 연습 번들 생성
+- n400_questions.json(질문 40개, q_id / question_<lang>)과 n400_explanations.json(해설)을
+  빌드 시점에 결합 → 앱(N400PracticeScreen)이 두 파일을 모두 파싱하거나 인덱스를 계산하지 않음
+  · 해설은 q_id로 찾고, 없으면 idx_<순서>로 찾음 (앱의 기존 조회 방식과 같음)
+  · 해설 언어가 없으면 en
+- 검증 (error면 종료 코드 1)
+    error:   q_id 중복, 해설 없음, en 해설의 intent / answer_guidance 없음
+    warning: 어느 질문과도 연결되지 않는 해설 키, q_id 항목에 가려진 idx 항목 중 내용이 다른 것
+- data/bundles/n400_<lang>.min.json (question_<lang>이 있는 언어만, 나머지 언어는 앱에서 en 사용):
+    {"version": 1, "lang": "ko",
+     "fields": ["id", "q_id", "category", "question", "question_en", "title", "intent", "answer_guidance"],
+     "index": {"name_full": 0, ...},      ← q_id → items 위치
+     "items": [[1, "name_full", ...], ...]}
+
+사용법:
+  python build_n400_bundles.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from canonical_json import write_json
+
+QUESTIONS_FILE = 'n400_questions.json'
+EXPLANATIONS_FILE = 'n400_explanations.json'
+BUNDLE_PREFIX = 'n400_'
+BUNDLE_VERSION = 1
+
+REFERENCE_LANG = 'en'
+QUESTION_PREFIX = 'question_'
+INDEX_KEY_PREFIX = 'idx_'
+EXPLANATION_FIELDS = ['title', 'intent', 'answer_guidance']
+REQUIRED_FIELDS = ['intent', 'answer_guidance']
+
+
+def question_languages(questions):
+    """question_<lang> 필드가 있는 언어 (en 먼저)"""
+    languages = {key[len(QUESTION_PREFIX):] for item in questions for key in item if key.startswith(QUESTION_PREFIX)}
+    return sorted(languages, key=lambda lang: (lang != REFERENCE_LANG, lang))
+
+
+def join(questions, explanations):
+    """질문 순서대로 (질문, 해설 키, 해설) 결합 → (결합 목록, errors, warnings)"""
+    errors = []
+    warnings = []
+    joined = []
+    seen = {}
+    for position, item in enumerate(questions):
+        q_id = item.get('q_id')
+        label = f"{item.get('id')}번({q_id or '-'})"
+        if q_id in seen:
+            errors.append(f"{label}: q_id 중복 ({seen[q_id]}번과 같음)")
+        elif q_id:
+            seen[q_id] = item.get('id')
+
+        index_key = f'{INDEX_KEY_PREFIX}{position}'
+        key = q_id if q_id in explanations else index_key
+        entry = explanations.get(key)
+        if entry is None:
+            errors.append(f"{label}: 해설 없음 ({q_id} / {index_key})")
+        else:
+            reference = entry.get(REFERENCE_LANG, {})
+            missing = [field for field in REQUIRED_FIELDS if not (reference.get(field) or '').strip()]
+            if missing:
+                errors.append(f"{label}: {REFERENCE_LANG} 해설에 {', '.join(missing)} 없음")
+            if key == q_id and index_key in explanations and explanations[index_key] != entry:
+                changed = sorted(lang for lang in set(entry) | set(explanations[index_key])
+                                 if entry.get(lang) != explanations[index_key].get(lang))
+                warnings.append(f"{label}: {index_key}가 {q_id} 항목에 가려짐 (내용 다름: {', '.join(changed)})")
+        joined.append((item, key, entry or {}))
+
+    used = {key for _, key, _ in joined}
+    shadowed = {f'{INDEX_KEY_PREFIX}{i}' for i in range(len(questions))}
+    orphans = sorted(key for key in explanations if key not in used and key not in shadowed)
+    if orphans:
+        warnings.append(f"질문과 연결되지 않는 해설 {len(orphans)}개: {', '.join(orphans[:10])}")
+    return joined, errors, warnings
+
+
+def build_bundle(joined, lang):
+    """결합 목록 → 한 언어 번들 (en 번들에는 question_en 열을 두지 않음)"""
+    fields = ['id', 'q_id', 'category', 'question'] + (['question_en'] if lang != REFERENCE_LANG else [])
+    fields += EXPLANATION_FIELDS
+    items = []
+    index = {}
+    for item, key, entry in joined:
+        explanation = entry.get(lang) or entry.get(REFERENCE_LANG, {})
+        question_en = item.get(f'{QUESTION_PREFIX}{REFERENCE_LANG}', '')
+        row = [item['id'], item.get('q_id') or key, item.get('category', ''),
+               item.get(f'{QUESTION_PREFIX}{lang}') or question_en]
+        if lang != REFERENCE_LANG:
+            row.append(question_en)
+        row += [explanation.get(field, '') for field in EXPLANATION_FIELDS]
+        index[row[1]] = len(items)
+        items.append(row)
+    return {'version': BUNDLE_VERSION, 'lang': lang, 'fields': fields, 'index': index, 'items': items}
+
+
+def verify(bundle, joined):
+    """번들을 앱과 같은 방식(index → fields)으로 읽어서 원본과 대조"""
+    errors = []
+    lang = bundle['lang']
+    fields = bundle['fields']
+    for item, key, entry in joined:
+        q_id = item.get('q_id') or key
+        record = dict(zip(fields, bundle['items'][bundle['index'][q_id]]))
+        explanation = entry.get(lang) or entry.get(REFERENCE_LANG, {})
+        if record['id'] != item['id']:
+            errors.append(f"{lang} {q_id}: id {record['id']} ≠ {item['id']}")
+        if record.get('question_en', record['question']) != item.get(f'{QUESTION_PREFIX}{REFERENCE_LANG}'):
+            errors.append(f"{lang} {q_id}: question_en 다름")
+        if any(record[field] != explanation.get(field, '') for field in EXPLANATION_FIELDS):
+            errors.append(f"{lang} {q_id}: 해설 다름")
+    return errors
+
+
+def main():
+    print("=" * 60)
+    print("📝 언어별 N-400 연습 번들 생성")
+    print("=" * 60)
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    bundle_dir = data_dir / 'bundles'
+
+    with open(data_dir / QUESTIONS_FILE, 'r', encoding='utf-8') as f:
+        questions = json.load(f)
+    with open(data_dir / EXPLANATIONS_FILE, 'r', encoding='utf-8') as f:
+        explanations = json.load(f)
+
+    joined, errors, warnings = join(questions, explanations)
+    by_index = sum(1 for item, key, _ in joined if key != item.get('q_id'))
+    print(f"🔗 질문 {len(questions)}개 ↔ 해설 {len(explanations)}개 (q_id {len(joined) - by_index}, 인덱스 {by_index})")
+    for warning in warnings:
+        print(f"  ⚠️  {warning}")
+
+    languages = question_languages(questions)
+    source_bytes = sum((data_dir / name).stat().st_size for name in (QUESTIONS_FILE, EXPLANATIONS_FILE))
+    print(f"\n  {'언어':<6}{'질문 번역':>10}{'해설 번역':>10}{'크기':>10}")
+    for lang in languages:
+        bundle = build_bundle(joined, lang)
+        errors.extend(verify(bundle, joined))
+        if errors:
+            break
+        result = write_json(bundle_dir / f'{BUNDLE_PREFIX}{lang}.min.json', bundle, pretty=False, schema=False)
+        translated = sum(1 for item, _, _ in joined if item.get(f'{QUESTION_PREFIX}{lang}'))
+        explained = sum(1 for _, _, entry in joined if lang in entry)
+        print(f"  {lang:<6}{translated:>10}{explained:>10}{result['bytes']:>10,}")
+
+    if errors:
+        print(f"\n❌ 검증 실패 {len(errors)}건:")
+        for error in errors[:10]:
+            print(f"  • {error}")
+        sys.exit(1)
+    print(f"\n✅ 검증: 모든 언어 번들이 원본 질문 / 해설과 일치 (이전: 두 파일 {source_bytes:,} B 파싱)")
+    print(f"📁 저장 위치: {bundle_dir}")
+
+
+if __name__ == "__main__":
+    main()
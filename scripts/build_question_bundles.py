@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+언어별 앱 번들 생성
+- data/interview_questions_<lang>.json과 question_story.json을 공백 없는 JSON으로 압축하여
+  data/bundles/에 저장
+- 9개 언어 + 스토리에서 반복되는 문자열(카테고리 라벨, 고유명사, 영어 원문, 'normal'/'answer' 등)을
+  공유 문자열 테이블(strings.min.json) 하나에 모으고 번들에는 테이블 인덱스(정수)만 기록
+  · 숫자 필드(NUMERIC_FIELDS)의 정수는 그대로, 그 외 정수는 문자열 인덱스
+  · 한 번만 나오거나 인덱스로 바꿔도 줄지 않는 문자열은 그대로 둠
+  · 번들 형식: {"numericFields": ["chapterId", "id", "linkedQuestions"], "data": <치환된 원본>}
+    (숫자 필드 목록을 번들 머리에 넣어 앱이 같은 목록을 따로 들고 있지 않음)
+  · 앱에서는 utils/internedStrings.js가 번들을 처음 요청할 때 제자리에서 해석
+- 크기 / SHA-256 / 문제 수를 담은 data/bundles/manifest.json 생성
+  (utils/questionLoader.js가 지원 언어 목록과 무결성 확인에 사용)
+- 앱 시작 시 파싱하는 바이트 수와 문자열 중복 제거율을 파일별로 출력
+"""
+
+import json
+from collections import Counter
+from pathlib import Path
+
+from canonical_json import dumps, write_json
+from text_normalize import LANGUAGES
+
+BUNDLE_PREFIX = 'interview_questions_'
+STORY_FILE = 'question_story.json'
+STRING_TABLE_FILE = 'strings.min.json'
+
+# 정수 값을 그대로 두는 필드 (번들의 numericFields로 기록되어 앱이 그대로 사용)
+NUMERIC_FIELDS = {'id', 'chapterId', 'linkedQuestions'}
+
+
+def iter_strings(value):
+    """값 안의 모든 문자열 (딕셔너리 키 제외)"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for child in value.values():
+            yield from iter_strings(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from iter_strings(child)
+
+
+def build_string_table(documents):
+    """
+    반복 문자열 테이블
+    자주 나오는 문자열부터 짧은 인덱스를 주고, 인덱스로 바꿔도 줄어들지 않는 문자열은 제외
+    반환: (테이블, 전체 문자열 빈도)
+    """
+    counts = Counter()
+    for document in documents:
+        counts.update(iter_strings(document))
+
+    table = []
+    for text, count in counts.most_common():
+        if count < 2:
+            break
+        encoded_length = len(dumps(text, pretty=False).encode('utf-8'))
+        id_length = len(str(len(table)))
+        # 테이블 항목 자체 비용(문자열 + 쉼표)보다 절약분이 커야 함
+        if count * (encoded_length - id_length) > encoded_length + 1:
+            table.append(text)
+    return table, counts
+
+
+def intern(value, string_ids, key=None):
+    """문자열을 테이블 인덱스로 치환한 복사본"""
+    if isinstance(value, str):
+        return string_ids.get(value, value)
+    if isinstance(value, dict):
+        return {child_key: intern(child, string_ids, child_key) for child_key, child in value.items()}
+    if isinstance(value, list):
+        return [intern(child, string_ids, key) for child in value]
+    if isinstance(value, int) and not isinstance(value, bool) and key not in NUMERIC_FIELDS:
+        raise ValueError(f"숫자 필드가 아닌 '{key}'에 정수가 있어 문자열 인덱스와 구분할 수 없음: {value}")
+    return value
+
+
+def resolve(value, table, numeric_fields, key=None):
+    """intern의 역변환 (검증용, 앱과 같이 번들 머리의 numericFields 사용)"""
+    if isinstance(value, dict):
+        return {child_key: resolve(child, table, numeric_fields, child_key) for child_key, child in value.items()}
+    if isinstance(value, list):
+        return [resolve(child, table, numeric_fields, key) for child in value]
+    if isinstance(value, int) and not isinstance(value, bool) and key not in numeric_fields:
+        return table[value]
+    return value
+
+
+def make_bundle(document, string_ids, table, label):
+    """원본 → 번들 ({numericFields, data}), 앱과 같은 방식으로 해석하여 원본과 대조"""
+    bundle = {'numericFields': sorted(NUMERIC_FIELDS), 'data': intern(document, string_ids)}
+    if resolve(bundle['data'], table, set(bundle['numericFields'])) != document:
+        raise ValueError(f"{label}: 문자열 테이블 해석 결과가 원본과 다름")
+    return bundle
+
+
+def write_bundle(bundle_file, data, **extra):
+    """번들 하나 저장 후 manifest 항목 반환"""
+    written = write_json(bundle_file, data, pretty=False)
+    return {'file': bundle_file.name, 'bytes': written['bytes'], 'sha256': written['sha256'], **extra}
+
+
+def main():
+    print("=" * 60)
+    print("🎯 언어별 문제 번들 생성")
+    print("=" * 60)
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    bundle_dir = data_dir / 'bundles'
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+
+    sources = {}
+    for lang in LANGUAGES:
+        with open(data_dir / f'{BUNDLE_PREFIX}{lang}.json', 'r', encoding='utf-8') as f:
+            sources[lang] = json.load(f)
+    with open(data_dir / STORY_FILE, 'r', encoding='utf-8') as f:
+        story = json.load(f)
+
+    table, counts = build_string_table(list(sources.values()) + [story])
+    string_ids = {text: i for i, text in enumerate(table)}
+
+    manifest = {'version': 3, 'languages': {}}
+    manifest['strings'] = write_bundle(bundle_dir / STRING_TABLE_FILE, table, count=len(table))
+
+    source_sizes = {}
+    plain_sizes = {}
+    for lang in LANGUAGES:
+        source_file = data_dir / f'{BUNDLE_PREFIX}{lang}.json'
+        bundle_file = bundle_dir / f'{BUNDLE_PREFIX}{lang}.min.json'
+        bundle = make_bundle(sources[lang], string_ids, table, lang)
+
+        source_sizes[lang] = source_file.stat().st_size
+        plain_sizes[lang] = len(dumps(sources[lang], pretty=False).encode('utf-8'))
+        manifest['languages'][lang] = write_bundle(bundle_file, bundle, questions=len(sources[lang]))
+
+    story_bundle = make_bundle(story, string_ids, table, "스토리")
+    plain_sizes['story'] = len(dumps(story, pretty=False).encode('utf-8'))
+    manifest['story'] = write_bundle(bundle_dir / 'question_story.min.json', story_bundle,
+                                     chapters=len(story.get('civicsStory', [])))
+
+    write_json(bundle_dir / 'manifest.json', manifest)
+
+    # 이전에는 QUESTION_FILES가 9개 파일을 모두 require 했으므로 언어와 무관하게 전체를 파싱
+    eager_bytes = sum(source_sizes.values())
+    table_bytes = manifest['strings']['bytes']
+
+    print(f"\n📊 앱 시작 시 파싱하는 바이트 (이전: 9개 언어 전체 {eager_bytes:,} B, 공유 테이블 포함)")
+    print(f"  {'파일':<6}{'원본':>12}{'압축':>12}{'문자열 치환':>14}{'절감':>10}{'시작 시 절감':>16}")
+    for lang in LANGUAGES:
+        bundle_bytes = manifest['languages'][lang]['bytes']
+        interned_saved = plain_sizes[lang] - bundle_bytes
+        startup_saved = (eager_bytes - bundle_bytes - table_bytes) / eager_bytes * 100
+        print(f"  {lang:<6}{source_sizes[lang]:>12,}{plain_sizes[lang]:>12,}{bundle_bytes:>14,}"
+              f"{interned_saved:>10,}{startup_saved:>15.1f}%")
+    story_bytes = manifest['story']['bytes']
+    print(f"  {'story':<6}{(data_dir / STORY_FILE).stat().st_size:>12,}{plain_sizes['story']:>12,}"
+          f"{story_bytes:>14,}{plain_sizes['story'] - story_bytes:>10,}")
+
+    total_strings = sum(counts.values())
+    string_bytes = sum(len(text.encode('utf-8')) * count for text, count in counts.items())
+    unique_bytes = sum(len(text.encode('utf-8')) for text in counts)
+    plain_total = sum(plain_sizes.values())
+    interned_total = sum(info['bytes'] for info in manifest['languages'].values()) + story_bytes + table_bytes
+    print(f"\n🔁 문자열 {total_strings:,}개 중 고유 {len(counts):,}개"
+          f" (바이트 기준 중복 제거율 {1 - unique_bytes / string_bytes:.1%})")
+    print(f"  • 공유 테이블: {len(table):,}개 문자열, {table_bytes:,} B")
+    print(f"  • 번들 총 크기: {plain_total:,} B → {interned_total:,} B"
+          f" (테이블 포함, {plain_total - interned_total:,} B 절감)")
+    print(f"📁 저장 위치: {bundle_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+9개 언어 문제 은행 + question_story.json 전문 검색 색인
+- 문제(question), 정답(answer), 해설(rationale), 오답(wrong),
+  스토리 챕터 제목/소개, 스토리 섹션 본문을 문서로 색인
+- 언어별 토큰화 (zh: CJK 바이그램, ko: 음절 바이그램,
+  vi/fr/es/tl: 발음 구별 기호 제거, 힌디어/아랍어 정규화)
+- 압축된 단일 바이너리 파일로 저장하고 BM25로 순위 매김
+
+사용법:
+  python build_search_index.py                    # 색인 생성
+  python build_search_index.py query "검색어" [lang]  # 검색
+"""
+
+import heapq
+import json
+import math
+import struct
+import sys
+import time
+import zlib
+from array import array
+from collections import defaultdict
+from pathlib import Path
+
+from text_normalize import CJK_RE, HANGUL_RE, LANGUAGES, tokenize
+
+INDEX_MAGIC = b'CTSI'
+INDEX_VERSION = 1
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+PREVIEW_LENGTH = 80
+
+
+def content_text(content_list):
+    """content 배열 ({type, text} 딕셔너리들)에서 텍스트만 이어 붙이기"""
+    if not content_list:
+        return ""
+    return ''.join(item.get('text', '') for item in content_list if isinstance(item, dict))
+
+
+def iter_question_documents(data_dir):
+    """문제 은행의 필드별 문서 생성"""
+    for lang in LANGUAGES:
+        with open(data_dir / f'interview_questions_{lang}.json', 'r', encoding='utf-8') as f:
+            questions = json.load(f)
+
+        for q in questions:
+            base = {'lang': lang, 'kind': 'question', 'qid': q['id']}
+            yield {**base, 'field': 'question'}, q.get('question', '')
+            for answer in q.get('correctAnswers', []):
+                yield {**base, 'field': 'answer'}, answer.get('text', '')
+                yield {**base, 'field': 'rationale'}, answer.get('rationale', '')
+            for wrong in q.get('wrongAnswers', []):
+                yield {**base, 'field': 'wrong'}, wrong.get('text', '')
+
+
+def iter_story_documents(data_dir):
+    """스토리의 챕터 제목/소개와 섹션 본문 문서 생성"""
+    with open(data_dir / 'question_story.json', 'r', encoding='utf-8') as f:
+        story = json.load(f)
+
+    for chapter in story.get('civicsStory', []):
+        chapter_id = chapter.get('chapterId')
+        for lang, translation in chapter.get('translations', {}).items():
+            base = {'lang': lang, 'kind': 'story', 'chapter': chapter_id, 'section': None}
+            yield {**base, 'field': 'title'}, translation.get('title', '')
+            yield {**base, 'field': 'introduction'}, translation.get('introduction', '')
+
+        for section_idx, section in enumerate(chapter.get('sections', []), 1):
+            linked = section.get('linkedQuestions', [])
+            for key, value in section.items():
+                if not key.startswith('content_'):
+                    continue
+                lang = key[len('content_'):]
+                yield {
+                    'lang': lang, 'kind': 'story', 'chapter': chapter_id,
+                    'section': section_idx, 'field': 'content', 'linkedQuestions': linked,
+                }, content_text(value)
+
+
+def build_index(data_dir):
+    """
+    역색인 생성
+    반환: (docs, doc_lengths, postings)
+    postings: {'lang:term' → [(doc_id, tf), ...]}
+    """
+    docs = []
+    doc_lengths = []
+    postings = defaultdict(list)
+
+    for source in (iter_question_documents(data_dir), iter_story_documents(data_dir)):
+        for meta, text in source:
+            if not text or not text.strip():
+                continue
+            tokens = tokenize(text, meta['lang'])
+            if not tokens:
+                continue
+
+            doc_id = len(docs)
+            preview = ' '.join(text.split())
+            meta['preview'] = preview[:PREVIEW_LENGTH] + ('…' if len(preview) > PREVIEW_LENGTH else '')
+            docs.append(meta)
+            doc_lengths.append(len(tokens))
+
+            counts = defaultdict(int)
+            for token in tokens:
+                counts[token] += 1
+            for token, tf in counts.items():
+                postings[f"{meta['lang']}:{token}"].append((doc_id, tf))
+
+    return docs, doc_lengths, postings
+
+
+def save_index(docs, doc_lengths, postings, output_file):
+    """
+    디스크 형식: MAGIC(4) | version(u16) | header 길이(u32) | zlib(header JSON) | zlib(postings)
+    postings는 doc_id 차이값과 tf를 번갈아 담은 uint32 배열
+    header의 terms는 {term → [배열 시작 위치, 문서 수]}
+    """
+    terms = {}
+    flat = array('I')
+    for term in sorted(postings):
+        entries = postings[term]
+        terms[term] = [len(flat), len(entries)]
+        previous = 0
+        for doc_id, tf in entries:
+            flat.append(doc_id - previous)
+            flat.append(tf)
+            previous = doc_id
+
+    header = {
+        'docs': docs,
+        'docLengths': doc_lengths,
+        'terms': terms,
+    }
+    header_bytes = zlib.compress(
+        json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 9)
+    postings_bytes = zlib.compress(flat.tobytes(), 9)
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'wb') as f:
+        f.write(INDEX_MAGIC)
+        f.write(struct.pack('<HI', INDEX_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        f.write(postings_bytes)
+
+
+def load_index(index_file):
+    """save_index로 저장한 색인 로드 → 검색용 딕셔너리"""
+    with open(index_file, 'rb') as f:
+        raw = f.read()
+
+    if raw[:4] != INDEX_MAGIC:
+        raise ValueError(f"검색 색인 파일이 아님: {index_file}")
+    version, header_length = struct.unpack_from('<HI', raw, 4)
+    if version != INDEX_VERSION:
+        raise ValueError(f"지원하지 않는 색인 버전: {version}")
+
+    offset = 4 + struct.calcsize('<HI')
+    header = json.loads(zlib.decompress(raw[offset:offset + header_length]).decode('utf-8'))
+    flat = array('I')
+    flat.frombytes(zlib.decompress(raw[offset + header_length:]))
+
+    # BM25 문서 길이 정규화 항은 검색마다 계산하지 않도록 미리 계산
+    doc_lengths = header['docLengths']
+    avg_length = sum(doc_lengths) / len(doc_lengths) if doc_lengths else 1.0
+    norms = [BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length) for length in doc_lengths]
+
+    return {
+        'docs': header['docs'],
+        'norms': norms,
+        'terms': header['terms'],
+        'postings': flat,
+        'bigrams': bigrams_by_char(header['terms']),
+    }
+
+
+def bigrams_by_char(terms):
+    """
+    zh / ko 바이그램 term → 그 글자가 들어간 바이그램 목록 ('zh:宪' → ['zh:宪法', 'zh:违宪', ...])
+    한 글자 검색어('宪')는 한 글자 term이 없어서 바이그램으로 찾음
+    """
+    by_char = defaultdict(list)
+    for term in terms:
+        lang, _, token = term.partition(':')
+        if len(token) == 2 and (CJK_RE.fullmatch(token) or HANGUL_RE.fullmatch(token)):
+            for char in set(token):
+                by_char[f'{lang}:{char}'].append(term)
+    return dict(by_char)
+
+
+def search(index, query, lang=None, field=None, limit=10):
+    """
+    BM25 검색
+    - lang 미지정 시 모든 언어에서 각 언어의 토크나이저로 검색
+    - 검색어 토큰 적중 비율을 곱해 일부만 맞는 문서의 순위를 낮춤
+    - zh / ko 한 글자 검색어는 그 글자가 들어간 바이그램으로 검색
+    반환: [{'score', 'lang', 'kind', 'qid'|'chapter'/'section', 'field', 'preview'}, ...]
+    """
+    docs = index['docs']
+    norms = index['norms']
+    terms = index['terms']
+    flat = index['postings']
+    total_docs = len(docs)
+    k1_plus_1 = BM25_K1 + 1
+
+    scores = defaultdict(float)
+    matched_terms = defaultdict(int)
+    query_sizes = {}
+
+    for search_lang in ([lang] if lang else LANGUAGES):
+        tokens = set(tokenize(query, search_lang))
+        query_sizes[search_lang] = len(tokens)
+        for token in tokens:
+            term = f'{search_lang}:{token}'
+            # 한 글자 zh / ko 검색어는 그 글자가 들어간 바이그램들 (문서마다 가장 높은 점수 하나)
+            candidates = [term] if term in terms else index.get('bigrams', {}).get(term, [])
+            token_scores = {}
+            for candidate in candidates:
+                # postings: (doc_id 차이, tf) 쌍 — 모든 언어 검색에서 가장 많이 도는 루프라 인라인으로 디코딩
+                start, df = terms[candidate]
+                idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+                doc_id = 0
+                for i in range(start, start + df * 2, 2):
+                    doc_id += flat[i]
+                    if field and docs[doc_id]['field'] != field:
+                        continue
+                    tf = flat[i + 1]
+                    score = idf * tf * k1_plus_1 / (tf + norms[doc_id])
+                    if score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = score
+            for doc_id, score in token_scores.items():
+                scores[doc_id] += score
+                matched_terms[doc_id] += 1
+
+    def final_score(doc_id):
+        return scores[doc_id] * matched_terms[doc_id] / query_sizes[docs[doc_id]['lang']]
+
+    hits = []
+    for doc_id in heapq.nlargest(limit, scores, key=final_score):
+        hit = dict(docs[doc_id])
+        hit['score'] = round(final_score(doc_id), 4)
+        hits.append(hit)
+    return hits
+
+
+def format_hit(hit):
+    """검색 결과 한 줄 표시"""
+    if hit['kind'] == 'question':
+        location = f"Q.{hit['qid']} {hit['field']}"
+    elif hit.get('section'):
+        location = f"챕터 {hit['chapter']} 섹션 {hit['section']} (Q.{hit['linkedQuestions']})"
+    else:
+        location = f"챕터 {hit['chapter']} {hit['field']}"
+    return f"[{hit['lang']}] {location} ({hit['score']}) {hit['preview']}"
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    index_file = data_dir / 'build' / 'search_index.bin'
+
+    if len(sys.argv) >= 3 and sys.argv[1] == 'query':
+        query = sys.argv[2]
+        lang = sys.argv[3] if len(sys.argv) >= 4 else None
+
+        index = load_index(index_file)
+        start = time.perf_counter()
+        hits = search(index, query, lang)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"🔍 '{query}' ({lang or '모든 언어'}): {len(hits)}건, {elapsed_ms:.3f} ms")
+        for i, hit in enumerate(hits, 1):
+            print(f"  {i}. {format_hit(hit)}")
+        return
+
+    print("=" * 60)
+    print("🎯 전문 검색 색인 생성")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    docs, doc_lengths, postings = build_index(data_dir)
+    save_index(docs, doc_lengths, postings, index_file)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    source_size = sum((data_dir / f'interview_questions_{lang}.json').stat().st_size for lang in LANGUAGES)
+    source_size += (data_dir / 'question_story.json').stat().st_size
+    index_size = index_file.stat().st_size
+
+    print(f"\n📊 문서 수: {len(docs):,}개")
+    print(f"📊 용어 수: {len(postings):,}개")
+    print(f"⏱️  생성 시간: {build_ms:.1f} ms")
+    print(f"💾 원본 크기: {source_size / 1024:.1f} KB → 색인 크기: {index_size / 1024:.1f} KB")
+    print(f"📁 저장 위치: {index_file}")
+
+    # 검색 지연 시간 확인
+    index = load_index(index_file)
+    sample_queries = [('Constitution', 'en'), ('헌법', 'ko'), ('宪法', 'zh'), ('constitucion', 'es'),
+                      ('Hiến pháp', 'vi'), ('दस्तूर', 'hi'), ('الدستور', 'ar'), ('Bill of Rights', None)]
+    rounds = 50
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query, lang in sample_queries:
+            search(index, query, lang)
+    per_query_ms = (time.perf_counter() - start) * 1000 / (rounds * len(sample_queries))
+    print(f"⏱️  평균 검색 시간: {per_query_ms:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZIP → 주 전체 조회 테이블 생성
+- 로컬 참조 파일 data/zip_prefix_states.csv (zip,state,note)
+    3자리 접두어('005'), 접두어 구간('010-027'), 5자리 ZIP('06390'), 5자리 구간('96950-96952')
+  5자리 행은 ZCTA 목록처럼 쓸 수 있음: 접두어 행이 없는 접두어는 그 접두어 5자리 행의 다수 주로 정함
+- us_political_data.json의 zipToState.exactMappings와 us_representatives.json의 선거구(주 접두어)로 대조,
+  접두어 주와 다르면 5자리 예외로 추가
+- data/bundles/zip_states.min.json:
+    {"version": 1, "unassigned": "--", "prefixes": "<접두어 000~999 × 주 코드 2글자>", "exceptions": {"06390": "NY", ...}}
+  조회: exceptions[zip] → prefixes[접두어 × 2 : 접두어 × 2 + 2] (둘 다 O(1), 네트워크 없음)
+  → locationManager.getStateFromZipCode의 첫 자리 후보 목록(최대 7개 주)을 대체
+
+사용법:
+  python build_zip_state_table.py              # 생성 + 검증
+  python build_zip_state_table.py --benchmark  # 조회 벤치마크 포함
+"""
+
+import csv
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from canonical_json import dumps, write_json
+
+TABLE_VERSION = 1
+PREFIX_COUNT = 1000
+UNASSIGNED = '--'
+
+
+def parse_zip_field(text):
+    """'005' / '010-027' / '06390' / '96950-96952' → (자릿수, 시작, 끝)"""
+    start, _, end = text.strip().partition('-')
+    end = end or start
+    if len(start) not in (3, 5) or len(start) != len(end) or not (start.isdigit() and end.isdigit()):
+        raise ValueError(f"ZIP 형식 오류: '{text}'")
+    if int(start) > int(end):
+        raise ValueError(f"ZIP 구간 순서 오류: '{text}'")
+    return len(start), int(start), int(end)
+
+
+def load_reference(reference_file):
+    """참조 CSV → ({접두어: 주}, {5자리 ZIP: 주}) (같은 칸에 다른 주가 두 번 나오면 ValueError)"""
+    prefixes = {}
+    zips = {}
+    with open(reference_file, 'r', encoding='utf-8', newline='') as f:
+        for line_number, row in enumerate(csv.DictReader(f), 2):
+            state = row['state'].strip().upper()
+            if len(state) != 2 or not state.isalpha():
+                raise ValueError(f"{reference_file.name}:{line_number}: 주 코드 오류 '{row['state']}'")
+            digits, start, end = parse_zip_field(row['zip'])
+            target = prefixes if digits == 3 else zips
+            for key in range(start, end + 1):
+                if target.get(key, state) != state:
+                    raise ValueError(f"{reference_file.name}:{line_number}: {key:0{digits}d}이(가) "
+                                     f"{target[key]}와 {state}에 중복 지정됨")
+                target[key] = state
+    return prefixes, zips
+
+
+def load_evidence(data_dir):
+    """앱 데이터에 이미 있는 ZIP → 주 ({ZIP: 주}, 선거구가 여러 주에 걸친 ZIP은 제외)"""
+    with open(data_dir / 'us_political_data.json', 'r', encoding='utf-8') as f:
+        evidence = {int(z): s for z, s in json.load(f)['zipToState'].get('exactMappings', {}).items()}
+    with open(data_dir / 'us_representatives.json', 'r', encoding='utf-8') as f:
+        districts = json.load(f)['zipToDistrict']['mappings']
+    for zip_code, value in districts.items():
+        states = {d.split('-')[0] for d in (value if isinstance(value, list) else [value])}
+        if len(states) == 1:
+            evidence.setdefault(int(zip_code), states.pop())
+    return evidence
+
+
+def build_table(prefixes, zips, evidence):
+    """접두어 문자열 + 5자리 예외 → 테이블, 앱 데이터와 달라서 예외로 추가한 ZIP 목록"""
+    prefix_states = dict(prefixes)
+    majority = {}
+    for zip_code, state in zips.items():
+        majority.setdefault(zip_code // 100, Counter())[state] += 1
+    for prefix, counts in majority.items():
+        if prefix not in prefix_states:
+            prefix_states[prefix] = counts.most_common(1)[0][0]
+
+    exceptions = {z: s for z, s in zips.items() if prefix_states.get(z // 100) != s}
+    added = []
+    for zip_code, state in sorted(evidence.items()):
+        if zip_code in zips:
+            continue
+        if prefix_states.get(zip_code // 100) != state:
+            exceptions[zip_code] = state
+            added.append(zip_code)
+
+    table = {
+        'version': TABLE_VERSION,
+        'unassigned': UNASSIGNED,
+        'prefixes': ''.join(prefix_states.get(p, UNASSIGNED) for p in range(PREFIX_COUNT)),
+        'exceptions': {f'{z:05d}': s for z, s in sorted(exceptions.items())},
+    }
+    return table, added
+
+
+def state_for_zip(table, zip_code):
+    """'10001' → 'NY' (5자리 문자열, 지정되지 않은 접두어면 None)"""
+    state = table['exceptions'].get(zip_code)
+    if state is None:
+        offset = int(zip_code[:3]) * 2
+        state = table['prefixes'][offset:offset + 2]
+    return None if state == table['unassigned'] else state
+
+
+def verify(table, prefixes, zips, evidence):
+    """참조 파일과 앱 데이터의 모든 항목이 테이블에서 같은 주로 조회되는지 확인"""
+    errors = []
+    if len(table['prefixes']) != PREFIX_COUNT * 2:
+        errors.append(f"접두어 문자열 길이 {len(table['prefixes'])} ≠ {PREFIX_COUNT * 2}")
+    for prefix, state in prefixes.items():
+        for zip_code in (prefix * 100, prefix * 100 + 99):
+            if zip_code in zips or zip_code in evidence:
+                continue
+            found = state_for_zip(table, f'{zip_code:05d}')
+            if found != state:
+                errors.append(f"접두어 {prefix:03d}: {zip_code:05d} → {found} (기대 {state})")
+    for source, mapping in (('참조 5자리', zips), ('앱 데이터', evidence)):
+        for zip_code, state in mapping.items():
+            found = state_for_zip(table, f'{zip_code:05d}')
+            if found != state:
+                errors.append(f"{source} {zip_code:05d} → {found} (기대 {state})")
+    return errors
+
+
+def first_digit_candidates(zip_code, exact_mappings):
+    """기존 locationManager.getStateFromZipCode의 방식 (벤치마크 비교용)"""
+    if zip_code in exact_mappings:
+        return [exact_mappings[zip_code]]
+    return FIRST_DIGIT_STATES[zip_code[0]]
+
+
+FIRST_DIGIT_STATES = {
+    '0': ['CT', 'MA', 'ME', 'NH', 'NJ', 'RI', 'VT'],
+    '1': ['DE', 'NY', 'PA'],
+    '2': ['MD', 'NC', 'SC', 'VA', 'WV', 'DC'],
+    '3': ['AL', 'FL', 'GA', 'MS', 'TN'],
+    '4': ['IN', 'KY', 'MI', 'OH'],
+    '5': ['IA', 'MN', 'MT', 'ND', 'SD', 'WI'],
+    '6': ['IL', 'KS', 'MO', 'NE'],
+    '7': ['AR', 'LA', 'OK', 'TX'],
+    '8': ['AZ', 'CO', 'ID', 'NM', 'NV', 'UT', 'WY'],
+    '9': ['AK', 'CA', 'HI', 'OR', 'WA'],
+}
+
+
+def benchmark(table, exact_mappings):
+    probes = [f'{n:05d}' for n in range(100000)]
+    lookups = {}
+
+    for _ in range(2):
+        start = time.perf_counter()
+        for zip_code in probes:
+            state_for_zip(table, zip_code)
+        lookups['table'] = (time.perf_counter() - start) * 1e9 / len(probes)
+
+    full = {z: state_for_zip(table, z) for z in probes}
+    full = {z: s for z, s in full.items() if s}
+    start = time.perf_counter()
+    for zip_code in probes:
+        full.get(zip_code)
+    lookups['dict'] = (time.perf_counter() - start) * 1e9 / len(probes)
+
+    unique_before = sum(1 for z in probes if len(first_digit_candidates(z, exact_mappings)) == 1)
+    print(f"\n⏱️  조회 {len(probes):,}개 (ZIP당): 테이블 {lookups['table']:.0f} ns, "
+          f"5자리 전체 딕셔너리 {lookups['dict']:.0f} ns")
+    print(f"📦 크기: 테이블 {len(dumps(table, pretty=False).encode('utf-8')):,} B, "
+          f"5자리 전체 딕셔너리 {len(dumps(full, pretty=False).encode('utf-8')):,} B")
+    print(f"🎯 주 하나로 정해지는 ZIP: 기존 첫 자리 방식 {unique_before:,}개 → 테이블 {len(full):,}개")
+
+
+def main():
+    print("=" * 60)
+    print("📮 ZIP → 주 조회 테이블 생성")
+    print("=" * 60)
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    reference_file = data_dir / 'zip_prefix_states.csv'
+
+    prefixes, zips = load_reference(reference_file)
+    evidence = load_evidence(data_dir)
+    print(f"📂 {reference_file.name}: 접두어 {len(prefixes)}개, 5자리 {len(zips)}개")
+    print(f"📂 앱 데이터 ZIP → 주: {len(evidence)}개")
+
+    table, added = build_table(prefixes, zips, evidence)
+    assigned = sum(1 for p in range(PREFIX_COUNT) if table['prefixes'][p * 2:p * 2 + 2] != UNASSIGNED)
+    print(f"🗺️  접두어 {assigned}/{PREFIX_COUNT}개 지정 (나머지는 USPS 미사용), 5자리 예외 {len(table['exceptions'])}개")
+    for zip_code in added:
+        offset = zip_code // 100 * 2
+        print(f"  ⚠️  {zip_code:05d}: 앱 데이터 {evidence[zip_code]} ≠ 접두어 {table['prefixes'][offset:offset + 2]} → 예외로 추가")
+
+    errors = verify(table, prefixes, zips, evidence)
+    if errors:
+        print(f"\n❌ 검증 실패 {len(errors)}건:")
+        for error in errors[:10]:
+            print(f"  • {error}")
+        sys.exit(1)
+    print("✅ 검증: 참조 파일과 앱 데이터의 모든 ZIP이 테이블에서 같은 주로 조회됨")
+
+    output_file = data_dir / 'bundles' / 'zip_states.min.json'
+    result = write_json(output_file, table, pretty=False, schema=False)
+    print(f"\n💾 {output_file.name}: {result['bytes']:,} B")
+
+    if '--benchmark' in sys.argv[1:]:
+        with open(data_dir / 'us_political_data.json', 'r', encoding='utf-8') as f:
+            exact_mappings = json.load(f)['zipToState'].get('exactMappings', {})
+        benchmark(table, exact_mappings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+data/ 에 쓰는 모든 스크립트가 공유하는 표준(canonical) JSON 직렬화
+- 키 순서: 콘텐츠 스키마 우선순위(id, category, question, text, rationale ...) 다음
+  나머지 키는 기존 순서 유지 (sort_keys=True면 나머지 키를 정렬)
+  locales/*.json 같은 UI 문자열 파일은 schema=False로 기존 순서를 그대로 유지
+- pretty 모드: indent=2, ensure_ascii=False, 파일 끝 줄바꿈 없음 (현재 data/ 파일과 동일)
+- compact 모드: 공백 없는 구분자 (앱 번들 / 빌드 산출물)
+- NaN/Infinity 거부, 실수는 repr 기반으로 항상 같은 표현
+- 큰 리스트는 항목 단위로 인코딩하여 전체 문자열을 메모리에 만들지 않고 기록
+- 기록한 바이트의 SHA-256을 반환하여 캐시 / 델타 업데이트 키로 사용
+
+사용법:
+  python canonical_json.py [파일 ...]   # 파일이 표준 형식인지 검사 (기본: data/*.json, locales/*.json)
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# 콘텐츠 스키마 키 우선순위 (목록에 없는 키는 그 뒤에 기존 순서대로)
+KEY_PRIORITY = [
+    'id', 'q_id', 'chapterId', 'type', 'category', 'subcategory', 'question', 'text',
+    'title', 'introduction', 'translations', 'correctAnswers', 'wrongAnswers',
+    'rationale', 'sections',
+]
+KEY_RANK = {key: rank for rank, key in enumerate(KEY_PRIORITY)}
+
+PRETTY_INDENT = 2
+
+
+def canonicalize(data, sort_keys=False, schema=True):
+    """딕셔너리 키를 표준 순서로 재배열한 복사본"""
+    if isinstance(data, dict):
+        rank = KEY_RANK if schema else {}
+        ranked = [key for key in data if key in rank]
+        ranked.sort(key=rank.__getitem__)
+        rest = [key for key in data if key not in rank]
+        if sort_keys:
+            rest.sort()
+        return {key: canonicalize(data[key], sort_keys, schema) for key in ranked + rest}
+    if isinstance(data, list):
+        return [canonicalize(item, sort_keys, schema) for item in data]
+    return data
+
+
+def _encoder(pretty):
+    if pretty:
+        return json.JSONEncoder(ensure_ascii=False, indent=PRETTY_INDENT, allow_nan=False)
+    return json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), allow_nan=False)
+
+
+def dumps(data, pretty=True, sort_keys=False, schema=True):
+    """표준 JSON 문자열"""
+    return _encoder(pretty).encode(canonicalize(data, sort_keys, schema))
+
+
+def content_hash(data):
+    """내용 해시 (compact 표준 형식의 SHA-256) — 들여쓰기와 무관"""
+    return hashlib.sha256(dumps(data, pretty=False).encode('utf-8')).hexdigest()
+
+
+class _HashingWriter:
+    """기록하는 바이트의 SHA-256과 크기를 함께 계산"""
+
+    def __init__(self, fp):
+        self.fp = fp
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, text):
+        chunk = text.encode('utf-8')
+        self.sha256.update(chunk)
+        self.size += len(chunk)
+        self.fp.write(chunk)
+
+
+def _iter_chunks(data, pretty, sort_keys, schema):
+    """
+    표준 JSON 조각 생성
+    최상위가 리스트면 항목 하나씩 표준화 / 인코딩하여 전체 복사본을 만들지 않음
+    """
+    encoder = _encoder(pretty)
+
+    if not isinstance(data, (list, tuple)) and not hasattr(data, '__next__'):
+        yield from encoder.iterencode(canonicalize(data, sort_keys, schema))
+        return
+
+    first = True
+    for item in data:
+        chunk = encoder.encode(canonicalize(item, sort_keys, schema))
+        if pretty:
+            # JSON 문자열 안의 줄바꿈은 \n으로 이스케이프되므로 안전하게 한 단계 들여쓰기 가능
+            chunk = chunk.replace('\n', '\n' + ' ' * PRETTY_INDENT)
+            yield ('[\n  ' if first else ',\n  ') + chunk
+        else:
+            yield ('[' if first else ',') + chunk
+        first = False
+
+    if first:
+        yield '[]'
+    else:
+        yield '\n]' if pretty else ']'
+
+
+@contextmanager
+def atomic_open(path, mode='wb', **kwargs):
+    """
+    임시 파일에 쓰고 성공하면 교체하는 파일 객체
+    중간에 실패해도 기존 파일이 깨지지 않음 (스트리밍 writer도 같은 방식으로 기록)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f'.{path.name}.', dir=path.parent)
+    try:
+        with os.fdopen(fd, mode, **kwargs) as fp:
+            yield fp
+        # mkstemp는 0600으로 만들기 때문에 기존 파일 권한(없으면 0644)을 유지
+        os.chmod(tmp_name, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def write_json(path, data, pretty=True, sort_keys=False, schema=True):
+    """
+    표준 JSON 파일 쓰기
+    - data가 리스트/제너레이터면 항목 단위로 스트리밍 기록
+    - atomic_open으로 임시 파일에 쓴 뒤 교체
+    반환: {'sha256', 'bytes'}
+    """
+    with atomic_open(path) as fp:
+        writer = _HashingWriter(fp)
+        for chunk in _iter_chunks(data, pretty, sort_keys, schema):
+            writer.write(chunk)
+
+    return {'sha256': writer.sha256.hexdigest(), 'bytes': writer.size}
+
+
+def is_canonical(path, pretty=True, schema=True):
+    """파일이 이미 표준 형식인지 확인"""
+    with open(path, 'r', encoding='utf-8') as f:
+        raw = f.read()
+    return dumps(json.loads(raw), pretty=pretty, schema=schema) == raw
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+
+    if len(sys.argv) >= 2:
+        files = [Path(p) for p in sys.argv[1:]]
+    else:
+        files = sorted((project_dir / 'data').glob('*.json')) + sorted((project_dir / 'locales').glob('*.json'))
+
+    print("🔍 표준 JSON 형식 검사")
+    non_canonical = 0
+    for path in files:
+        ok = is_canonical(path, schema=path.parent.name != 'locales')
+        if not ok:
+            non_canonical += 1
+        print(f"  {'✅' if ok else '⚠️ '} {path.relative_to(project_dir) if path.is_absolute() else path}")
+
+    print(f"\n📊 {len(files)}개 중 비표준 {non_canonical}개")
+
+
+if __name__ == "__main__":
+    main()
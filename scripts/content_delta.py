@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+콘텐츠 OTA 업데이트용 델타 번들
+- 두 버전의 콘텐츠 파일(문제 은행 9개, question_story.json, N-400)을 비교하여
+  구조적 패치 생성: 문제는 id, 스토리 챕터는 chapterId, 섹션은 위치로 찾아감
+- 패치 연산: set(값 교체/추가), del(삭제), order(키 리스트 순서 변경)
+- 파일별로 이전/이후 내용 해시(canonical_json.content_hash)를 함께 담아
+  적용 전 기준 버전 확인, 적용 후 결과 확인
+- 번들 형식: MAGIC(4) | version(u16) | SHA-256(zlib 본문)(32) | zlib(본문 JSON)
+
+사용법:
+  python content_delta.py build <이전 버전> [새 버전] [출력 파일]
+      이전/새 버전: 디렉터리 또는 git 리비전 (새 버전 기본값: 현재 data/)
+  python content_delta.py apply <번들> [data 디렉터리] [--write]
+      (--write: 표준 JSON 형식이 아닌 대상 파일이 있으면 기록하지 않음)
+  python content_delta.py benchmark
+"""
+
+import copy
+import hashlib
+import json
+import struct
+import subprocess
+import sys
+import time
+import zlib
+from pathlib import Path
+
+from canonical_json import content_hash, dumps, is_canonical, write_json
+from text_normalize import LANGUAGES
+
+DELTA_MAGIC = b'CTDL'
+DELTA_VERSION = 1
+
+CONTENT_FILES = (
+    [f'interview_questions_{lang}.json' for lang in LANGUAGES]
+    + ['question_story.json', 'n400_questions.json', 'n400_explanations.json']
+)
+
+# 리스트 항목을 식별하는 키 (모든 항목에 있고 값이 겹치지 않을 때만 사용)
+ITEM_KEY_FIELDS = ('id', 'chapterId')
+
+
+class DeltaError(Exception):
+    """번들 손상, 기준 버전 불일치, 적용 결과 불일치"""
+
+
+def _item_key_field(items):
+    """리스트를 키로 찾아갈 수 있으면 키 필드 이름, 아니면 None"""
+    if not items or not all(isinstance(item, dict) for item in items):
+        return None
+    for field in ITEM_KEY_FIELDS:
+        keys = [item.get(field) for item in items]
+        if None not in keys and len(set(keys)) == len(keys):
+            return field
+    return None
+
+
+def diff(old, new, path=None):
+    """
+    두 JSON 값의 구조적 패치 연산 목록
+    경로 구간: 문자열(딕셔너리 키), 정수(리스트 위치), [필드, 값](키로 찾는 리스트 항목)
+    """
+    path = path or []
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = [{'op': 'del', 'path': path + [key]} for key in old if key not in new]
+        for key, value in new.items():
+            if key in old:
+                ops.extend(diff(old[key], value, path + [key]))
+            else:
+                ops.append({'op': 'set', 'path': path + [key], 'value': value})
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        field = _item_key_field(old)
+        if field and _item_key_field(new) == field:
+            old_by_key = {item[field]: item for item in old}
+            new_keys = [item[field] for item in new]
+            new_key_set = set(new_keys)
+            ops = [{'op': 'del', 'path': path + [[field, key]]} for key in old_by_key if key not in new_key_set]
+            for item in new:
+                key = item[field]
+                if key in old_by_key:
+                    ops.extend(diff(old_by_key[key], item, path + [[field, key]]))
+                else:
+                    ops.append({'op': 'set', 'path': path + [[field, key]], 'value': item})
+            surviving = [key for key in old_by_key if key in new_key_set]
+            appended = surviving + [key for key in new_keys if key not in old_by_key]
+            if appended != new_keys:
+                ops.append({'op': 'order', 'path': path, 'field': field, 'keys': new_keys})
+            return ops
+
+        if len(old) == len(new):
+            ops = []
+            for i, (old_item, new_item) in enumerate(zip(old, new)):
+                ops.extend(diff(old_item, new_item, path + [i]))
+            # 절반 이상 바뀌었으면 리스트 통째로 교체하는 편이 작음
+            if len(ops) <= len(new) // 2 + 1:
+                return ops
+
+    return [{'op': 'set', 'path': path, 'value': new}]
+
+
+def _locate(container, segment):
+    """경로 구간 하나에 해당하는 (리스트/딕셔너리, 인덱스/키)"""
+    if isinstance(segment, list):
+        field, key = segment
+        for i, item in enumerate(container):
+            if item.get(field) == key:
+                return i
+        return None
+    return segment
+
+
+def apply_ops(data, ops):
+    """패치 연산을 data에 제자리 적용 (경로가 없으면 DeltaError)"""
+    for op in ops:
+        path = op['path']
+        if not path and op['op'] != 'order':
+            if op['op'] != 'set':
+                raise DeltaError(f"루트에 적용할 수 없는 연산: {op['op']}")
+            data = copy.deepcopy(op['value'])
+            continue
+
+        parent = data
+        try:
+            for segment in path[:-1] if op['op'] != 'order' else path:
+                parent = parent[_locate(parent, segment)]
+        except (KeyError, IndexError, TypeError):
+            raise DeltaError(f"경로를 찾을 수 없음: {path}")
+
+        if op['op'] == 'order':
+            by_key = {item[op['field']]: item for item in parent}
+            parent[:] = [by_key[key] for key in op['keys']]
+            continue
+
+        last = path[-1]
+        index = _locate(parent, last)
+        if op['op'] == 'del':
+            if index is None:
+                raise DeltaError(f"삭제할 항목 없음: {path}")
+            del parent[index]
+        elif index is None:
+            parent.append(copy.deepcopy(op['value']))
+        elif isinstance(parent, list) and index == len(parent):
+            parent.append(copy.deepcopy(op['value']))
+        else:
+            parent[index] = copy.deepcopy(op['value'])
+    return data
+
+
+def build_delta(old_files, new_files):
+    """
+    {파일 이름 → 데이터} 두 벌로 델타 본문 생성
+    새 버전에 없는 파일은 삭제로 기록 (target: None)
+    """
+    files = {}
+    for name in sorted(set(old_files) | set(new_files)):
+        old = old_files.get(name)
+        new = new_files.get(name)
+        if old is not None and new is not None and old == new:
+            continue
+        files[name] = {
+            'base': content_hash(old) if old is not None else None,
+            'target': content_hash(new) if new is not None else None,
+            'ops': diff(old, new) if old is not None and new is not None else (
+                [{'op': 'set', 'path': [], 'value': new}] if new is not None else []
+            ),
+        }
+    return {'format': DELTA_VERSION, 'files': files}
+
+
+def encode_bundle(delta):
+    """델타 본문을 압축 번들 바이트로"""
+    payload = zlib.compress(dumps(delta, pretty=False, schema=False).encode('utf-8'), 9)
+    return DELTA_MAGIC + struct.pack('<H', DELTA_VERSION) + hashlib.sha256(payload).digest() + payload
+
+
+def decode_bundle(raw):
+    """번들 바이트 검증 후 델타 본문 반환"""
+    if raw[:4] != DELTA_MAGIC:
+        raise DeltaError("델타 번들이 아님")
+    (version,) = struct.unpack_from('<H', raw, 4)
+    if version != DELTA_VERSION:
+        raise DeltaError(f"지원하지 않는 델타 버전: {version}")
+    digest = raw[6:38]
+    payload = raw[38:]
+    if hashlib.sha256(payload).digest() != digest:
+        raise DeltaError("번들 무결성 해시 불일치")
+    return json.loads(zlib.decompress(payload).decode('utf-8'))
+
+
+def apply_delta(delta, files):
+    """
+    {파일 이름 → 데이터}에 델타 적용 후 결과 반환 (입력은 변경하지 않음)
+    - 적용 전: 현재 내용 해시가 base와 같은지 확인
+    - 적용 후: 결과 해시가 target과 같은지 확인
+    """
+    result = dict(files)
+    for name, entry in delta['files'].items():
+        current = files.get(name)
+        current_hash = content_hash(current) if current is not None else None
+        if current_hash != entry['base']:
+            raise DeltaError(f"{name}: 기준 버전이 다름")
+
+        if entry['target'] is None:
+            result.pop(name, None)
+            continue
+
+        updated = apply_ops(copy.deepcopy(current), entry['ops'])
+        if content_hash(updated) != entry['target']:
+            raise DeltaError(f"{name}: 적용 결과가 대상 버전과 다름")
+        result[name] = updated
+    return result
+
+
+def _git_root():
+    output = subprocess.run(['git', 'rev-parse', '--show-toplevel'], capture_output=True, text=True,
+                            cwd=Path(__file__).parent, check=True).stdout
+    return Path(output.strip())
+
+
+def load_version(source, data_dir):
+    """디렉터리 또는 git 리비전에서 콘텐츠 파일 로드"""
+    files = {}
+    source_dir = Path(source)
+    if source_dir.is_dir():
+        for name in CONTENT_FILES:
+            if (source_dir / name).exists():
+                with open(source_dir / name, 'r', encoding='utf-8') as f:
+                    files[name] = json.load(f)
+        return files
+
+    root = _git_root()
+    prefix = data_dir.resolve().relative_to(root).as_posix()
+    for name in CONTENT_FILES:
+        shown = subprocess.run(['git', 'show', f'{source}:{prefix}/{name}'], capture_output=True, cwd=root)
+        if shown.returncode == 0:
+            files[name] = json.loads(shown.stdout.decode('utf-8'))
+    if not files:
+        raise DeltaError(f"디렉터리도 git 리비전도 아님: {source}")
+    return files
+
+
+def full_sizes(files, names):
+    """변경된 파일을 통째로 보낼 때의 크기 (원본 / zlib)"""
+    raw = b''.join(dumps(files[name]).encode('utf-8') for name in names if name in files)
+    return len(raw), len(zlib.compress(raw, 9))
+
+
+def print_report(delta, bundle, new_files, build_ms):
+    changed = list(delta['files'])
+    raw_size, compressed_size = full_sizes(new_files, changed)
+    print(f"\n📊 변경된 파일 {len(changed)}개")
+    for name, entry in delta['files'].items():
+        print(f"  • {name}: 연산 {len(entry['ops'])}개")
+    print(f"  • 전체 파일 전송: {raw_size:,} B (zlib {compressed_size:,} B)")
+    print(f"  • 델타 번들: {len(bundle):,} B")
+    print(f"  • 생성 시간: {build_ms:.1f} ms")
+
+
+def sample_edits(files):
+    """벤치마크용 콘텐츠 수정 (답 하나, 해설, 오답, 스토리 문장, 새 문제)"""
+    edited = copy.deepcopy(files)
+
+    en = edited['interview_questions_en.json']
+    en[11]['correctAnswers'][0]['rationale'] += " (updated)"
+    ko = edited['interview_questions_ko.json']
+    ko[4]['wrongAnswers'][0]['text'] = "수정된 오답"
+    es = edited['interview_questions_es.json']
+    es.append({**copy.deepcopy(es[-1]), 'id': len(es) + 1})
+
+    story = edited['question_story.json']['civicsStory']
+    section = story[1]['sections'][0]
+    section['content_en'][0]['text'] = section['content_en'][0]['text'].rstrip() + " Updated."
+    return edited
+
+
+def benchmark(data_dir):
+    """실제 콘텐츠에 작은 수정을 가해 델타 크기 / 생성 / 적용 시간 측정"""
+    old_files = load_version(data_dir, data_dir)
+    new_files = sample_edits(old_files)
+
+    start = time.perf_counter()
+    delta = build_delta(old_files, new_files)
+    bundle = encode_bundle(delta)
+    build_ms = (time.perf_counter() - start) * 1000
+    print_report(delta, bundle, new_files, build_ms)
+
+    rounds = 5
+    start = time.perf_counter()
+    for _ in range(rounds):
+        applied = apply_delta(decode_bundle(bundle), old_files)
+    apply_ms = (time.perf_counter() - start) * 1000 / rounds
+    ok = all(content_hash(applied.get(name)) == content_hash(new_files.get(name)) for name in new_files)
+    print(f"  • 적용 + 검증: {apply_ms:.1f} ms — {'✅ 일치' if ok else '❌ 불일치'}")
+
+    try:
+        apply_delta(delta, new_files)
+        print("  ❌ 이미 적용된 파일에 다시 적용됨")
+    except DeltaError as e:
+        print(f"  ✅ 기준 버전 확인: {e}")
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+
+    print("=" * 60)
+    print("🎯 콘텐츠 델타 번들")
+    print("=" * 60)
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ('build', 'apply', 'benchmark'):
+        print(__doc__)
+        sys.exit(1)
+
+    command = sys.argv[1]
+    if command == 'benchmark':
+        benchmark(data_dir)
+        return
+
+    if command == 'build':
+        if len(sys.argv) < 3:
+            print("이전 버전(디렉터리 또는 git 리비전)을 지정하세요")
+            sys.exit(1)
+        old_files = load_version(sys.argv[2], data_dir)
+        new_files = load_version(sys.argv[3] if len(sys.argv) >= 4 else data_dir, data_dir)
+        output_file = Path(sys.argv[4]) if len(sys.argv) >= 5 else data_dir / 'build' / 'content_delta.ctdl'
+
+        start = time.perf_counter()
+        delta = build_delta(old_files, new_files)
+        bundle = encode_bundle(delta)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'wb') as f:
+            f.write(bundle)
+        print_report(delta, bundle, new_files, build_ms)
+        print(f"💾 저장됨: {output_file}")
+        return
+
+    args = [a for a in sys.argv[2:] if a != '--write']
+    if not args:
+        print("번들 파일을 지정하세요")
+        sys.exit(1)
+    target_dir = Path(args[1]) if len(args) >= 2 else data_dir
+    with open(args[0], 'rb') as f:
+        delta = decode_bundle(f.read())
+
+    files = load_version(target_dir, target_dir)
+    try:
+        updated = apply_delta(delta, files)
+    except DeltaError as e:
+        print(f"❌ 적용 실패: {e}")
+        sys.exit(1)
+    print(f"✅ {len(delta['files'])}개 파일 적용 및 검증 완료")
+
+    if '--write' in sys.argv:
+        # 손으로 서식을 맞춘 파일(n400_*.json 등)은 write_json이 서식을 바꾸므로 아무것도 기록하지 않음
+        non_canonical = [name for name in delta['files']
+                         if name in updated and (target_dir / name).exists() and not is_canonical(target_dir / name)]
+        if non_canonical:
+            print(f"❌ 표준 JSON 형식이 아니라서 기록하면 서식이 바뀜: {', '.join(non_canonical)}"
+                  " (canonical_json.py로 확인)")
+            sys.exit(1)
+        for name in delta['files']:
+            if name in updated:
+                write_json(target_dir / name, updated[name])
+            elif (target_dir / name).exists():
+                (target_dir / name).unlink()
+        print(f"💾 저장됨: {target_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,578 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite 콘텐츠 저장소
+- 문제 은행 9개, question_story.json, N-400 질문/해설을 정규화된 테이블로 저장
+  (문제 / 정답+해설 / 오답 / 스토리 챕터·번역·섹션·본문 / N-400), 키는 (id, lang)
+- 대량 upsert: 스크립트가 파일 전체를 다시 쓰지 않고 바뀐 문제/섹션만 갱신
+- FTS5 색인 (외부 콘텐츠 테이블 + 트리거로 upsert와 함께 자동 갱신)
+- 내보내기: 저장소에서 현재 JSON 파일을 바이트 단위로 동일하게 재생성
+  (원본이 수작업 포맷이라 표준 형식으로 재현되지 않는 파일은 내용 일치만 확인)
+
+사용법:
+  python content_store.py ingest               # data/*.json → data/build/content.sqlite
+  python content_store.py verify               # 내보낸 결과와 data/ 파일 비교
+  python content_store.py export <출력 디렉터리>
+  python content_store.py search "검색어" [lang]
+"""
+
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from canonical_json import dumps
+from text_normalize import LANGUAGES
+
+QUESTION_FILE = 'interview_questions_{lang}.json'
+STORY_FILE = 'question_story.json'
+N400_QUESTIONS_FILE = 'n400_questions.json'
+N400_EXPLANATIONS_FILE = 'n400_explanations.json'
+
+QUESTION_KEYS = ['id', 'category', 'subcategory', 'question', 'correctAnswers', 'wrongAnswers']
+STORY_CONTENT_PREFIX = 'content_'
+N400_QUESTION_PREFIX = 'question_'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    lang TEXT,
+    layout TEXT NOT NULL,
+    trailing_newline INTEGER NOT NULL DEFAULT 0,
+    exact INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER NOT NULL,
+    lang TEXT NOT NULL,
+    category TEXT,
+    subcategory TEXT,
+    question TEXT,
+    PRIMARY KEY (id, lang)
+);
+
+CREATE TABLE IF NOT EXISTS answers (
+    question_id INTEGER NOT NULL,
+    lang TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT,
+    rationale TEXT,
+    PRIMARY KEY (question_id, lang, position)
+);
+
+CREATE TABLE IF NOT EXISTS wrong_answers (
+    question_id INTEGER NOT NULL,
+    lang TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT,
+    rationale TEXT,
+    PRIMARY KEY (question_id, lang, position)
+);
+
+CREATE TABLE IF NOT EXISTS story_chapters (
+    chapter_id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    layout TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS story_translations (
+    chapter_id INTEGER NOT NULL,
+    lang TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT,
+    introduction TEXT,
+    PRIMARY KEY (chapter_id, lang)
+);
+
+CREATE TABLE IF NOT EXISTS story_sections (
+    chapter_id INTEGER NOT NULL,
+    section_index INTEGER NOT NULL,
+    linked_questions TEXT,
+    layout TEXT NOT NULL,
+    PRIMARY KEY (chapter_id, section_index)
+);
+
+CREATE TABLE IF NOT EXISTS story_content (
+    chapter_id INTEGER NOT NULL,
+    section_index INTEGER NOT NULL,
+    lang TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    type TEXT,
+    text TEXT,
+    PRIMARY KEY (chapter_id, section_index, lang, position)
+);
+
+CREATE TABLE IF NOT EXISTS n400_items (
+    id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    q_id TEXT,
+    category TEXT,
+    layout TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS n400_questions (
+    id INTEGER NOT NULL,
+    lang TEXT NOT NULL,
+    question TEXT,
+    PRIMARY KEY (id, lang)
+);
+
+CREATE TABLE IF NOT EXISTS n400_explanations (
+    key TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    key_position INTEGER NOT NULL,
+    lang_position INTEGER NOT NULL,
+    title TEXT,
+    intent TEXT,
+    answer_guidance TEXT,
+    PRIMARY KEY (key, lang)
+);
+"""
+
+# FTS5 색인 대상: 테이블 → (텍스트 컬럼, 결과에 표시할 키 컬럼)
+FTS_TABLES = {
+    'questions': (['question'], ['id', 'lang']),
+    'answers': (['text', 'rationale'], ['question_id', 'lang']),
+    'wrong_answers': (['text'], ['question_id', 'lang']),
+    'story_translations': (['title', 'introduction'], ['chapter_id', 'lang']),
+    'story_content': (['text'], ['chapter_id', 'section_index', 'lang']),
+    'n400_questions': (['question'], ['id', 'lang']),
+    'n400_explanations': (['intent', 'answer_guidance'], ['key', 'lang']),
+}
+
+
+def _fts_schema():
+    """외부 콘텐츠 FTS5 테이블과 동기화 트리거"""
+    statements = []
+    for table, (columns, _) in FTS_TABLES.items():
+        fts = f'{table}_fts'
+        column_list = ', '.join(columns)
+        new_values = ', '.join(f'new.{c}' for c in columns)
+        old_values = ', '.join(f'old.{c}' for c in columns)
+        statements.append(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({column_list}, content='{table}', "
+            f"content_rowid='rowid', tokenize='unicode61 remove_diacritics 2');"
+        )
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.rowid, {new_values}); END;"
+        )
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values}); END;"
+        )
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values}); "
+            f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.rowid, {new_values}); END;"
+        )
+    return '\n'.join(statements)
+
+
+def connect(db_file):
+    """저장소 열기 (없으면 스키마 생성)"""
+    db_file = Path(db_file)
+    db_file.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_file)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.executescript(SCHEMA)
+    conn.executescript(_fts_schema())
+    return conn
+
+
+# ---------------------------------------------------------------- upsert
+
+def upsert_questions(conn, lang, questions):
+    """
+    문제 여러 개를 한 트랜잭션으로 upsert
+    정답/오답은 문제 단위로 통째로 교체 (개수가 바뀌어도 남는 행 없음)
+    """
+    questions = list(questions)
+    for q in questions:
+        unknown = set(q) - set(QUESTION_KEYS)
+        if unknown:
+            raise ValueError(f"[{lang}] Q.{q.get('id')}: 지원하지 않는 필드 {sorted(unknown)}")
+
+    with conn:
+        conn.executemany(
+            "INSERT INTO questions (id, lang, category, subcategory, question) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (id, lang) DO UPDATE SET category = excluded.category, "
+            "subcategory = excluded.subcategory, question = excluded.question",
+            [(q['id'], lang, q.get('category'), q.get('subcategory'), q.get('question')) for q in questions],
+        )
+        ids = [(q['id'], lang) for q in questions]
+        conn.executemany("DELETE FROM answers WHERE question_id = ? AND lang = ?", ids)
+        conn.executemany("DELETE FROM wrong_answers WHERE question_id = ? AND lang = ?", ids)
+        conn.executemany(
+            "INSERT INTO answers (question_id, lang, position, text, rationale) VALUES (?, ?, ?, ?, ?)",
+            [(q['id'], lang, i, a.get('text'), a.get('rationale'))
+             for q in questions for i, a in enumerate(q.get('correctAnswers', []))],
+        )
+        conn.executemany(
+            "INSERT INTO wrong_answers (question_id, lang, position, text, rationale) VALUES (?, ?, ?, ?, ?)",
+            [(q['id'], lang, i, a.get('text'), a.get('rationale'))
+             for q in questions for i, a in enumerate(q.get('wrongAnswers', []))],
+        )
+
+
+def delete_questions(conn, lang, question_ids):
+    """문제 삭제 (정답/오답 포함)"""
+    ids = [(qid, lang) for qid in question_ids]
+    with conn:
+        conn.executemany("DELETE FROM questions WHERE id = ? AND lang = ?", ids)
+        conn.executemany("DELETE FROM answers WHERE question_id = ? AND lang = ?", ids)
+        conn.executemany("DELETE FROM wrong_answers WHERE question_id = ? AND lang = ?", ids)
+
+
+def upsert_story_section(conn, chapter_id, section_index, section):
+    """스토리 섹션 하나 upsert (본문은 섹션 단위로 교체)"""
+    with conn:
+        _write_section(conn, chapter_id, section_index, section)
+
+
+def _write_section(conn, chapter_id, section_index, section):
+    linked = section.get('linkedQuestions')
+    conn.execute(
+        "INSERT INTO story_sections (chapter_id, section_index, linked_questions, layout) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT (chapter_id, section_index) DO UPDATE SET "
+        "linked_questions = excluded.linked_questions, layout = excluded.layout",
+        (chapter_id, section_index, json.dumps(linked) if linked is not None else None, json.dumps(list(section))),
+    )
+    conn.execute("DELETE FROM story_content WHERE chapter_id = ? AND section_index = ?", (chapter_id, section_index))
+    rows = []
+    for key, value in section.items():
+        if key == 'linkedQuestions':
+            continue
+        if not key.startswith(STORY_CONTENT_PREFIX):
+            raise ValueError(f"챕터 {chapter_id} 섹션 {section_index}: 지원하지 않는 필드 {key}")
+        lang = key[len(STORY_CONTENT_PREFIX):]
+        rows.extend((chapter_id, section_index, lang, i, item.get('type'), item.get('text'))
+                    for i, item in enumerate(value))
+    conn.executemany(
+        "INSERT INTO story_content (chapter_id, section_index, lang, position, type, text) VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def replace_story(conn, story):
+    """question_story.json 전체를 저장소에 기록"""
+    if list(story) != ['civicsStory']:
+        raise ValueError(f"스토리 최상위 키가 예상과 다름: {list(story)}")
+
+    with conn:
+        for table in ('story_chapters', 'story_translations', 'story_sections', 'story_content'):
+            conn.execute(f"DELETE FROM {table}")
+        for position, chapter in enumerate(story['civicsStory']):
+            chapter_id = chapter['chapterId']
+            conn.execute("INSERT INTO story_chapters (chapter_id, position, layout) VALUES (?, ?, ?)",
+                         (chapter_id, position, json.dumps(list(chapter))))
+            conn.executemany(
+                "INSERT INTO story_translations (chapter_id, lang, position, title, introduction) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(chapter_id, lang, i, t.get('title'), t.get('introduction'))
+                 for i, (lang, t) in enumerate(chapter.get('translations', {}).items())],
+            )
+            for section_index, section in enumerate(chapter.get('sections', [])):
+                _write_section(conn, chapter_id, section_index, section)
+
+
+def replace_n400(conn, questions, explanations):
+    """N-400 질문 / 해설 전체를 저장소에 기록"""
+    with conn:
+        for table in ('n400_items', 'n400_questions', 'n400_explanations'):
+            conn.execute(f"DELETE FROM {table}")
+        for position, item in enumerate(questions):
+            conn.execute("INSERT INTO n400_items (id, position, q_id, category, layout) VALUES (?, ?, ?, ?, ?)",
+                         (item['id'], position, item.get('q_id'), item.get('category'), json.dumps(list(item))))
+            conn.executemany(
+                "INSERT INTO n400_questions (id, lang, question) VALUES (?, ?, ?)",
+                [(item['id'], key[len(N400_QUESTION_PREFIX):], value)
+                 for key, value in item.items() if key.startswith(N400_QUESTION_PREFIX)],
+            )
+        conn.executemany(
+            "INSERT INTO n400_explanations (key, lang, key_position, lang_position, title, intent, answer_guidance) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(key, lang, key_position, lang_position, e.get('title'), e.get('intent'), e.get('answer_guidance'))
+             for key_position, (key, by_lang) in enumerate(explanations.items())
+             for lang_position, (lang, e) in enumerate(by_lang.items())],
+        )
+
+
+# ---------------------------------------------------------------- export
+
+def export_questions(conn, lang):
+    """문제 은행 하나를 원래 JSON 구조로"""
+    answers = {}
+    for qid, text, rationale in conn.execute(
+            "SELECT question_id, text, rationale FROM answers WHERE lang = ? ORDER BY question_id, position", (lang,)):
+        answer = {'text': text}
+        if rationale is not None:
+            answer['rationale'] = rationale
+        answers.setdefault(qid, []).append(answer)
+
+    wrong = {}
+    for qid, text, rationale in conn.execute(
+            "SELECT question_id, text, rationale FROM wrong_answers WHERE lang = ? ORDER BY question_id, position",
+            (lang,)):
+        answer = {'text': text}
+        if rationale is not None:
+            answer['rationale'] = rationale
+        wrong.setdefault(qid, []).append(answer)
+
+    return [
+        {
+            'id': qid,
+            'category': category,
+            'subcategory': subcategory,
+            'question': question,
+            'correctAnswers': answers.get(qid, []),
+            'wrongAnswers': wrong.get(qid, []),
+        }
+        for qid, category, subcategory, question in conn.execute(
+            "SELECT id, category, subcategory, question FROM questions WHERE lang = ? ORDER BY id", (lang,))
+    ]
+
+
+def export_story(conn):
+    """question_story.json 구조로"""
+    translations = {}
+    for chapter_id, lang, title, introduction in conn.execute(
+            "SELECT chapter_id, lang, title, introduction FROM story_translations ORDER BY chapter_id, position"):
+        translations.setdefault(chapter_id, {})[lang] = {'title': title, 'introduction': introduction}
+
+    content = {}
+    for chapter_id, section_index, lang, item_type, text in conn.execute(
+            "SELECT chapter_id, section_index, lang, type, text FROM story_content "
+            "ORDER BY chapter_id, section_index, lang, position"):
+        content.setdefault((chapter_id, section_index, lang), []).append({'type': item_type, 'text': text})
+
+    sections = {}
+    for chapter_id, section_index, linked, layout in conn.execute(
+            "SELECT chapter_id, section_index, linked_questions, layout FROM story_sections "
+            "ORDER BY chapter_id, section_index"):
+        section = {}
+        for key in json.loads(layout):
+            if key == 'linkedQuestions':
+                section[key] = json.loads(linked) if linked is not None else None
+            else:
+                section[key] = content.get((chapter_id, section_index, key[len(STORY_CONTENT_PREFIX):]), [])
+        sections.setdefault(chapter_id, []).append(section)
+
+    chapters = []
+    for chapter_id, layout in conn.execute("SELECT chapter_id, layout FROM story_chapters ORDER BY position"):
+        values = {
+            'chapterId': chapter_id,
+            'translations': translations.get(chapter_id, {}),
+            'sections': sections.get(chapter_id, []),
+        }
+        chapters.append({key: values[key] for key in json.loads(layout)})
+    return {'civicsStory': chapters}
+
+
+def export_n400_questions(conn):
+    texts = {}
+    for item_id, lang, question in conn.execute("SELECT id, lang, question FROM n400_questions"):
+        texts[(item_id, f'{N400_QUESTION_PREFIX}{lang}')] = question
+
+    items = []
+    for item_id, q_id, category, layout in conn.execute(
+            "SELECT id, q_id, category, layout FROM n400_items ORDER BY position"):
+        values = {'id': item_id, 'q_id': q_id, 'category': category}
+        items.append({key: values[key] if key in values else texts.get((item_id, key)) for key in json.loads(layout)})
+    return items
+
+
+def export_n400_explanations(conn):
+    explanations = {}
+    for key, lang, title, intent, guidance in conn.execute(
+            "SELECT key, lang, title, intent, answer_guidance FROM n400_explanations "
+            "ORDER BY key_position, lang_position"):
+        explanations.setdefault(key, {})[lang] = {'title': title, 'intent': intent, 'answer_guidance': guidance}
+    return explanations
+
+
+def export_data(conn, name):
+    """파일 이름 하나의 내용을 저장소에서 재구성"""
+    row = conn.execute("SELECT kind, lang FROM files WHERE name = ?", (name,)).fetchone()
+    if row is None:
+        raise KeyError(f"저장소에 없는 파일: {name}")
+    kind, lang = row
+    if kind == 'questions':
+        return export_questions(conn, lang)
+    if kind == 'story':
+        return export_story(conn)
+    if kind == 'n400_questions':
+        return export_n400_questions(conn)
+    return export_n400_explanations(conn)
+
+
+def export_bytes(conn, name):
+    """파일 이름 하나를 원본과 같은 형식의 바이트로"""
+    layout, trailing_newline = conn.execute(
+        "SELECT layout, trailing_newline FROM files WHERE name = ?", (name,)).fetchone()
+    text = dumps(export_data(conn, name), pretty=layout == 'pretty', schema=False)
+    return (text + ('\n' if trailing_newline else '')).encode('utf-8')
+
+
+# ---------------------------------------------------------------- ingest
+
+def _register_file(conn, name, kind, lang, raw, data):
+    """원본 형식을 기록 (표준 pretty / 끝 줄바꿈 여부 / 재현 가능 여부)"""
+    text = dumps(data, pretty=True, schema=False)
+    trailing_newline = raw.endswith('\n') and not text.endswith('\n')
+    exact = raw == text + ('\n' if trailing_newline else '')
+    with conn:
+        conn.execute(
+            "INSERT INTO files (name, kind, lang, layout, trailing_newline, exact) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET kind = excluded.kind, lang = excluded.lang, "
+            "layout = excluded.layout, trailing_newline = excluded.trailing_newline, exact = excluded.exact",
+            (name, kind, lang, 'pretty', int(trailing_newline), int(exact)),
+        )
+
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        raw = f.read()
+    return raw, json.loads(raw)
+
+
+def ingest(conn, data_dir):
+    """data/의 콘텐츠 파일 전체를 저장소로 (파일별 소요 시간 반환)"""
+    timings = {}
+
+    for lang in LANGUAGES:
+        name = QUESTION_FILE.format(lang=lang)
+        start = time.perf_counter()
+        raw, questions = _read(data_dir / name)
+        delete_questions(conn, lang, [row[0] for row in conn.execute(
+            "SELECT id FROM questions WHERE lang = ?", (lang,))])
+        upsert_questions(conn, lang, questions)
+        _register_file(conn, name, 'questions', lang, raw, questions)
+        timings[name] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    raw, story = _read(data_dir / STORY_FILE)
+    replace_story(conn, story)
+    _register_file(conn, STORY_FILE, 'story', None, raw, story)
+    timings[STORY_FILE] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    raw_questions, n400_questions = _read(data_dir / N400_QUESTIONS_FILE)
+    raw_explanations, n400_explanations = _read(data_dir / N400_EXPLANATIONS_FILE)
+    replace_n400(conn, n400_questions, n400_explanations)
+    _register_file(conn, N400_QUESTIONS_FILE, 'n400_questions', None, raw_questions, n400_questions)
+    _register_file(conn, N400_EXPLANATIONS_FILE, 'n400_explanations', None, raw_explanations, n400_explanations)
+    timings['n400'] = time.perf_counter() - start
+
+    return timings
+
+
+def verify(conn, data_dir):
+    """
+    저장소에서 내보낸 결과를 data/ 파일과 비교
+    반환: [(파일 이름, 'bytes' | 'content' | 'mismatch')]
+    """
+    results = []
+    for name, exact in conn.execute("SELECT name, exact FROM files ORDER BY name").fetchall():
+        raw, data = _read(data_dir / name)
+        if export_bytes(conn, name) == raw.encode('utf-8'):
+            results.append((name, 'bytes'))
+        elif not exact and export_data(conn, name) == data:
+            results.append((name, 'content'))
+        else:
+            results.append((name, 'mismatch'))
+    return results
+
+
+# ---------------------------------------------------------------- search
+
+def search(conn, query, lang=None, limit=10):
+    """
+    모든 FTS5 색인에서 검색 (bm25 순)
+    반환: [{'table', 'key', 'lang', 'snippet', 'score'}]
+    """
+    hits = []
+    for table, (_, key_columns) in FTS_TABLES.items():
+        fts = f'{table}_fts'
+        keys = ', '.join(f't.{c}' for c in key_columns)
+        sql = (f"SELECT {keys}, snippet({fts}, -1, '[', ']', '…', 12), bm25({fts}) "
+               f"FROM {fts} JOIN {table} t ON t.rowid = {fts}.rowid WHERE {fts} MATCH ?")
+        params = [query]
+        if lang:
+            sql += " AND t.lang = ?"
+            params.append(lang)
+        sql += f" ORDER BY bm25({fts}) LIMIT {int(limit)}"
+        for row in conn.execute(sql, params):
+            *key, snippet, score = row
+            hits.append({'table': table, 'key': key[:-1], 'lang': key[-1], 'snippet': snippet, 'score': score})
+    hits.sort(key=lambda hit: hit['score'])
+    return hits[:limit]
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    db_file = data_dir / 'build' / 'content.sqlite'
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ('ingest', 'verify', 'export', 'search'):
+        print(__doc__)
+        sys.exit(1)
+    command = sys.argv[1]
+
+    print("=" * 60)
+    print("🗄️  콘텐츠 저장소")
+    print("=" * 60)
+
+    conn = connect(db_file)
+
+    if command == 'ingest':
+        start = time.perf_counter()
+        timings = ingest(conn, data_dir)
+        for name, seconds in timings.items():
+            print(f"  • {name}: {seconds * 1000:.1f} ms")
+        counts = {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in FTS_TABLES}
+        print(f"\n📊 행 수: " + ', '.join(f"{table} {count:,}" for table, count in counts.items()))
+        print(f"✅ {(time.perf_counter() - start) * 1000:.0f} ms, 저장됨: {db_file}")
+        command = 'verify'
+
+    if command == 'verify':
+        print("\n🔍 내보내기 결과 비교")
+        results = verify(conn, data_dir)
+        for name, status in results:
+            label = {'bytes': '✅ 바이트 일치', 'content': '🟡 내용 일치 (원본이 수작업 포맷)',
+                     'mismatch': '❌ 불일치'}[status]
+            print(f"  {label}: {name}")
+        if any(status == 'mismatch' for _, status in results):
+            sys.exit(1)
+        return
+
+    if command == 'export':
+        if len(sys.argv) < 3:
+            print("출력 디렉터리를 지정하세요")
+            sys.exit(1)
+        output_dir = Path(sys.argv[2])
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for (name,) in conn.execute("SELECT name FROM files ORDER BY name").fetchall():
+            (output_dir / name).write_bytes(export_bytes(conn, name))
+            print(f"  💾 {name}")
+        return
+
+    if len(sys.argv) < 3:
+        print("검색어를 입력하세요")
+        sys.exit(1)
+    lang = sys.argv[3] if len(sys.argv) >= 4 else None
+    start = time.perf_counter()
+    hits = search(conn, sys.argv[2], lang)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"🔍 '{sys.argv[2]}' — {len(hits)}건, {elapsed_ms:.2f} ms")
+    for hit in hits:
+        key = ':'.join(str(k) for k in hit['key'])
+        print(f"  [{hit['lang']}] {hit['table']} {key}  {hit['snippet']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,11 @@ Complete_128_Questions - Arabic.csv → interview_questions_ar.json
 """
 
 import csv
-import json
 from pathlib import Path
 
+from canonical_json import write_json
+from question_schema import print_validation, validate_questions
+
 def parse_answers(answer_text):
     """답변 텍스트를 리스트로 파싱"""
     if not answer_text or answer_text.strip() == '':
@@ -79,6 +81,7 @@ def convert_arabic_to_json(csv_file, json_file):
     print(f"📊 총 문제 수: {len(rows)}개")
     
     questions = []
+    missing_rationale = []
     
     for row in rows:
         question_id = int(row['Index'])
@@ -86,7 +89,7 @@ def convert_arabic_to_json(csv_file, json_file):
         subcategory_en = row['SubCategory']
         question_text = row['Questions']
         answers_text = row['Answers']
-        rationale = row['rationale']
+        rationale = row.get('rationale') or ''
         wrong_text = row['Wrong']
         
         # 아랍어 카테고리/서브카테고리
@@ -104,7 +107,7 @@ def convert_arabic_to_json(csv_file, json_file):
             correct_answers = [
                 {
                     "text": dynamic_answer,
-                    "rationale": rationale if rationale else ""
+                    "rationale": rationale
                 }
             ]
         else:
@@ -113,7 +116,7 @@ def convert_arabic_to_json(csv_file, json_file):
                 correct_answers = [
                     {
                         "text": correct_answers_list[0],
-                        "rationale": rationale if rationale else ""
+                        "rationale": rationale
                     }
                 ]
             else:
@@ -122,7 +125,7 @@ def convert_arabic_to_json(csv_file, json_file):
                 correct_answers = [
                     {
                         "text": combined_text,
-                        "rationale": rationale if rationale else ""
+                        "rationale": rationale
                     }
                 ]
         
@@ -141,12 +144,17 @@ def convert_arabic_to_json(csv_file, json_file):
         }
         
         questions.append(question_obj)
+        if not rationale.strip():
+            missing_rationale.append(question_id)
     
+    # rationale이 빈 행은 빈 문자열로 채우지 않고 그대로 두어 스키마 검증에서 오류로 보고
+    if missing_rationale:
+        print(f"⚠️  rationale이 없는 행 {len(missing_rationale)}개: {missing_rationale}")
+
     # JSON 저장
     print(f"\n💾 JSON 파일 저장: {json_file.name}")
     
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(questions, f, ensure_ascii=False, indent=2)
+    write_json(json_file, questions)
     
     # 검증
     print(f"\n🔍 검증:")
@@ -203,6 +211,9 @@ def main():
     # 변환
     questions = convert_arabic_to_json(csv_file, json_file)
     
+    # 스키마 검증
+    print_validation(validate_questions(questions, 'ar'))
+    
     # 최종 결과
     print("\n" + "=" * 60)
     print("📊 최종 결과")
@@ -5,13 +5,15 @@
 Category와 SubCategory 필드 추가
 """
 
-import json
 import csv
 import os
 import shutil
 from pathlib import Path
 from datetime import datetime
 
+from canonical_json import write_json
+from question_schema import print_validation, validate_questions
+
 def backup_file(json_file_path, backup_dir):
     """파일 백업"""
     if not json_file_path.exists():
@@ -100,8 +102,7 @@ def convert_csv_to_json(csv_file_path, json_file_path, backup_dir):
             questions.append(question_obj)
     
     # JSON 저장
-    with open(json_file_path, 'w', encoding='utf-8') as f:
-        json.dump(questions, f, ensure_ascii=False, indent=2)
+    write_json(json_file_path, questions)
     
     # 통계
     print(f"\n✅ 변환 완료!")
@@ -132,61 +133,10 @@ def convert_csv_to_json(csv_file_path, json_file_path, backup_dir):
     return {
         'total_questions': len(questions),
         'categories': category_stats,
-        'file_size': file_size
+        'file_size': file_size,
+        'questions': questions
     }
 
-def validate_json(json_file_path):
-    """JSON 파일 검증"""
-    
-    print(f"\n🔍 JSON 파일 검증 중...")
-    
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    issues = []
-    
-    # 기본 검증
-    if len(data) != 128:
-        issues.append(f"⚠️  문제 수가 128개가 아닙니다: {len(data)}개")
-    
-    # 각 문제 검증
-    for i, q in enumerate(data, 1):
-        # 필수 필드 확인
-        required_fields = ['id', 'category', 'subcategory', 'question', 'correctAnswers', 'wrongAnswers']
-        for field in required_fields:
-            if field not in q:
-                issues.append(f"⚠️  문제 {i}: '{field}' 필드 없음")
-        
-        # ID 확인
-        if q.get('id') != i:
-            issues.append(f"⚠️  문제 {i}: ID 불일치 (expected: {i}, got: {q.get('id')})")
-        
-        # 정답 확인
-        if not q.get('correctAnswers') or len(q.get('correctAnswers', [])) == 0:
-            issues.append(f"⚠️  문제 {i}: 정답 없음")
-        else:
-            for j, ans in enumerate(q['correctAnswers']):
-                if 'text' not in ans:
-                    issues.append(f"⚠️  문제 {i}, 정답 {j+1}: 'text' 필드 없음")
-                if 'rationale' not in ans:
-                    issues.append(f"⚠️  문제 {i}, 정답 {j+1}: 'rationale' 필드 없음")
-        
-        # 오답 확인
-        if not q.get('wrongAnswers') or len(q.get('wrongAnswers', [])) < 3:
-            issues.append(f"⚠️  문제 {i}: 오답이 3개 미만 ({len(q.get('wrongAnswers', []))}개)")
-    
-    # 결과 출력
-    if issues:
-        print(f"\n❌ 검증 실패: {len(issues)}개 문제 발견")
-        for issue in issues[:10]:  # 처음 10개만 출력
-            print(f"  {issue}")
-        if len(issues) > 10:
-            print(f"  ... 외 {len(issues) - 10}개")
-        return False
-    else:
-        print(f"✅ 검증 성공: 모든 검사 통과!")
-        return True
-
 def main():
     print("="*60)
     print("🎯 128문제 CSV → JSON 변환 도구")
@@ -212,7 +162,7 @@ def main():
         result = convert_csv_to_json(csv_file, json_file, backup_dir)
         
         # 검증
-        is_valid = validate_json(json_file)
+        is_valid = print_validation(validate_questions(result['questions'], 'en'))
         
         # 최종 결과
         print("\n" + "="*60)
@@ -4,13 +4,15 @@
 128문제 베트남어 CSV를 JSON으로 변환
 """
 
-import json
 import csv
 import os
 import shutil
 from pathlib import Path
 from datetime import datetime
 
+from canonical_json import write_json
+from question_schema import print_validation, validate_questions
+
 def backup_file(json_file_path, backup_dir):
     """기존 JSON 파일 백업"""
     if not json_file_path.exists():
@@ -121,8 +123,7 @@ def convert_csv_to_json(csv_file_path, json_file_path, backup_dir):
             questions.append(question_obj)
     
     # JSON 저장
-    with open(json_file_path, 'w', encoding='utf-8') as f:
-        json.dump(questions, f, ensure_ascii=False, indent=2)
+    write_json(json_file_path, questions)
     
     # 통계
     print(f"\n✅ 변환 완료!")
@@ -158,44 +159,6 @@ def convert_csv_to_json(csv_file_path, json_file_path, backup_dir):
     
     return questions
 
-def validate_json(json_file_path):
-    """JSON 파일 검증"""
-    print(f"\n🔍 JSON 파일 검증 중...")
-    
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    errors = []
-    
-    # 기본 검증
-    if len(data) != 128:
-        errors.append(f"문제 수가 128개가 아님: {len(data)}개")
-    
-    # 각 문제 검증
-    for i, q in enumerate(data, 1):
-        if q['id'] != i:
-            errors.append(f"문제 {i}: ID 불일치 ({q['id']})")
-        
-        if not q.get('question'):
-            errors.append(f"문제 {i}: 질문 없음")
-        
-        if not q.get('correctAnswers') or len(q['correctAnswers']) == 0:
-            errors.append(f"문제 {i}: 정답 없음")
-        
-        if not q.get('wrongAnswers') or len(q['wrongAnswers']) < 3:
-            errors.append(f"문제 {i}: 오답이 3개 미만 ({len(q.get('wrongAnswers', []))}개)")
-    
-    if errors:
-        print("❌ 검증 실패:")
-        for error in errors[:10]:  # 처음 10개만 표시
-            print(f"  • {error}")
-        if len(errors) > 10:
-            print(f"  ... 외 {len(errors) - 10}개 오류")
-        return False
-    else:
-        print("✅ 검증 성공: 모든 검사 통과!")
-        return True
-
 def main():
     print("=" * 60)
     print("🎯 128문제 베트남어 CSV → JSON 변환 도구")
@@ -218,14 +181,14 @@ def main():
     questions = convert_csv_to_json(csv_file, json_file, backup_dir)
     
     # 검증
-    validate_json(json_file)
+    is_valid = print_validation(validate_questions(questions, 'vi'))
     
     # 최종 결과
     print("\n" + "=" * 60)
     print("📊 최종 결과")
     print("=" * 60)
     print(f"✅ 변환 완료: {len(questions)}개 문제")
-    print(f"✅ 검증: 통과")
+    print(f"✅ 검증: {'통과' if is_valid else '실패'}")
     print(f"📁 저장 위치: {json_file}")
     file_size = os.path.getsize(json_file)
     print(f"💾 파일 크기: {file_size/1024:.1f} KB")
@@ -5,9 +5,10 @@
 """
 
 import csv
-import json
 from pathlib import Path
 
+from canonical_json import write_json
+
 def parse_answers(answers_text):
     """답변 텍스트를 리스트로 변환"""
     if not answers_text or not answers_text.strip():
@@ -76,8 +77,7 @@ def csv_to_json(csv_file, json_file):
     
     # JSON 저장
     print(f"\n💾 JSON 파일 저장: {json_file.name}")
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, ensure_ascii=False, indent=2)
+    write_json(json_file, json_data)
     
     print(f"✅ {len(json_data)}개 문제 저장 완료")
     
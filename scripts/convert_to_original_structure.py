@@ -7,6 +7,8 @@
 import json
 from pathlib import Path
 
+from canonical_json import write_json
+
 def convert_question_to_content(question_data):
     """질문 데이터를 content_ko 형식으로 변환"""
     content = []
@@ -88,8 +90,7 @@ def convert_to_original_structure(input_file, output_file):
     # JSON 저장
     print(f"\n💾 변환된 파일 저장: {output_file.name}")
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(new_story, f, ensure_ascii=False, indent=2)
+    write_json(output_file, new_story)
     
     # 통계
     print(f"\n📊 통계:")
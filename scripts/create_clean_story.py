@@ -8,6 +8,8 @@ import json
 import re
 from pathlib import Path
 
+from canonical_json import write_json
+
 def is_question_only_section(content_ko):
     """섹션이 "Q.숫자: 질문? 답변." 형태만 있는지 확인"""
     if not content_ko or len(content_ko) < 2:
@@ -63,8 +65,7 @@ def clean_story(input_file, output_file):
     # JSON 저장
     print(f"\n💾 저장: {output_file.name}")
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(cleaned_story, f, ensure_ascii=False, indent=2)
+    write_json(output_file, cleaned_story)
     
     # 통계
     print(f"\n📊 정리 결과:")
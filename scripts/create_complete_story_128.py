@@ -8,6 +8,8 @@ interview_questions_ko.json의 128문제를 기반으로 완전한 스토리 생
 import json
 from pathlib import Path
 
+from canonical_json import write_json
+
 def create_answer_text(answer_text):
     """답변 텍스트를 answer 타입 리스트로 변환"""
     # 쉼표로 구분된 답변들을 분리
@@ -263,8 +265,7 @@ def create_story_from_questions(questions_file, output_file):
     # JSON 저장
     print(f"\n💾 저장: {output_file.name}")
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(story, f, ensure_ascii=False, indent=2)
+    write_json(output_file, story)
     
     # 통계
     all_linked = set()
@@ -7,6 +7,8 @@ interview_questions_ko.json 128문제를 기반으로 새로운 스토리 구조
 import json
 from pathlib import Path
 
+from canonical_json import write_json
+
 def create_story_structure():
     """새로운 스토리 구조 생성"""
     
@@ -173,8 +175,7 @@ def generate_story_content(questions_file, output_file):
     # JSON 저장
     print(f"\n💾 스토리 저장: {output_file.name}")
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(story, f, ensure_ascii=False, indent=2)
+    write_json(output_file, story)
     
     # 통계
     print(f"\n📊 통계:")
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오답 보기(wrongAnswers) 중복/충돌 검사 및 대체 오답 제안
+- 언어별로 모든 정답/오답 쉼표 그룹을 문자 트라이그램 역색인에 올리고,
+  한 번의 패스로 트라이그램을 공유하는 모든 쌍의 유사도(Dice)를 계산
+- 정답과 같은 오답(collision), 정답과 거의 같은 오답(near_duplicate),
+  같은 문제 안에서 서로 겹치는 오답(duplicate_distractor)을 표시
+  · near_duplicate는 같은 문제의 정답과 비교하며, 한쪽이 다른 쪽에 단어를 덧붙인 것뿐인
+    의도된 함정 보기('President' / 'Vice President', 'You have to pay' / 'You don’t have to pay')는 제외
+- 같은 category의 다른 문제 정답 중 이 문제의 정답과 충분히 다른 것을
+  대체 오답 후보로 제안 (같은 subcategory 후보 먼저, 그다음 대체할 오답과 길이가 비슷한 순)
+
+사용법:
+  python distractor_dedup.py [lang ...]
+"""
+
+import json
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from canonical_json import write_json
+from text_normalize import LANGUAGES, char_trigrams, normalize_text, split_answer_groups
+
+# 정답과 이 값 이상 비슷하면 near_duplicate
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+# 같은 문제의 오답끼리 이 값 이상 비슷하면 duplicate_distractor
+DISTRACTOR_DUPLICATE_THRESHOLD = 0.9
+
+# 대체 후보는 이 문제의 정답과 유사도가 이 값 미만이어야 함
+REPLACEMENT_MAX_SIMILARITY = 0.5
+
+# 이 값 미만의 유사도 쌍은 저장하지 않음 (희소 행렬 유지)
+MIN_STORED_SIMILARITY = 0.3
+
+MAX_PROPOSALS = 3
+
+
+def collect_entries(questions, lang):
+    """
+    문제 은행의 모든 정답/오답 쉼표 그룹을 평탄화
+    entry: {'qid', 'category', 'subcategory', 'kind'('correct'|'wrong'), 'option', 'text', 'normalized'}
+    """
+    entries = []
+    for q in questions:
+        for kind, key in (('correct', 'correctAnswers'), ('wrong', 'wrongAnswers')):
+            for option_idx, answer in enumerate(q.get(key, [])):
+                for group in split_answer_groups(answer.get('text', '')):
+                    normalized = normalize_text(group, lang)
+                    if not normalized:
+                        continue
+                    entries.append({
+                        'qid': q['id'],
+                        'category': q.get('category', ''),
+                        'subcategory': q.get('subcategory', ''),
+                        'kind': kind,
+                        'option': option_idx,
+                        'text': group,
+                        'normalized': normalized,
+                    })
+    return entries
+
+
+def merely_contains(a, b):
+    """
+    정규화된 두 보기 중 짧은 쪽이 긴 쪽에 그대로 들어 있는지
+    (문자열로 포함되거나, 단어 순서를 유지한 채 단어만 덧붙인 경우)
+    """
+    if a in b or b in a:
+        return True
+    shorter, longer = sorted((a.split(), b.split()), key=len)
+    remaining = iter(longer)
+    return all(word in remaining for word in shorter)
+
+
+def build_similarity_index(entries):
+    """
+    트라이그램 역색인을 만들고 한 번의 패스로 모든 쌍의 Dice 유사도 계산
+    반환: {i → {j → 유사도}} (MIN_STORED_SIMILARITY 이상만, 대칭)
+    """
+    trigram_sets = [char_trigrams(e['normalized']) for e in entries]
+
+    postings = defaultdict(list)
+    for entry_id, trigrams in enumerate(trigram_sets):
+        for trigram in trigrams:
+            postings[trigram].append(entry_id)
+
+    similarity = defaultdict(dict)
+    for i, trigrams in enumerate(trigram_sets):
+        overlap = defaultdict(int)
+        for trigram in trigrams:
+            for j in postings[trigram]:
+                if j > i:
+                    overlap[j] += 1
+        size_i = len(trigrams)
+        for j, shared in overlap.items():
+            dice = 2 * shared / (size_i + len(trigram_sets[j]))
+            if dice >= MIN_STORED_SIMILARITY:
+                similarity[i][j] = dice
+                similarity[j][i] = dice
+
+    return similarity
+
+
+def analyze_language(questions, lang):
+    """한 언어의 오답 충돌/중복 검사 + 대체 후보 제안"""
+    entries = collect_entries(questions, lang)
+    similarity = build_similarity_index(entries)
+
+    by_question = defaultdict(lambda: {'correct': [], 'wrong': []})
+    by_category = defaultdict(list)
+    for entry_id, entry in enumerate(entries):
+        by_question[entry['qid']][entry['kind']].append(entry_id)
+        if entry['kind'] == 'correct':
+            by_category[entry['category']].append(entry_id)
+
+    def sim(i, j):
+        if entries[i]['normalized'] == entries[j]['normalized']:
+            return 1.0
+        return similarity[i].get(j, 0.0)
+
+    issues = []
+    for qid, groups in sorted(by_question.items()):
+        correct_ids = groups['correct']
+        wrong_ids = groups['wrong']
+        flagged = []
+
+        for w in wrong_ids:
+            best_id, best_score = None, 0.0
+            for c in correct_ids:
+                score = sim(w, c)
+                if score > best_score:
+                    best_id, best_score = c, score
+            if best_score >= 1.0:
+                flagged.append((w, 'collision', best_id, best_score))
+            elif best_score >= NEAR_DUPLICATE_THRESHOLD \
+                    and not merely_contains(entries[w]['normalized'], entries[best_id]['normalized']):
+                flagged.append((w, 'near_duplicate', best_id, best_score))
+
+        for idx, w in enumerate(wrong_ids):
+            for other in wrong_ids[idx + 1:]:
+                if entries[w]['option'] == entries[other]['option']:
+                    continue
+                score = sim(w, other)
+                if score >= DISTRACTOR_DUPLICATE_THRESHOLD:
+                    flagged.append((other, 'duplicate_distractor', w, score))
+
+        if not flagged:
+            continue
+
+        # 대체 후보: 같은 category의 다른 문제 정답 중 이 문제 정답과 충분히 다른 것
+        existing = {entries[i]['normalized'] for i in correct_ids + wrong_ids}
+        category = entries[flagged[0][0]]['category']
+        subcategory = entries[flagged[0][0]]['subcategory']
+        candidates = []
+        seen = set()
+        for candidate_id in by_category[category]:
+            candidate = entries[candidate_id]
+            if candidate['qid'] == qid or candidate['normalized'] in existing:
+                continue
+            if candidate['normalized'] in seen:
+                continue
+            closeness = max((sim(candidate_id, c) for c in correct_ids), default=0.0)
+            if closeness >= REPLACEMENT_MAX_SIMILARITY:
+                continue
+            seen.add(candidate['normalized'])
+            candidates.append((closeness, candidate_id))
+
+        for wrong_id, issue_type, against_id, score in flagged:
+            wrong = entries[wrong_id]
+            # 같은 subcategory 후보 먼저, 그 안에서는 대체할 오답과 길이가 비슷하고 정답과 적당히 거리가 있는 후보 우선
+            ranked = sorted(
+                candidates,
+                key=lambda item: (entries[item[1]]['subcategory'] != subcategory,
+                                  abs(len(entries[item[1]]['text']) - len(wrong['text'])), item[0]),
+            )
+            issues.append({
+                'lang': lang,
+                'id': qid,
+                'type': issue_type,
+                'option': wrong['option'],
+                'text': wrong['text'],
+                'against': entries[against_id]['text'],
+                'similarity': round(score, 3),
+                'proposals': [
+                    {'text': entries[c]['text'], 'fromQuestion': entries[c]['qid']}
+                    for _, c in ranked[:MAX_PROPOSALS]
+                ],
+            })
+
+    return issues, len(entries)
+
+
+def main():
+    print("=" * 60)
+    print("🎯 오답 보기 중복/충돌 검사")
+    print("=" * 60)
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    report_file = data_dir / 'build' / 'distractor_report.json'
+
+    languages = sys.argv[1:] or LANGUAGES
+
+    all_issues = []
+    for lang in languages:
+        with open(data_dir / f'interview_questions_{lang}.json', 'r', encoding='utf-8') as f:
+            questions = json.load(f)
+
+        start = time.perf_counter()
+        issues, entry_count = analyze_language(questions, lang)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        all_issues.extend(issues)
+
+        counts = defaultdict(int)
+        for issue in issues:
+            counts[issue['type']] += 1
+        print(f"\n📝 {lang}: 그룹 {entry_count:,}개, {elapsed_ms:.1f} ms")
+        print(f"  • 정답과 동일: {counts['collision']}개")
+        print(f"  • 정답과 유사: {counts['near_duplicate']}개")
+        print(f"  • 오답끼리 중복: {counts['duplicate_distractor']}개")
+
+    write_json(report_file, all_issues)
+
+    print("\n" + "=" * 60)
+    print(f"📊 총 {len(all_issues)}개 문제 발견")
+    for issue in all_issues[:5]:
+        proposals = ', '.join(p['text'] for p in issue['proposals']) or '(후보 없음)'
+        print(f"  • [{issue['lang']}] Q.{issue['id']} {issue['type']}: "
+              f"'{issue['text']}' ≈ '{issue['against']}' → {proposals}")
+    print(f"📁 보고서: {report_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ import json
 import re
 from pathlib import Path
 
+from canonical_json import write_json
+
 def extract_question_numbers(content_list):
     """content에서 Q.숫자 패턴을 찾아서 질문 번호 추출"""
     question_nums = []
@@ -176,8 +178,7 @@ def expand_story(story_file, questions_file, output_file):
     # JSON 저장
     print(f"\n💾 저장: {output_file.name}")
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(new_story, f, ensure_ascii=False, indent=2)
+    write_json(output_file, new_story)
     
     # 최종 통계
     total_linked = set()
@@ -2,66 +2,224 @@
 # -*- coding: utf-8 -*-
 """
 AI에게 줄 문제 데이터 추출
+- 언어별 문제 은행을 한 번만 로드
+- 문제/정답마다 대략적인 토큰 수를 계산하고, 토큰 예산 안에서
+  챕터 경계를 지키며 여러 챕터를 하나의 프롬프트에 탐욕적으로 묶음
+- 모든 언어의 프롬프트와 manifest.json을 한 번에 생성
+  · 일부 언어만 지정하면 manifest.json의 그 언어 항목만 바꾸고 나머지 언어 항목은 유지
+    (기존 manifest의 토큰 예산이 다르면 나머지 언어의 프롬프트 파일과 항목을 지움)
+  · 문제 하나가 예산보다 크면 그 문제만 담은 프롬프트를 만들고 경고
+
+사용법:
+  python extract_questions_for_ai.py [토큰 예산] [lang ...]
 """
 
 import json
+import sys
+import unicodedata
 from pathlib import Path
 
-def extract_questions_for_ai(start_q, end_q):
-    """특정 범위의 문제를 AI 프롬프트용으로 추출"""
-    
+from canonical_json import write_json
+from text_normalize import LANGUAGES
+
+DEFAULT_TOKEN_BUDGET = 4000
+
+# 챕터별 문제 범위 (question_story.json의 챕터 구성과 동일)
+CHAPTERS = [
+    (1, 15, "헌법의 탄생"),
+    (16, 62, "삼권분립"),
+    (63, 72, "시민의 권리와 책임"),
+    (73, 89, "식민지에서 독립까지"),
+    (90, 99, "1800년대"),
+    (100, 118, "근현대사"),
+    (119, 128, "상징과 휴일")
+]
+
+ANSWER_LABELS = {
+    'en': 'Answer',
+    'ko': '정답',
+    'es': 'Respuesta',
+    'zh': '答案',
+    'tl': 'Sagot',
+    'vi': 'Đáp án',
+    'hi': 'उत्तर',
+    'fr': 'Réponse',
+    'ar': 'الإجابة',
+}
+
+
+def estimate_tokens(text):
+    """
+    대략적인 토큰 수 추정 (토크나이저 없이)
+    - 라틴 문자/숫자/공백: 4자당 1토큰 (베트남어 등 결합 부호 U+0300~036F, 라틴 확장 추가 U+1E00~1EFF 포함)
+    - 한자/가나/한글: 1자당 1토큰
+    - 그 외 문자(데바나가리, 아랍 문자 등): 2자당 1토큰
+    """
+    latin = 0
+    wide = 0
+    other = 0
+    for ch in text:
+        code = ord(ch)
+        if code < 0x250 or 0x300 <= code < 0x370 or 0x1E00 <= code < 0x1F00:
+            latin += 1
+        elif unicodedata.east_asian_width(ch) in ('W', 'F'):
+            wide += 1
+        else:
+            other += 1
+    return -(-latin // 4) + wide + -(-other // 2)
+
+
+def format_question(q, lang):
+    """문제 하나를 프롬프트 줄로 변환"""
+    lines = [f"**Q.{q['id']}: {q['question']}**"]
+    if q.get('correctAnswers'):
+        label = ANSWER_LABELS.get(lang, 'Answer')
+        lines.append(f"{label}: {q['correctAnswers'][0]['text']}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def chapter_header(start_q, end_q):
+    return f"# 챕터: Q.{start_q}-Q.{end_q}\n"
+
+
+def pack_prompts(questions, lang, budget):
+    """
+    챕터 단위로 탐욕적 패킹
+    - 챕터가 현재 프롬프트에 들어가면 이어 붙이고, 아니면 새 프롬프트 시작
+    - 챕터 하나가 예산보다 크면 그 챕터만 문제 경계에서 여러 프롬프트로 나눔
+    반환: [{'text', 'tokens', 'chapters': [{'title', 'start', 'end', 'questions'}]}, ...]
+    """
+    by_id = {q['id']: q for q in questions}
+
+    prompts = []
+    current = {'parts': [], 'tokens': 0, 'chapters': []}
+
+    def flush():
+        if current['parts']:
+            prompts.append({
+                'text': "\n".join(current['parts']),
+                'tokens': current['tokens'],
+                'chapters': current['chapters'],
+            })
+        current['parts'] = []
+        current['tokens'] = 0
+        current['chapters'] = []
+
+    for start_q, end_q, title in CHAPTERS:
+        q_ids = [i for i in range(start_q, end_q + 1) if i in by_id]
+        blocks = [format_question(by_id[i], lang) for i in q_ids]
+        block_tokens = [estimate_tokens(block) for block in blocks]
+        header = chapter_header(start_q, end_q)
+        header_tokens = estimate_tokens(header)
+        chapter_tokens = header_tokens + sum(block_tokens)
+
+        if chapter_tokens <= budget:
+            if current['tokens'] + chapter_tokens > budget:
+                flush()
+            current['parts'].append(header + "\n".join(blocks))
+            current['tokens'] += chapter_tokens
+            current['chapters'].append({'title': title, 'start': start_q, 'end': end_q,
+                                        'questions': len(blocks)})
+            continue
+
+        # 예산보다 큰 챕터는 현재 프롬프트의 남은 공간부터 채우며 문제 경계에서 분할
+        part_blocks = []
+        part_start = start_q
+        part_tokens = header_tokens
+        for q_id, block, tokens in zip(q_ids, blocks, block_tokens):
+            if current['tokens'] + part_tokens + tokens > budget:
+                if part_blocks:
+                    part_end = q_ids[q_ids.index(q_id) - 1]
+                    current['parts'].append(chapter_header(part_start, part_end) + "\n".join(part_blocks))
+                    current['tokens'] += part_tokens
+                    current['chapters'].append({'title': title, 'start': part_start, 'end': part_end,
+                                                'questions': len(part_blocks)})
+                flush()
+                part_blocks = []
+                part_start = q_id
+                part_tokens = header_tokens
+            part_blocks.append(block)
+            part_tokens += tokens
+
+        current['parts'].append(chapter_header(part_start, end_q) + "\n".join(part_blocks))
+        current['tokens'] += part_tokens
+        current['chapters'].append({'title': title, 'start': part_start, 'end': end_q,
+                                    'questions': len(part_blocks)})
+
+    flush()
+    return prompts
+
+
+def main():
+    budget = int(sys.argv[1]) if len(sys.argv) >= 2 else DEFAULT_TOKEN_BUDGET
+    languages = sys.argv[2:] or LANGUAGES
+
     script_dir = Path(__file__).parent
     project_dir = script_dir.parent
     data_dir = project_dir / 'data'
-    
-    with open(data_dir / 'interview_questions_ko.json', 'r', encoding='utf-8') as f:
-        questions = json.load(f)
-    
-    output = []
-    output.append(f"# 챕터: Q.{start_q}-Q.{end_q}\n")
-    
-    for q in questions:
-        if start_q <= q['id'] <= end_q:
-            output.append(f"**Q.{q['id']}: {q['question']}**")
-            
-            if q.get('correctAnswers'):
-                answers = q['correctAnswers'][0]['text']
-                output.append(f"정답: {answers}")
-            
-            output.append("")
-    
-    result = "\n".join(output)
-    
-    # 파일로 저장
-    output_file = data_dir / f'ai_prompt_Q{start_q}-Q{end_q}.txt'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(result)
-    
-    print(result)
-    print(f"\n\n💾 저장됨: {output_file}")
-    
-    return result
+    output_dir = data_dir / 'ai_prompts'
 
-if __name__ == "__main__":
-    # 챕터별로 추출
-    chapters = [
-        (1, 15, "헌법의 탄생"),
-        (16, 62, "삼권분립"),
-        (63, 72, "시민의 권리와 책임"),
-        (73, 89, "식민지에서 독립까지"),
-        (90, 99, "1800년대"),
-        (100, 118, "근현대사"),
-        (119, 128, "상징과 휴일")
-    ]
-    
     print("=" * 60)
     print("📝 AI 프롬프트용 문제 추출")
     print("=" * 60)
-    print()
-    
-    for start, end, title in chapters:
-        print(f"\n{'='*60}")
-        print(f"📖 {title} (Q.{start}-Q.{end})")
-        print(f"{'='*60}\n")
-        extract_questions_for_ai(start, end)
-        print("\n")
+    print(f"토큰 예산: {budget:,} / 언어: {', '.join(languages)}")
+
+    manifest_file = output_dir / 'manifest.json'
+    manifest = {'budget': budget, 'prompts': []}
+    if manifest_file.exists():
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        kept = [p for p in previous.get('prompts', []) if p['lang'] not in languages]
+        if previous.get('budget') == budget:
+            manifest['prompts'] = kept
+        elif kept:
+            # 다른 예산으로 만든 프롬프트가 섞이지 않도록 지정하지 않은 언어의 이전 결과는 지움
+            dropped = sorted({p['lang'] for p in kept})
+            print(f"⚠️  이전 예산({previous.get('budget'):,})으로 만든 {', '.join(dropped)} 프롬프트 삭제")
+            for lang in dropped:
+                for stale in (output_dir / lang).glob('prompt_*.txt'):
+                    stale.unlink()
+
+    for lang in languages:
+        with open(data_dir / f'interview_questions_{lang}.json', 'r', encoding='utf-8') as f:
+            questions = json.load(f)
+
+        prompts = pack_prompts(questions, lang, budget)
+        lang_dir = output_dir / lang
+        lang_dir.mkdir(parents=True, exist_ok=True)
+
+        for stale in lang_dir.glob('prompt_*.txt'):
+            stale.unlink()
+
+        for i, prompt in enumerate(prompts, 1):
+            output_file = lang_dir / f'prompt_{i:02d}.txt'
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(prompt['text'])
+
+            manifest['prompts'].append({
+                'lang': lang,
+                'file': str(output_file.relative_to(output_dir)),
+                'tokens': prompt['tokens'],
+                'chapters': prompt['chapters'],
+            })
+
+        total_tokens = sum(p['tokens'] for p in prompts)
+        print(f"\n📖 {lang}: 프롬프트 {len(prompts)}개 (약 {total_tokens:,} 토큰)")
+        for i, prompt in enumerate(prompts, 1):
+            ranges = ', '.join(f"Q.{c['start']}-Q.{c['end']}" for c in prompt['chapters'])
+            print(f"  {i:02d}. {prompt['tokens']:,} 토큰 — {ranges}")
+            # 예산을 넘는 프롬프트는 문제 하나짜리 (더 나눌 수 없음)
+            if prompt['tokens'] > budget:
+                print(f"  ⚠️  Q.{prompt['chapters'][0]['start']} 하나가 예산 초과 ({prompt['tokens']:,} > {budget:,} 토큰)")
+
+    manifest['prompts'].sort(key=lambda p: (LANGUAGES.index(p['lang']) if p['lang'] in LANGUAGES else len(LANGUAGES),
+                                            p['file']))
+    write_json(manifest_file, manifest)
+
+    print(f"\n✅ 총 {len(manifest['prompts'])}개 프롬프트")
+    print(f"💾 저장됨: {manifest_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,10 @@
 128문제 전체를 재미있는 스토리 형식으로 생성
 """
 
-import json
 from pathlib import Path
 
+from canonical_json import write_json
+
 def generate_full_story():
     """128문제 전체 스토리 생성"""
     
@@ -150,8 +151,7 @@ def main():
     story = generate_full_story()
     
     # 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(story, f, ensure_ascii=False, indent=2)
+    write_json(output_file, story)
     
     print(f"\n💾 저장 위치: {output_file}")
 
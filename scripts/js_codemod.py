@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JS 소스 일괄 변환 (codemod)
+- 규칙(정규식 → 치환)을 하나의 다중 패턴 정규식으로 컴파일하여 파일마다 한 번만 스캔
+- 조건부 규칙: 같은 파일에서 다른 규칙이 적용되었는지 / 파일 내용을 보고 적용 여부 결정
+  (예: require를 await QuestionLoader로 바꾼 파일에서만 함수를 async로 변경)
+- screens/, components/, utils/ 전체를 프로세스 풀로 병렬 처리
+- 기본은 미리보기(unified diff), --write로 실제 기록
+- 변환 결과에 다시 적용해도 바뀌지 않는지(멱등성) 확인한 뒤에만 기록
+- 바꿀 것이 없던 파일은 (규칙 지문, 내용 해시)를 캐시하여 다음 실행에서 건너뜀
+
+사용법:
+  python js_codemod.py [--write] [--no-cache] [--jobs N] [경로 ...]
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from canonical_json import write_json
+
+SOURCE_ROOTS = ('screens', 'components', 'utils')
+SOURCE_SUFFIXES = ('.js', '.jsx', '.ts', '.tsx')
+
+LOADER_MODULE = 'utils/questionLoader'
+LOADER_IMPORT = "import QuestionLoader from '{path}';"
+IMPORT_RE = re.compile(r"^import[^\n]*?from[^\n]*?;[ \t]*$", re.M)
+
+
+def rule(name, pattern, replacement, when=None):
+    """
+    변환 규칙
+    replacement: re 치환 템플릿 (\\1 등 패턴 안의 그룹 참조 가능, 이름 있는 그룹은 사용 불가)
+    when: CONDITIONS의 조건 이름 (None이면 항상 적용)
+    """
+    return {'name': name, 'pattern': pattern, 'replacement': replacement, 'when': when}
+
+
+# archive/update_question_imports.py의 변환 (interview_questions.json require → QuestionLoader)
+QUESTION_LOADER_RULES = [
+    rule('require-assign',
+         r"const (questionsData|allQuestionsData) = require\('\.\./data/interview_questions\.json'\);",
+         r"const \1 = await QuestionLoader.loadQuestions();"),
+    rule('require-inline',
+         r"require\('\.\./data/interview_questions\.json'\)",
+         r"await QuestionLoader.loadQuestions()"),
+    rule('async-loader',
+         r"const (loadQuestions|loadData|initializeQuestions) = \(\) => \{",
+         r"const \1 = async () => {",
+         when='awaits_loader'),
+    # 예전 다국어 필드 → 새 구조 (이번 실행에서 require를 바꾼 파일만, n400 데이터의 question_en 등은 그대로)
+    rule('field-question', r"\bquestion_(?:en|ko)\b", r"question", when='uses_loader'),
+    rule('field-text', r"\.text_(?:en|ko)\b", r".text", when='uses_loader'),
+    rule('field-rationale', r"\.rationale_(?:en|ko)\b", r".rationale", when='uses_loader'),
+]
+
+REQUIRE_RULES = {'require-assign', 'require-inline'}
+
+CONDITIONS = {
+    'awaits_loader': lambda text, fired: bool(fired & REQUIRE_RULES) or 'await QuestionLoader.loadQuestions()' in text,
+    # 'QuestionLoader' in text로 판단하면 N-400 질문(question_en)을 쓰는 파일까지 바뀜
+    'uses_loader': lambda text, fired: bool(fired & REQUIRE_RULES),
+}
+
+# 규칙을 적용하지 않는 파일 (N-400 데이터의 question_en / question 필드, QuestionLoader 자신)
+EXCLUDED_FILES = {'screens/N400PracticeScreen.js', 'utils/questionLoader.js'}
+
+
+def compile_rules(rules):
+    """규칙 목록 → 하나의 정규식 (앞쪽 규칙이 같은 위치에서 우선)"""
+    for r in rules:
+        if r['when'] is not None and r['when'] not in CONDITIONS:
+            raise ValueError(f"알 수 없는 조건: {r['when']} ({r['name']})")
+        r['regex'] = re.compile(r['pattern'])
+    combined = re.compile('|'.join(f"(?P<r{i}>{r['pattern']})" for i, r in enumerate(rules)))
+    fingerprint = hashlib.sha256(json.dumps(
+        [[r['name'], r['pattern'], r['replacement'], r['when']] for r in rules] + [LOADER_IMPORT]
+    ).encode('utf-8')).hexdigest()
+    return {'rules': rules, 'regex': combined, 'fingerprint': fingerprint}
+
+
+# 워커 프로세스마다 모듈 로드 시 한 번 컴파일
+RULESET = compile_rules(QUESTION_LOADER_RULES)
+
+
+def loader_import(relative_path):
+    """파일 위치에서 utils/questionLoader까지의 import 문"""
+    target = os.path.relpath(LOADER_MODULE, os.path.dirname(relative_path) or '.')
+    if not target.startswith('.'):
+        target = './' + target
+    return LOADER_IMPORT.format(path=target.replace(os.sep, '/'))
+
+
+def ensure_loader_import(text, relative_path):
+    """마지막 import 뒤에 QuestionLoader import 추가 (이미 있거나 import가 없으면 그대로)"""
+    if 'import QuestionLoader from' in text:
+        return text
+    last = None
+    for last in IMPORT_RE.finditer(text):
+        pass
+    if last is None:
+        return text
+    return text[:last.end()] + '\n' + loader_import(relative_path) + text[last.end():]
+
+
+def rewrite(text, relative_path, ruleset=RULESET):
+    """
+    소스 하나 변환 (정규식 스캔 한 번)
+    반환: (새 텍스트, {규칙 이름: 적용 횟수})
+    """
+    rules = ruleset['rules']
+    matches = []
+    fired = set()
+    for m in ruleset['regex'].finditer(text):
+        r = rules[int(m.lastgroup[1:])]
+        matches.append((m.start(), m.end(), r, m.group()))
+        if r['when'] is None:
+            fired.add(r['name'])
+
+    enabled = {name: check(text, fired) for name, check in CONDITIONS.items()}
+    pieces = []
+    counts = {}
+    position = 0
+    for start, end, r, matched in matches:
+        if r['when'] is not None and not enabled[r['when']]:
+            continue
+        replaced = r['regex'].fullmatch(matched).expand(r['replacement'])
+        if replaced == matched:
+            continue
+        pieces.append(text[position:start])
+        pieces.append(replaced)
+        position = end
+        counts[r['name']] = counts.get(r['name'], 0) + 1
+    pieces.append(text[position:])
+    result = ''.join(pieces)
+
+    if fired & REQUIRE_RULES:
+        with_import = ensure_loader_import(result, relative_path)
+        if with_import != result:
+            counts['loader-import'] = 1
+            result = with_import
+    return result, counts
+
+
+def process_file(project_dir, relative_path):
+    """워커: 파일 하나 변환 → 결과 요약 (기록은 메인 프로세스에서)"""
+    path = Path(project_dir) / relative_path
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    text = raw.decode('utf-8')
+    result = {'path': relative_path, 'sha256': digest, 'counts': {}, 'diff': '', 'new_text': None, 'error': None}
+    if relative_path in EXCLUDED_FILES:
+        return result
+
+    new_text, counts = rewrite(text, relative_path)
+    if new_text == text:
+        return result
+
+    again, _ = rewrite(new_text, relative_path)
+    if again != new_text:
+        result['error'] = "멱등성 위반: 변환 결과에 다시 적용하면 또 바뀜"
+        return result
+
+    result['counts'] = counts
+    result['new_text'] = new_text
+    result['diff'] = ''.join(difflib.unified_diff(
+        text.splitlines(keepends=True), new_text.splitlines(keepends=True),
+        fromfile=f'a/{relative_path}', tofile=f'b/{relative_path}'))
+    return result
+
+
+def find_sources(project_dir, targets):
+    files = []
+    for target in targets:
+        path = project_dir / target
+        if path.is_file():
+            files.append(path)
+        elif path.is_dir():
+            files.extend(p for p in path.rglob('*') if p.suffix in SOURCE_SUFFIXES and 'node_modules' not in p.parts)
+    return sorted({p.relative_to(project_dir).as_posix() for p in files})
+
+
+def load_cache(cache_file):
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if cache.get('fingerprint') != RULESET['fingerprint']:
+        return {}
+    return cache.get('files', {})
+
+
+def stat_key(path):
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def main():
+    args = sys.argv[1:]
+    write = '--write' in args
+    use_cache = '--no-cache' not in args
+    jobs = int(args[args.index('--jobs') + 1]) if '--jobs' in args else None
+    targets = [a for i, a in enumerate(args) if not a.startswith('--') and (i == 0 or args[i - 1] != '--jobs')]
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    cache_file = project_dir / 'data' / 'build' / 'codemod_cache.json'
+
+    print("=" * 60)
+    print(f"🔧 JS codemod ({'기록' if write else '미리보기'}, 규칙 {len(RULESET['rules'])}개)")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    files = find_sources(project_dir, targets or SOURCE_ROOTS)
+    cache = load_cache(cache_file) if use_cache else {}
+
+    # 캐시: 바꿀 것이 없던 파일은 mtime/크기가 같으면 읽지 않고, 다르면 해시로 한 번 더 확인
+    todo = []
+    skipped = 0
+    for relative in files:
+        path = project_dir / relative
+        entry = cache.get(relative)
+        if entry:
+            if entry['stat'] == stat_key(path):
+                skipped += 1
+                continue
+            if hashlib.sha256(path.read_bytes()).hexdigest() == entry['sha256']:
+                entry['stat'] = stat_key(path)
+                skipped += 1
+                continue
+        todo.append(relative)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(process_file, [str(project_dir)] * len(todo), todo, chunksize=8))
+
+    changed = []
+    errors = []
+    totals = {}
+    for result in results:
+        relative = result['path']
+        if result['error']:
+            errors.append(result)
+            cache.pop(relative, None)
+            continue
+        if result['new_text'] is None:
+            cache[relative] = {'sha256': result['sha256'], 'stat': stat_key(project_dir / relative)}
+            continue
+
+        changed.append(result)
+        for name, count in result['counts'].items():
+            totals[name] = totals.get(name, 0) + count
+        if write:
+            path = project_dir / relative
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(result['new_text'])
+            cache[relative] = {
+                'sha256': hashlib.sha256(result['new_text'].encode('utf-8')).hexdigest(),
+                'stat': stat_key(path),
+            }
+        else:
+            # 미리보기에서는 바뀔 파일을 캐시하지 않음 (다음 실행에서도 다시 보여줌)
+            cache.pop(relative, None)
+
+    for result in changed:
+        print(f"\n📝 {result['path']} ({', '.join(f'{k} ×{v}' for k, v in result['counts'].items())})")
+        if not write:
+            print(result['diff'], end='')
+    for result in errors:
+        print(f"\n❌ {result['path']}: {result['error']}")
+
+    if use_cache:
+        write_json(cache_file, {'fingerprint': RULESET['fingerprint'], 'files': cache}, pretty=False, schema=False)
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"\n📊 파일 {len(files)}개: 변경 {len(changed)}개, 캐시로 건너뜀 {skipped}개, 오류 {len(errors)}개 ({elapsed_ms:.0f} ms)")
+    if totals:
+        print("   " + ', '.join(f"{name} ×{count}" for name, count in sorted(totals.items())))
+    if changed and not write:
+        print("\n💡 --write로 적용")
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+data/, locales/ JSON 일괄 변환 엔진 (파일마다 읽기 한 번, 연산 여러 개, 쓰기 한 번)
+- 연산 목록(JSON 스펙 또는 PRESETS)을 대상 파일별로 묶어서 순서대로 적용
+    {"op": "delete",    "files": "data/interview_questions_*.json", "path": "[*].wrongAnswers[*].rationale"}
+    {"op": "set",       "files": "locales/*.json", "path": "interview.userSetAnswer",
+                        "value": "...", "byLang": {"ko": "...", ...}, "onlyMissing": true}
+    {"op": "map",       "files": ..., "path": "[*].category", "values": {"old": "new"}}   또는 "function": "strip"
+    {"op": "rename",    "files": ..., "path": "[*].subCategory", "to": "subcategory"}
+    {"op": "mergeCsv",  "files": "data/interview_questions_{lang}.json", "path": "[*]",
+                        "csv": "data/Completed/{lang}.csv", "key": "id", "csvKey": "Index",
+                        "columns": {"Category_AR": "category"}}
+- 경로: 키, '*'(모든 키), '[*]'(모든 항목), '[3]'(인덱스), '[id=23]'(필드 값으로 항목 선택)
+  set은 중간 딕셔너리가 없으면 만듦
+- {lang}: 파일 이름의 언어 코드 (interview_questions_<lang>.json, locales/<lang>.json)
+- 파일 단위로 프로세스 풀 병렬 처리, 기본은 미리보기(unified diff), --write로 기록
+- 표준 JSON 형식(canonical_json)이 아닌 파일은 서식이 바뀌므로 기록하지 않고 오류로 보고
+- 연산별 일치 / 변경 수와 시간 보고
+
+사용법:
+  python json_transform.py <스펙.json | 프리셋 이름> [--write] [--jobs N]
+  python json_transform.py --list
+"""
+
+import csv
+import difflib
+import fnmatch
+import json
+import re
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from canonical_json import atomic_open, dumps
+
+OPS = ('delete', 'set', 'map', 'rename', 'mergeCsv')
+FILE_ROOTS = ('data', 'locales')
+LANG_FILE_RE = re.compile(r'(?:^|_)([a-z]{2})$')
+PATH_TOKEN_RE = re.compile(r'\[(\*|\d+|[A-Za-z_]\w*=[^\]]+)\]|\.?(\*|[^.\[\]]+)')
+
+MAP_FUNCTIONS = {
+    'strip': str.strip,
+    'nfc': lambda text: unicodedata.normalize('NFC', text),
+    'collapseSpaces': lambda text: ' '.join(text.split()),
+}
+
+# remove_wrong_answer_rationales.py 등 기존 일회성 스크립트의 변환
+PRESETS = {
+    'strip-wrong-rationales': [
+        {'op': 'delete', 'files': 'data/interview_questions_*.json', 'path': '[*].wrongAnswers[*].rationale'},
+    ],
+    'normalize-answer-text': [
+        {'op': 'map', 'files': 'data/interview_questions_*.json', 'path': f'[*].{field}[*].text', 'function': name}
+        for field in ('correctAnswers', 'wrongAnswers') for name in ('nfc', 'strip')
+    ],
+}
+
+
+def parse_path(path):
+    """'[*].wrongAnswers[0].text' → [('any',), ('key', 'wrongAnswers'), ('index', 0), ('key', 'text')]"""
+    tokens = []
+    position = 0
+    for match in PATH_TOKEN_RE.finditer(path):
+        if match.start() != position:
+            raise ValueError(f"경로 형식 오류: '{path}' ({position}번째 글자)")
+        bracket, key = match.groups()
+        if bracket is not None:
+            if bracket == '*':
+                tokens.append(('any',))
+            elif bracket.isdigit():
+                tokens.append(('index', int(bracket)))
+            else:
+                field, _, raw = bracket.partition('=')
+                try:
+                    value = json.loads(raw)
+                except json.JSONDecodeError:
+                    value = raw
+                tokens.append(('filter', field, value))
+        else:
+            tokens.append(('any',) if key == '*' else ('key', key))
+        position = match.end()
+    if position != len(path) or not tokens:
+        raise ValueError(f"경로 형식 오류: '{path}'")
+    return tokens
+
+
+def children(node, token, create=False):
+    """노드 하나에서 토큰이 가리키는 (부모, 키) 목록"""
+    kind = token[0]
+    if kind == 'key':
+        if isinstance(node, dict):
+            if token[1] not in node and create:
+                node[token[1]] = {}
+            if token[1] in node:
+                return [(node, token[1])]
+        return []
+    if kind == 'index':
+        if isinstance(node, list) and token[1] < len(node):
+            return [(node, token[1])]
+        return []
+    if kind == 'any':
+        if isinstance(node, dict):
+            return [(node, key) for key in node]
+        if isinstance(node, list):
+            return [(node, i) for i in range(len(node))]
+        return []
+    _, field, value = token
+    if isinstance(node, list):
+        return [(node, i) for i, item in enumerate(node) if isinstance(item, dict) and item.get(field) == value]
+    return []
+
+
+def resolve(data, tokens, create=False):
+    """경로의 마지막 위치들 (부모, 키) - set이면 마지막 키가 없어도 포함"""
+    nodes = [data]
+    for token in tokens[:-1]:
+        nodes = [parent[key] for node in nodes for parent, key in children(node, token, create)]
+    last = tokens[-1]
+    locations = []
+    for node in nodes:
+        if create and last[0] == 'key' and isinstance(node, dict):
+            locations.append((node, last[1]))
+        else:
+            locations.extend(children(node, last))
+    return locations
+
+
+def file_lang(path):
+    match = LANG_FILE_RE.search(Path(path).stem)
+    return match.group(1) if match else None
+
+
+def load_csv_rows(project_dir, operation, lang):
+    csv_file = project_dir / operation['csv'].format(lang=lang)
+    with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+        return {row[operation['csvKey']].strip(): row for row in csv.DictReader(f)}
+
+
+def apply_operation(data, operation, lang, project_dir):
+    """연산 하나 적용 → (일치 수, 변경 수)"""
+    op = operation['op']
+    tokens = parse_path(operation['path'])
+    locations = resolve(data, tokens, create=op == 'set')
+    changes = 0
+
+    if op == 'delete':
+        # 리스트 항목은 뒤에서부터 지워야 인덱스가 어긋나지 않음
+        for parent, key in sorted(locations, key=lambda loc: loc[1] if isinstance(loc[0], list) else 0,
+                                  reverse=True):
+            del parent[key]
+            changes += 1
+    elif op == 'set':
+        by_lang = operation.get('byLang', {})
+        if 'value' not in operation and lang not in by_lang:
+            return len(locations), 0
+        value = by_lang.get(lang, operation.get('value'))
+        for parent, key in locations:
+            exists = key in parent if isinstance(parent, dict) else True
+            if exists and (operation.get('onlyMissing') or parent[key] == value):
+                continue
+            parent[key] = json.loads(json.dumps(value))
+            changes += 1
+    elif op == 'map':
+        if 'function' in operation:
+            convert = MAP_FUNCTIONS[operation['function']]
+            mapping = None
+        else:
+            mapping = operation['values']
+        for parent, key in locations:
+            old = parent[key]
+            if mapping is not None:
+                new = mapping.get(old, old) if isinstance(old, str) else old
+            else:
+                new = convert(old) if isinstance(old, str) else old
+            if new != old:
+                parent[key] = new
+                changes += 1
+    elif op == 'rename':
+        target = operation['to']
+        for parent, key in locations:
+            if not isinstance(parent, dict) or target in parent:
+                continue
+            # 키 순서 유지
+            items = [(target if k == key else k, v) for k, v in parent.items()]
+            parent.clear()
+            parent.update(items)
+            changes += 1
+    elif op == 'mergeCsv':
+        rows = load_csv_rows(project_dir, operation, lang)
+        for parent, key in locations:
+            record = parent[key]
+            if not isinstance(record, dict):
+                continue
+            row = rows.get(str(record.get(operation['key'], '')).strip())
+            if row is None:
+                continue
+            for column, field in operation['columns'].items():
+                value = (row.get(column) or '').strip()
+                if not value:
+                    continue
+                if isinstance(record.get(field), int):
+                    value = int(value)
+                if record.get(field) != value:
+                    record[field] = value
+                    changes += 1
+    return len(locations), changes
+
+
+def transform_file(project_dir, relative_path, operations):
+    """워커: 파일 하나에 해당 연산들을 순서대로 적용 → 결과 요약 (기록은 메인 프로세스에서)"""
+    project_dir = Path(project_dir)
+    path = project_dir / relative_path
+    schema = not relative_path.startswith('locales/')
+    result = {'path': relative_path, 'stats': [], 'diff': '', 'new_text': None, 'error': None}
+
+    text = path.read_text(encoding='utf-8')
+    data = json.loads(text)
+    lang = file_lang(relative_path)
+    for index, operation in operations:
+        start = time.perf_counter()
+        try:
+            matched, changed = apply_operation(data, operation, lang, project_dir)
+        except (KeyError, ValueError, OSError) as e:
+            result['error'] = f"연산 {index + 1} ({operation['op']} {operation.get('path')}): {e}"
+            return result
+        result['stats'].append((index, matched, changed, time.perf_counter() - start))
+
+    if not any(changed for _, _, changed, _ in result['stats']):
+        return result
+    if dumps(json.loads(text), schema=schema) != text:
+        result['error'] = "표준 JSON 형식이 아니라서 기록하면 서식이 바뀜 (canonical_json.py로 확인)"
+        return result
+
+    new_text = dumps(data, schema=schema)
+    result['new_text'] = new_text
+    result['diff'] = ''.join(difflib.unified_diff(
+        text.splitlines(keepends=True), new_text.splitlines(keepends=True),
+        fromfile=f'a/{relative_path}', tofile=f'b/{relative_path}', n=1))
+    return result
+
+
+def plan(project_dir, operations):
+    """연산 목록 → {파일: [(연산 번호, 연산)]} (파일 순서는 정렬, 연산 순서는 스펙 순서)"""
+    files = sorted(p.relative_to(project_dir).as_posix()
+                   for root in FILE_ROOTS for p in (project_dir / root).glob('*.json'))
+    per_file = {}
+    for index, operation in enumerate(operations):
+        if operation.get('op') not in OPS:
+            raise ValueError(f"연산 {index + 1}: 알 수 없는 op '{operation.get('op')}'")
+        parse_path(operation['path'])
+        pattern = operation['files'].replace('{lang}', '*')
+        matched = [f for f in files if fnmatch.fnmatch(f, pattern)]
+        if not matched:
+            print(f"  ⚠️  연산 {index + 1}: 대상 파일 없음 ({operation['files']})")
+        for relative in matched:
+            per_file.setdefault(relative, []).append((index, operation))
+    return per_file
+
+
+def run(project_dir, operations, write=False, jobs=None):
+    """스펙 실행 → (파일 결과 목록, 연산별 통계 {번호: [파일 수, 일치, 변경, 초]})"""
+    per_file = plan(project_dir, operations)
+    items = list(per_file.items())
+    if jobs == 1:
+        results = [transform_file(str(project_dir), relative, ops) for relative, ops in items]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(transform_file, [str(project_dir)] * len(items),
+                                    [relative for relative, _ in items], [ops for _, ops in items]))
+
+    totals = {index: [0, 0, 0, 0.0] for index in range(len(operations))}
+    for result in results:
+        for index, matched, changed, seconds in result['stats']:
+            total = totals[index]
+            total[0] += 1
+            total[1] += matched
+            total[2] += changed
+            total[3] += seconds
+        if write and result['new_text'] is not None and not result['error']:
+            with atomic_open(project_dir / result['path'], 'w', encoding='utf-8', newline='') as f:
+                f.write(result['new_text'])
+    return results, totals
+
+
+def load_spec(name, project_dir):
+    if name in PRESETS:
+        return PRESETS[name]
+    with open(name if Path(name).is_absolute() else Path.cwd() / name, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    return spec['ops'] if isinstance(spec, dict) else spec
+
+
+def main():
+    args = sys.argv[1:]
+    if '--list' in args:
+        for name, operations in PRESETS.items():
+            print(f"{name}: " + ', '.join(f"{o['op']} {o['path']}" for o in operations))
+        return
+    write = '--write' in args
+    jobs = int(args[args.index('--jobs') + 1]) if '--jobs' in args else None
+    positional = [a for i, a in enumerate(args) if not a.startswith('--') and (i == 0 or args[i - 1] != '--jobs')]
+    if len(positional) != 1:
+        print(__doc__)
+        sys.exit(1)
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    operations = load_spec(positional[0], project_dir)
+
+    print("=" * 60)
+    print(f"🔧 JSON 일괄 변환 ({'기록' if write else '미리보기'}, 연산 {len(operations)}개)")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    results, totals = run(project_dir, operations, write, jobs)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    changed = [r for r in results if r['new_text'] is not None and not r['error']]
+    errors = [r for r in results if r['error']]
+    for result in changed:
+        counts = ', '.join(f"#{i + 1} ×{c}" for i, _, c, _ in result['stats'] if c)
+        print(f"\n📝 {result['path']} ({counts})")
+        if not write:
+            print(result['diff'], end='')
+    for result in errors:
+        print(f"\n❌ {result['path']}: {result['error']}")
+
+    print(f"\n  {'#':<4}{'연산':<10}{'경로':<40}{'파일':>6}{'일치':>8}{'변경':>8}{'시간':>10}")
+    for index, operation in enumerate(operations):
+        files, matched, count, seconds = totals[index]
+        print(f"  {index + 1:<4}{operation['op']:<10}{operation['path'][:38]:<40}{files:>6}{matched:>8}"
+              f"{count:>8}{seconds * 1000:>8.1f} ms")
+    print(f"\n📊 파일 {len(results)}개: 변경 {len(changed)}개, 오류 {len(errors)}개 ({elapsed_ms:.0f} ms)")
+    if changed and not write:
+        print("\n💡 --write로 적용")
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
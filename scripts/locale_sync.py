@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+locales/*.json 번역 키 동기화
+- App.js, screens/, components/, utils/의 t('…') / tp('…') 호출 위치를 프로세스 풀로 병렬 색인
+  · 템플릿 문자열 t(`about.links.${item.key}.title`)은 패턴(about.links.*.title)으로 취급
+  · tp(key, count)는 key와 key_plural을 모두 사용
+- 9개 언어 파일을 한 번씩만 읽어 키 × 언어 표 작성
+    missing: 코드에서 쓰는데 그 언어에 없음 (en에도 없으면 화면에 키가 그대로 보임 → 오류)
+    object:  값이 문자열이 아니라 객체 (i18n.t가 키를 그대로 반환)
+    unused:  어느 호출 위치(패턴 포함)에서도 쓰지 않는 키
+- --prune: unused 키 삭제 (빈 객체도 삭제) → 앱 번들에 실제로 쓰는 키만 포함
+- --patch 파일: {"ko": {"interview.userSetAnswer": "…"}, …} 형식(점 키 또는 중첩)을 병합
+  (archive/add_translation_keys.py 같은 일회성 스크립트 대신)
+- --template 파일: 언어별 missing 키를 영어 값으로 채운 patch 파일 생성 (번역 후 --patch로 적용)
+- 기본은 미리보기, --write로 기록 / data/build/locale_coverage.json에 표 저장
+- 종료 코드 1: en에도 없는 키를 코드에서 사용
+
+사용법:
+  python locale_sync.py [--prune] [--patch 파일] [--template 파일] [--write] [--jobs N]
+"""
+
+import json
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from canonical_json import dumps, write_json
+from js_codemod import find_sources
+from text_normalize import LANGUAGES
+
+REFERENCE_LANG = 'en'
+SOURCE_TARGETS = ('App.js', 'screens', 'components', 'utils')
+PLURAL_SUFFIX = '_plural'
+
+CALL_RE = re.compile(r"""\b(tp?)\(\s*(?:'([^'\\\n]+)'|"([^"\\\n]+)"|`([^`\\\n]+)`)(\s*\+)?""")
+# t() 밖에서 키 문자열을 들고 다니는 경우 (titleKey: 'menu.x' → t(item.titleKey)) → 삭제하지 않음
+MENTION_RE = re.compile(r"""['"`]([A-Za-z]\w*(?:\.\w+)+)['"`]""")
+TEMPLATE_EXPR_RE = re.compile(r'\$\{[^}]*\}')
+
+
+def index_file(project_dir, relative_path):
+    """워커: 파일 하나 → (키 → [위치], 패턴 → [위치], t() 밖의 키 모양 문자열)"""
+    text = (Path(project_dir) / relative_path).read_text(encoding='utf-8')
+    keys = {}
+    patterns = {}
+    for match in CALL_RE.finditer(text):
+        function, single, double, template, concat = match.groups()
+        where = f"{relative_path}:{text.count(chr(10), 0, match.start()) + 1}"
+        if concat or (template is not None and '${' in template):
+            # t('languages.' + code) → languages.*
+            pattern = TEMPLATE_EXPR_RE.sub('*', single or double or template) + ('*' if concat else '')
+            names = [pattern + PLURAL_SUFFIX, pattern] if function == 'tp' else [pattern]
+            for name in names:
+                patterns.setdefault(name, []).append(where)
+            continue
+        key = single or double or template
+        names = [key, key + PLURAL_SUFFIX] if function == 'tp' else [key]
+        for name in names:
+            keys.setdefault(name, []).append(where)
+    mentions = {m.group(1) for m in MENTION_RE.finditer(text)} - set(keys)
+    return keys, patterns, mentions
+
+
+def index_sources(project_dir, jobs=None):
+    """전체 JS 트리 색인 → (키 → 위치, 패턴 → 위치, 키 모양 문자열, 파일 수)"""
+    files = [f for f in find_sources(project_dir, SOURCE_TARGETS) if f != 'utils/i18n.js']
+    keys = {}
+    patterns = {}
+    mentions = set()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for file_keys, file_patterns, file_mentions in pool.map(
+                index_file, [str(project_dir)] * len(files), files):
+            mentions |= file_mentions
+            for key, sites in file_keys.items():
+                keys.setdefault(key, []).extend(sites)
+            for pattern, sites in file_patterns.items():
+                patterns.setdefault(pattern, []).extend(sites)
+    return keys, patterns, mentions, len(files)
+
+
+def pattern_regex(patterns):
+    """'about.links.*.title' 패턴들 → 하나의 정규식 (* 는 점이 없는 한 단계)"""
+    if not patterns:
+        return None
+    return re.compile('|'.join(re.escape(p).replace(r'\*', r'[^.]+') for p in sorted(patterns)))
+
+
+def flatten(tree, prefix=''):
+    """중첩 객체 → {'a.b.c': 값} (잎만)"""
+    flat = {}
+    for key, value in tree.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, name + '.'))
+        else:
+            flat[name] = value
+    return flat
+
+
+def lookup(tree, key):
+    node = tree
+    for part in key.split('.'):
+        if not isinstance(node, dict) or part not in node:
+            return None
+        node = node[part]
+    return node
+
+
+def set_key(tree, key, value):
+    parts = key.split('.')
+    node = tree
+    for part in parts[:-1]:
+        if not isinstance(node.get(part), dict):
+            node[part] = {}
+        node = node[part]
+    if node.get(parts[-1]) == value:
+        return False
+    node[parts[-1]] = value
+    return True
+
+
+def delete_key(tree, key):
+    """키 삭제 후 비게 된 상위 객체도 삭제"""
+    parts = key.split('.')
+    path = [tree]
+    for part in parts[:-1]:
+        path.append(path[-1][part])
+    del path[-1][parts[-1]]
+    for depth in range(len(parts) - 1, 0, -1):
+        if path[depth]:
+            break
+        del path[depth - 1][parts[depth - 1]]
+
+
+def coverage(locales, keys, patterns, mentions=frozenset()):
+    """키 × 언어 표 → {'missing': {언어: [키]}, 'object': {언어: [키]}, 'unused': {언어: [키]}}"""
+    used_pattern = pattern_regex(patterns)
+    report = {'missing': {}, 'object': {}, 'unused': {}}
+    for lang, tree in locales.items():
+        missing = []
+        objects = []
+        for key in sorted(keys):
+            value = lookup(tree, key)
+            if value is None or value == '':
+                missing.append(key)
+            elif isinstance(value, dict):
+                objects.append(key)
+        unused = [key for key in flatten(tree)
+                  if key not in keys and key not in mentions and not (used_pattern and used_pattern.fullmatch(key))]
+        report['missing'][lang] = missing
+        report['object'][lang] = objects
+        report['unused'][lang] = unused
+    return report
+
+
+def read_patch(path):
+    """patch 파일 → {언어: {점 키: 값}}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        patch = json.load(f)
+    return {lang: flatten(values) for lang, values in patch.items()}
+
+
+def print_matrix(keys, locales, report):
+    """네임스페이스 × 언어: 사용 키 중 없는 수 / 안 쓰는 키 수"""
+    namespaces = sorted({key.split('.')[0] for key in keys} |
+                        {key.split('.')[0] for lang in locales for key in report['unused'][lang]})
+    languages = list(locales)
+    print(f"\n  {'네임스페이스':<20}{'사용':>6}" + ''.join(f"{lang:>9}" for lang in languages))
+    for namespace in namespaces:
+        used = sum(1 for key in keys if key.split('.')[0] == namespace)
+        row = []
+        for lang in languages:
+            missing = sum(1 for key in report['missing'][lang] if key.split('.')[0] == namespace)
+            unused = sum(1 for key in report['unused'][lang] if key.split('.')[0] == namespace)
+            row.append(f"{missing}/{unused}".rjust(9))
+        print(f"  {namespace:<20}{used:>6}" + ''.join(row))
+    print("  (칸: 없음/안 씀)")
+
+
+def main():
+    args = sys.argv[1:]
+    write = '--write' in args
+    jobs = int(args[args.index('--jobs') + 1]) if '--jobs' in args else None
+    patch_file = args[args.index('--patch') + 1] if '--patch' in args else None
+    template_file = args[args.index('--template') + 1] if '--template' in args else None
+    patch = read_patch(patch_file) if patch_file else {}
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    locales_dir = project_dir / 'locales'
+
+    print("=" * 60)
+    print("🌐 번역 키 동기화")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    keys, patterns, mentions, file_count = index_sources(project_dir, jobs)
+    index_ms = (time.perf_counter() - start) * 1000
+    texts = {lang: (locales_dir / f'{lang}.json').read_text(encoding='utf-8') for lang in LANGUAGES}
+    locales = {lang: json.loads(text) for lang, text in texts.items()}
+    report = coverage(locales, keys, patterns, mentions)
+    print(f"🔍 JS 파일 {file_count}개: 키 {len(keys)}개, 패턴 {len(patterns)}개 ({index_ms:.0f} ms)")
+    for pattern in sorted(patterns):
+        print(f"  • {pattern}  ({', '.join(patterns[pattern][:2])})")
+
+    print_matrix(keys, locales, report)
+
+    # en에도 없으면 화면에 키 문자열이 그대로 보임 (이번 patch로 추가하는 키는 제외)
+    broken = [key for key in report['missing'][REFERENCE_LANG]
+              if not key.endswith(PLURAL_SUFFIX) and key not in patch.get(REFERENCE_LANG, {})]
+    if broken:
+        print(f"\n❌ {REFERENCE_LANG}에도 없는 키 {len(broken)}개:")
+        for key in broken:
+            print(f"  • {key}  ({keys[key][0]})")
+    for lang in LANGUAGES:
+        if report['object'][lang]:
+            print(f"\n⚠️  {lang}: 값이 객체인 키 {', '.join(report['object'][lang])}")
+
+    write_json(project_dir / 'data' / 'build' / 'locale_coverage.json', {
+        'keys': {key: sites for key, sites in sorted(keys.items())},
+        'patterns': {pattern: sites for pattern, sites in sorted(patterns.items())},
+        **report,
+    }, pretty=False, schema=False)
+
+    if template_file:
+        english = locales[REFERENCE_LANG]
+        template = {lang: {key: lookup(english, key) for key in report['missing'][lang]
+                           if isinstance(lookup(english, key), str)}
+                    for lang in LANGUAGES if lang != REFERENCE_LANG}
+        write_json(Path(template_file), {lang: keys for lang, keys in template.items() if keys}, schema=False)
+        print(f"\n📝 번역 템플릿: {template_file} ({sum(len(v) for v in template.values())}개)")
+
+    changes = {lang: [] for lang in LANGUAGES}
+    if patch:
+        for lang, values in patch.items():
+            if lang not in locales:
+                print(f"  ⚠️  patch: 알 수 없는 언어 {lang}")
+                continue
+            for key, value in values.items():
+                if set_key(locales[lang], key, value):
+                    changes[lang].append(f"+ {key}")
+    if '--prune' in args:
+        for lang in LANGUAGES:
+            for key in report['unused'][lang]:
+                if key in patch.get(lang, {}):
+                    continue
+                delete_key(locales[lang], key)
+                changes[lang].append(f"- {key}")
+
+    if not patch and '--prune' not in args:
+        total_unused = sum(len(v) for v in report['unused'].values())
+        total_missing = sum(len(v) for v in report['missing'].values())
+        print(f"\n📊 없는 키 {total_missing}건, 안 쓰는 키 {total_unused}건 (--prune으로 삭제)")
+        sys.exit(1 if broken else 0)
+
+    print(f"\n  {'언어':<6}{'추가':>6}{'삭제':>6}{'크기':>10}{'→':>3}{'':>8}")
+    before_total = after_total = 0
+    for lang in LANGUAGES:
+        new_text = dumps(locales[lang], schema=False)
+        before = len(texts[lang].encode('utf-8'))
+        after = len(new_text.encode('utf-8'))
+        before_total += before
+        after_total += after
+        added = sum(1 for c in changes[lang] if c.startswith('+'))
+        print(f"  {lang:<6}{added:>6}{len(changes[lang]) - added:>6}{before:>10,}{'→':>3}{after:>8,}")
+        if write and new_text != texts[lang]:
+            write_json(locales_dir / f'{lang}.json', locales[lang], schema=False)
+    print(f"\n📊 합계 {before_total:,} → {after_total:,} B ({1 - after_total / before_total:.1%} 감소)")
+    if write:
+        print("💾 locales/*.json 기록 완료")
+    else:
+        print("\n💡 --write로 적용")
+    sys.exit(1 if broken else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ import json
 import re
 from pathlib import Path
 
+from canonical_json import write_json
+
 def extract_question_numbers(content_list):
     """content에서 Q.숫자 패턴을 찾아서 질문 번호 추출"""
     question_nums = []
@@ -69,8 +71,7 @@ def merge_story_with_questions(story_file, output_file):
     # JSON 저장
     print(f"\n💾 저장: {output_file.name}")
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(new_story, f, ensure_ascii=False, indent=2)
+    write_json(output_file, new_story)
     
     # 통계
     print(f"\n📊 통계:")
@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+언어별 콘텐츠 파이프라인 실행기 (스테이지 DAG)
+- 각 스테이지는 스크립트와 입력 / 출력 파일을 선언 (경로는 프로젝트 루트 기준)
+  출력 → 입력 관계로 의존성을 자동으로 연결
+- 스테이지 키 = 스크립트 내용 + 입력 파일 내용의 SHA-256
+  · 키와 출력 파일이 마지막 실행과 같으면 건너뜀
+  · 입력을 제자리에서 고치는 스테이지는 실행 전 키로 캐시하고, 실행 후 키로 최신 여부 판단
+  · 예전에 같은 키로 만든 출력이 캐시에 있으면 스크립트를 실행하지 않고 복원
+  · 출력은 data/build/pipeline/artifacts/<sha256>에 내용 주소로 보관
+- 서로 의존하지 않는 언어 / 스테이지는 동시에 실행
+- 스테이지별 상태와 소요 시간 보고, --dry-run은 다시 만들 스테이지만 표시
+- in_process=True면 스크립트 모듈을 한 번만 import하고 main()을 다시 호출
+  (watch_pipeline.py가 사용: 컴파일된 정규식 등 모듈 상태가 유지됨)
+
+사용법:
+  python pipeline.py [--dry-run] [--jobs N] [스테이지 이름 또는 언어 코드 ...]
+"""
+
+import contextlib
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from canonical_json import write_json
+
+SCRIPT_WORK = 'data/script_work'
+COMPLETED = 'data/Completed'
+ENGLISH_CSV = f'{COMPLETED}/Complete_128_Questions - English.csv'
+STORY_FILE = 'data/question_story.json'
+
+LANGUAGE_NAMES = {
+    'en': 'English', 'ko': 'Korean', 'es': 'Spanish', 'zh': 'Chinese', 'tl': 'Filipino',
+    'vi': 'Vietnamese', 'hi': 'Hindi', 'fr': 'French', 'ar': 'Arabic',
+}
+
+CONVERTERS = {
+    'en': 'convert_128_csv_to_json.py',
+    'ko': 'convert_128_korean_to_json.py',
+    'es': 'convert_128_spanish_to_json.py',
+    'zh': 'convert_128_chinese_to_json.py',
+    'tl': 'convert_128_filipino_to_json.py',
+    'vi': 'convert_128_vietnamese_to_json.py',
+    'hi': 'convert_128_hindi_to_json.py',
+    'fr': 'convert_128_french_to_json.py',
+    'ar': 'convert_128_arabic_to_json.py',
+}
+
+# 원문 CSV → 라인 병합 TXT → 표 CSV → 보정 CSV 단계가 있는 언어
+TABLE_LANGUAGES = {
+    'fr': ('merge_french_line_breaks.py', 'parse_french_to_table.py', 'fix_french_table.py'),
+    'hi': ('merge_hindi_line_breaks.py', 'parse_hindi_to_table.py', 'fix_hindi_table.py'),
+    'vi': ('merge_vietnamese_line_breaks.py', 'parse_vietnamese_to_table.py', 'fix_vietnamese_table.py'),
+}
+
+
+def stage(name, script, inputs, outputs, lang=None, action='script'):
+    return {'name': name, 'script': script, 'inputs': inputs, 'outputs': outputs, 'lang': lang, 'action': action}
+
+
+def completed_csv(lang):
+    return f'{COMPLETED}/Complete_128_Questions - {LANGUAGE_NAMES[lang]}.csv'
+
+
+def work_file(lang, suffix):
+    return f'{SCRIPT_WORK}/2025_CitizenTest_128 - {LANGUAGE_NAMES[lang]}{suffix}'
+
+
+def default_stages():
+    """현재 저장소의 언어별 스크립트 체인"""
+    stages = []
+
+    for lang, (merge_script, parse_script, fix_script) in TABLE_LANGUAGES.items():
+        stages.append(stage(f'{lang}:merge', merge_script, [work_file(lang, '.csv')],
+                            [work_file(lang, '_Merged.txt')], lang))
+        stages.append(stage(f'{lang}:table', parse_script, [work_file(lang, '_Merged.txt')],
+                            [work_file(lang, '_Table.csv')], lang))
+        stages.append(stage(f'{lang}:fix', fix_script, [work_file(lang, '_Table.csv'), ENGLISH_CSV],
+                            [work_file(lang, '_Table_Fixed.csv')], lang))
+        # 보정 CSV를 Completed/로 옮기던 수작업 단계
+        stages.append(stage(f'{lang}:promote', None, [work_file(lang, '_Table_Fixed.csv')],
+                            [completed_csv(lang)], lang, action='copy'))
+
+    stages.append(stage('ko:merge', 'merge_korean_line_breaks.py', [work_file('ko', '.csv')],
+                        [work_file('ko', '_Merged.txt')], 'ko'))
+    stages.append(stage('ko:table', 'parse_korean_to_table_v2.py', [work_file('ko', '_Merged.txt')],
+                        [work_file('ko', '_Table_V2.csv')], 'ko'))
+    stages.append(stage('ko:fix', 'fix_missing_korean_questions.py', [work_file('ko', '_Table_V2.csv')],
+                        [work_file('ko', '_Table_Fixed.csv'), completed_csv('ko')], 'ko'))
+
+    for lang, converter in CONVERTERS.items():
+        stages.append(stage(f'{lang}:json', converter, [completed_csv(lang)],
+                            [f'data/interview_questions_{lang}.json'], lang))
+
+    question_files = [f'data/interview_questions_{lang}.json' for lang in CONVERTERS]
+    stages.append(stage('all:strip_wrong_rationales', 'remove_wrong_answer_rationales.py',
+                        question_files, question_files))
+
+    bundle_files = [f'data/bundles/interview_questions_{lang}.min.json' for lang in CONVERTERS]
+    stages.append(stage('all:bundles', 'build_question_bundles.py', question_files + [STORY_FILE],
+                        bundle_files + ['data/bundles/question_story.min.json', 'data/bundles/strings.min.json',
+                                        'data/bundles/manifest.json']))
+
+    stages.append(stage('all:story_spans', 'story_spans.py', question_files + [STORY_FILE],
+                        ['data/bundles/question_story.spans.min.json']))
+
+    locale_files = [f'locales/{lang}.json' for lang in CONVERTERS]
+    stages.append(stage('all:n400_bundles', 'build_n400_bundles.py',
+                        ['data/n400_questions.json', 'data/n400_explanations.json'],
+                        [f'data/bundles/n400_{lang}.min.json' for lang in ('en', 'ko')]))
+    stages.append(stage('all:dynamic_answers', 'build_dynamic_answers.py',
+                        ['data/us_political_data.json', 'utils/questionProcessor.js'] + locale_files,
+                        ['data/bundles/dynamic_answers.min.json']))
+    stages.append(stage('all:zip_range_index', 'zip_range_index.py',
+                        ['data/us_representatives.json', 'data/us_political_data.json'],
+                        [f'data/build/{name}.{suffix}' for name in ('zip_to_district', 'zip_to_state')
+                         for suffix in ('json', 'zipidx')]))
+    stages.append(stage('all:zip_states', 'build_zip_state_table.py',
+                        ['data/zip_prefix_states.csv', 'data/us_political_data.json', 'data/us_representatives.json'],
+                        ['data/bundles/zip_states.min.json']))
+    return stages
+
+
+def file_sha256(path):
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def local_imports(script_dir, script):
+    """
+    스크립트가 (간접적으로) import하는 scripts/ 안의 모듈 파일 이름 집합
+    (text_normalize.py를 고치면 그것을 쓰는 스테이지의 키도 바뀌도록)
+    """
+    found = set()
+    pending = [script]
+    while pending:
+        current = pending.pop()
+        with open(script_dir / current, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=current)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                helper = f"{name.split('.')[0]}.py"
+                if helper != script and helper not in found and (script_dir / helper).exists():
+                    found.add(helper)
+                    pending.append(helper)
+    return found
+
+
+class Pipeline:
+    """스테이지 목록으로 DAG를 만들고 캐시 상태를 관리"""
+
+    def __init__(self, stages, project_dir, cache_dir=None, in_process=False):
+        self.stages = {s['name']: s for s in stages}
+        self.project_dir = Path(project_dir)
+        self.in_process = in_process
+        self.modules = {}
+        # in-process 스테이지는 sys.argv / 작업 디렉터리 / stdout을 바꾸므로 한 번에 하나만 실행
+        self.main_lock = threading.Lock()
+        self.script_dir = self.project_dir / 'scripts'
+        self.cache_dir = Path(cache_dir) if cache_dir else self.project_dir / 'data' / 'build' / 'pipeline'
+        self.artifact_dir = self.cache_dir / 'artifacts'
+        self.log_dir = self.cache_dir / 'logs'
+        self.state_file = self.cache_dir / 'state.json'
+        self.state = self._load_state()
+
+        # 출력 파일 → 그 파일을 쓰는 스테이지들 (선언 순서)
+        self.writers = {}
+        for s in stages:
+            for output in s['outputs']:
+                self.writers.setdefault(output, []).append(s['name'])
+
+        self.deps = {name: set() for name in self.stages}
+        for name, s in self.stages.items():
+            for path in s['inputs']:
+                for writer in self.writers.get(path, []):
+                    if writer != name:
+                        self.deps[name].add(writer)
+        self.dependents = {name: set() for name in self.stages}
+        for name, deps in self.deps.items():
+            for dep in deps:
+                self.dependents[dep].add(name)
+
+        # 하위 스테이지가 제자리에서 다시 쓰는 출력 (이 스테이지의 최신 여부 판단에서 제외)
+        self.rewritten = {name: set() for name in self.stages}
+        for name, s in self.stages.items():
+            for output in s['outputs']:
+                for writer in self.writers[output]:
+                    if writer != name and name in self.deps[writer]:
+                        self.rewritten[name].add(output)
+
+    def _load_state(self):
+        if self.state_file.exists():
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {'nodes': {}, 'memo': {}}
+
+    def save_state(self):
+        write_json(self.state_file, self.state)
+
+    def path(self, relative):
+        return self.project_dir / relative
+
+    def select(self, targets):
+        """대상(스테이지 이름 / 언어 코드)과 그 상위 스테이지들"""
+        if not targets:
+            return set(self.stages)
+        selected = set()
+        pending = [name for name, s in self.stages.items() if name in targets or s['lang'] in targets]
+        while pending:
+            name = pending.pop()
+            if name not in selected:
+                selected.add(name)
+                pending.extend(self.deps[name])
+        return selected
+
+    def topological_order(self, names):
+        order = []
+        visited = set()
+
+        def visit(name):
+            if name in visited:
+                return
+            visited.add(name)
+            for dep in sorted(self.deps[name]):
+                if dep in names:
+                    visit(dep)
+            order.append(name)
+
+        for name in self.stages:
+            if name in names:
+                visit(name)
+        return order
+
+    def stage_key(self, name):
+        """스크립트 + 스크립트가 import하는 scripts/ 모듈 + 입력 내용 키 (입력이 없으면 None)"""
+        s = self.stages[name]
+        sha256 = hashlib.sha256(s['action'].encode('utf-8'))
+        if s['script']:
+            sha256.update(self.code_digest(s['script']).encode('ascii'))
+        for relative in sorted(set(s['inputs'])):
+            path = self.path(relative)
+            if not path.exists():
+                return None
+            sha256.update(relative.encode('utf-8'))
+            sha256.update(file_sha256(path).encode('ascii'))
+        return sha256.hexdigest()
+
+    def code_digest(self, script):
+        """스크립트와 그 로컬 import 모듈들의 내용 해시"""
+        sha256 = hashlib.sha256()
+        for relative in [script] + sorted(local_imports(self.script_dir, script)):
+            sha256.update(relative.encode('utf-8'))
+            sha256.update(file_sha256(self.script_dir / relative).encode('ascii'))
+        return sha256.hexdigest()
+
+    def missing_inputs(self, name):
+        return [p for p in self.stages[name]['inputs'] if not self.path(p).exists()]
+
+    def is_up_to_date(self, name, key):
+        record = self.state['nodes'].get(name)
+        if not record or key not in (record['key'], record.get('keyAfter')):
+            return False
+        for relative, digest in record['outputs'].items():
+            if relative in self.rewritten[name]:
+                if not self.path(relative).exists():
+                    return False
+                continue
+            path = self.path(relative)
+            if not path.exists() or file_sha256(path) != digest:
+                return False
+        return True
+
+    def memoized_outputs(self, name, key):
+        """같은 키로 만든 출력이 캐시에 모두 있으면 {경로: sha256}"""
+        outputs = self.state['memo'].get(name, {}).get(key)
+        if outputs and all((self.artifact_dir / digest).exists() for digest in outputs.values()):
+            return outputs
+        return None
+
+    def status(self, name):
+        """(상태, 키): up-to-date | cached | stale | blocked"""
+        missing = self.missing_inputs(name)
+        if missing:
+            return 'blocked', None
+        key = self.stage_key(name)
+        if self.is_up_to_date(name, key):
+            return 'up-to-date', key
+        if self.memoized_outputs(name, key):
+            return 'cached', key
+        return 'stale', key
+
+    def restore(self, outputs):
+        for relative, digest in outputs.items():
+            target = self.path(relative)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self.artifact_dir / digest, target)
+
+    def execute(self, name):
+        """스테이지 실행 (스크립트는 프로젝트 루트에서 별도 프로세스로)"""
+        s = self.stages[name]
+        if s['action'] == 'copy':
+            target = self.path(s['outputs'][0])
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self.path(s['inputs'][0]), target)
+            return
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        log_file = self.log_dir / f"{name.replace(':', '_')}.log"
+        with open(log_file, 'w', encoding='utf-8') as log:
+            if self.in_process:
+                returncode = self._call_main(s['script'], log)
+            else:
+                returncode = subprocess.run(
+                    [sys.executable, str(self.script_dir / s['script'])],
+                    cwd=self.project_dir, stdout=log, stderr=subprocess.STDOUT,
+                    env={**os.environ, 'PYTHONIOENCODING': 'utf-8'},
+                ).returncode
+        if returncode != 0:
+            raise RuntimeError(f"종료 코드 {returncode} (로그: {log_file})")
+        missing = [p for p in s['outputs'] if not self.path(p).exists()]
+        if missing:
+            raise RuntimeError(f"출력 파일이 만들어지지 않음: {missing}")
+
+    def _call_main(self, script, log):
+        """
+        스크립트의 main()을 현재 프로세스에서 호출 (모듈은 처음 한 번만 import)
+        스크립트 파일이 바뀌면 다시 import
+        출력은 로그로, sys.argv / 작업 디렉터리는 별도 프로세스와 같게 맞춤
+        (프로세스 전역 상태라서 --jobs N이어도 main_lock으로 직렬 실행)
+        """
+        with self.main_lock:
+            return self._call_main_locked(script, log)
+
+    def _call_main_locked(self, script, log):
+        path = self.script_dir / script
+        digest = self.code_digest(script)
+        cached = self.modules.get(script)
+        if not cached or cached[0] != digest:
+            if str(self.script_dir) not in sys.path:
+                sys.path.insert(0, str(self.script_dir))
+            # 도우미 모듈(text_normalize 등)이 바뀌었을 수 있으므로 sys.modules에서 빼고 새로 import
+            for helper in local_imports(self.script_dir, script):
+                sys.modules.pop(helper[:-len('.py')], None)
+            spec = importlib.util.spec_from_file_location(f'pipeline_stage_{path.stem}', path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self.modules[script] = cached = (digest, module)
+
+        saved_argv, saved_cwd = sys.argv, os.getcwd()
+        sys.argv = [str(path)]
+        os.chdir(self.project_dir)
+        try:
+            with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+                cached[1].main()
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        finally:
+            sys.argv = saved_argv
+            os.chdir(saved_cwd)
+        return 0
+
+    def record(self, name, key):
+        """실행 결과 출력을 캐시에 보관하고 상태 기록"""
+        self.artifact_dir.mkdir(parents=True, exist_ok=True)
+        outputs = {}
+        for relative in self.stages[name]['outputs']:
+            path = self.path(relative)
+            digest = file_sha256(path)
+            artifact = self.artifact_dir / digest
+            if not artifact.exists():
+                shutil.copyfile(path, artifact)
+            outputs[relative] = digest
+        self.state['nodes'][name] = {'key': key, 'keyAfter': self.stage_key(name), 'outputs': outputs}
+        self.state['memo'].setdefault(name, {})[key] = outputs
+
+    def run_node(self, name):
+        """스테이지 하나 처리 → (상태, 소요 시간, 메시지)"""
+        start = time.perf_counter()
+        state, key = self.status(name)
+        if state == 'blocked':
+            return 'blocked', 0.0, ', '.join(self.missing_inputs(name))
+        if state == 'up-to-date':
+            return 'up-to-date', time.perf_counter() - start, ''
+        if state == 'cached':
+            outputs = self.memoized_outputs(name, key)
+            self.restore(outputs)
+            self.state['nodes'][name] = {'key': key, 'keyAfter': self.stage_key(name), 'outputs': outputs}
+            return 'restored', time.perf_counter() - start, ''
+
+        self.execute(name)
+        self.record(name, key)
+        return 'ran', time.perf_counter() - start, ''
+
+    def run(self, names, jobs):
+        """의존성이 끝난 스테이지부터 병렬 실행"""
+        order = self.topological_order(names)
+        remaining = {name: {d for d in self.deps[name] if d in names} for name in order}
+        results = {}
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            while remaining or running:
+                ready = [name for name in order if name in remaining and not remaining[name]]
+                for name in ready:
+                    del remaining[name]
+                    unmet = [d for d in self.deps[name] if d in results and not self.satisfied(d, results[d][0])]
+                    failed_deps = [d for d in unmet if results[d][0] in ('failed', 'skipped')]
+                    if failed_deps:
+                        results[name] = ('skipped', 0.0, f"상위 스테이지 실패: {', '.join(sorted(failed_deps))}")
+                    elif unmet:
+                        results[name] = ('blocked', 0.0, f"상위 스테이지 입력 없음: {', '.join(sorted(unmet))}")
+                    if unmet:
+                        self._finish(name, remaining)
+                        continue
+                    running[pool.submit(self.run_node, name)] = name
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        results[name] = ('failed', 0.0, str(e))
+                    self._finish(name, remaining)
+
+        self.save_state()
+        return [(name, *results[name]) for name in order]
+
+    def satisfied(self, name, state):
+        """
+        상위 스테이지 결과로 하위 스테이지를 실행해도 되는지
+        blocked / skipped여도 선언한 출력이 모두 있으면 (예: data/Completed/ 없이 커밋된 JSON만 있는 트리) 통과
+        """
+        if state == 'failed':
+            return False
+        if state in ('blocked', 'skipped'):
+            return all(self.path(p).exists() for p in self.stages[name]['outputs'])
+        return True
+
+    def _finish(self, name, remaining):
+        for dependent in self.dependents[name]:
+            if dependent in remaining:
+                remaining[dependent].discard(name)
+
+    def dry_run(self, names):
+        """실행하지 않고 각 스테이지가 어떻게 처리될지 표시"""
+        plan = []
+        rebuilding = set()
+        for name in self.topological_order(names):
+            upstream = [d for d in self.deps[name] if d in rebuilding]
+            if upstream:
+                plan.append((name, 'stale', f"상위 스테이지 재생성: {', '.join(sorted(upstream))}"))
+                rebuilding.add(name)
+                continue
+            state, _ = self.status(name)
+            detail = ''
+            if state == 'blocked':
+                detail = f"입력 없음: {', '.join(self.missing_inputs(name))}"
+            elif state == 'stale':
+                record = self.state['nodes'].get(name)
+                detail = '처음 실행' if not record else '입력/스크립트/출력 변경'
+            if state in ('stale', 'cached'):
+                rebuilding.add(name)
+            plan.append((name, state, detail))
+        return plan
+
+
+STATUS_ICONS = {
+    'ran': '🔨', 'restored': '♻️ ', 'cached': '♻️ ', 'up-to-date': '✅', 'stale': '🔨',
+    'blocked': '⛔', 'skipped': '⏭️ ', 'failed': '❌',
+}
+
+
+def main():
+    args = sys.argv[1:]
+    dry_run = '--dry-run' in args
+    jobs = os.cpu_count() or 4
+    if '--jobs' in args:
+        jobs = int(args[args.index('--jobs') + 1])
+        del args[args.index('--jobs'):args.index('--jobs') + 2]
+    targets = [a for a in args if a != '--dry-run']
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    pipeline = Pipeline(default_stages(), project_dir)
+    names = pipeline.select(targets)
+
+    print("=" * 60)
+    print(f"🎯 콘텐츠 파이프라인 {'(dry run)' if dry_run else ''}")
+    print("=" * 60)
+
+    if dry_run:
+        plan = pipeline.dry_run(names)
+        for name, state, detail in plan:
+            print(f"  {STATUS_ICONS[state]} {name:<32} {state:<11} {detail}")
+        rebuild = sum(1 for _, state, _ in plan if state in ('stale', 'cached'))
+        print(f"\n📊 {len(plan)}개 스테이지 중 다시 만들 스테이지 {rebuild}개")
+        return
+
+    start = time.perf_counter()
+    results = pipeline.run(names, jobs)
+    wall = time.perf_counter() - start
+
+    print(f"  {'스테이지':<32}{'상태':<12}{'시간':>10}")
+    for name, state, seconds, message in results:
+        print(f"  {STATUS_ICONS[state]} {name:<30}{state:<12}{seconds * 1000:>8.0f} ms  {message}")
+
+    busy = sum(seconds for _, _, seconds, _ in results)
+    counts = {}
+    for _, state, _, _ in results:
+        counts[state] = counts.get(state, 0) + 1
+    print(f"\n📊 " + ', '.join(f"{state} {count}" for state, count in counts.items()))
+    print(f"⏱️  전체 {wall * 1000:.0f} ms (스테이지 합계 {busy * 1000:.0f} ms, 동시 실행 {jobs})")
+    if counts.get('failed'):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
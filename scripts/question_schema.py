@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+interview_questions_*.json 스키마 검증
+- 선언형 스키마(QUESTION_SCHEMA)를 모듈 로드 시 한 번 필드별 검사 함수로 컴파일
+- 문제 은행 단위 규칙: id 1..N 연속, 문제 수, 일반 문제의 오답 보기(쉼표 그룹) 3개 이상,
+  지역별 답 문제(DYNAMIC_QUESTION_IDS)의 안내 문구 / 일반 문제에 안내 문구만 있는 경우(경고)
+- 파일을 다시 읽지 않고 메모리의 문제 리스트를 바로 검증 (변환 스크립트에서 사용)
+- 첫 오류에서 멈추지 않고 모든 오류 / 경고를 수집
+- CLI는 모든 언어를 병렬로 검증
+
+사용법:
+  python question_schema.py [lang ...]
+"""
+
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from text_normalize import LANGUAGES, PLACEHOLDER_RE, split_answer_groups
+
+EXPECTED_QUESTION_COUNT = 128
+MIN_WRONG_GROUPS = 3
+
+# utils/questionProcessor.js의 LOCATION_DEPENDENT_QUESTIONS와 같아야 함
+DYNAMIC_QUESTION_IDS = {23, 29, 30, 38, 39, 61, 62}
+
+ANSWER_SCHEMA = {
+    'text': {'type': str, 'nonempty': True},
+    'rationale': {'type': str, 'nonempty': True},
+}
+
+WRONG_ANSWER_SCHEMA = {
+    'text': {'type': str, 'nonempty': True},
+}
+
+QUESTION_SCHEMA = {
+    'id': {'type': int},
+    'category': {'type': str, 'nonempty': True},
+    'subcategory': {'type': str, 'nonempty': True},
+    'question': {'type': str, 'nonempty': True},
+    'correctAnswers': {'type': list, 'min_items': 1, 'items': ANSWER_SCHEMA},
+    'wrongAnswers': {'type': list, 'min_items': 1, 'items': WRONG_ANSWER_SCHEMA},
+}
+
+TYPE_NAMES = {str: '문자열', int: '정수', list: '리스트', dict: '객체'}
+
+
+def _compile_field(name, spec):
+    """필드 스펙 하나를 검사 함수로 (값, 경로, report) → None"""
+    expected_type = spec['type']
+    type_name = TYPE_NAMES[expected_type]
+    nonempty = spec.get('nonempty', False)
+    min_items = spec.get('min_items')
+    item_check = _compile_object(spec['items']) if 'items' in spec else None
+
+    if expected_type is str:
+        def check(value, path, report):
+            if not isinstance(value, str):
+                report(path, f"{type_name}이 아님 ({type(value).__name__})")
+            elif nonempty and not value.strip():
+                report(path, "비어 있음")
+        return check
+
+    if expected_type is int:
+        def check(value, path, report):
+            if not isinstance(value, int) or isinstance(value, bool):
+                report(path, f"{type_name}가 아님 ({type(value).__name__})")
+        return check
+
+    def check(value, path, report):
+        if not isinstance(value, list):
+            report(path, f"{type_name}가 아님 ({type(value).__name__})")
+            return
+        if min_items is not None and len(value) < min_items:
+            report(path, f"항목이 {min_items}개 미만 ({len(value)}개)")
+        if item_check:
+            for i, item in enumerate(value):
+                item_check(item, f"{path}[{i}]", report)
+    return check
+
+
+def _compile_object(schema):
+    """객체 스키마를 검사 함수로 (필수 필드, 알 수 없는 필드, 필드별 검사)"""
+    field_checks = [(name, _compile_field(name, spec)) for name, spec in schema.items()]
+    allowed = frozenset(schema)
+
+    def check(obj, path, report):
+        if not isinstance(obj, dict):
+            report(path, f"객체가 아님 ({type(obj).__name__})")
+            return
+        prefix = f"{path}." if path else ''
+        for name, field_check in field_checks:
+            if name not in obj:
+                report(f"{prefix}{name}", "필드 없음")
+            else:
+                field_check(obj[name], f"{prefix}{name}", report)
+        for name in obj.keys() - allowed:
+            report(f"{prefix}{name}", "알 수 없는 필드")
+    return check
+
+
+check_question = _compile_object(QUESTION_SCHEMA)
+
+
+def validate_questions(questions, lang=None, expected_count=EXPECTED_QUESTION_COUNT):
+    """
+    문제 리스트 검증
+    반환: [{'lang', 'id', 'path', 'severity'('error'|'warning'), 'message'}, ...]
+    """
+    issues = []
+
+    def issue(qid, path, message, severity='error'):
+        issues.append({'lang': lang, 'id': qid, 'path': path, 'severity': severity, 'message': message})
+
+    if not isinstance(questions, list):
+        issue(None, '', "최상위가 리스트가 아님")
+        return issues
+    if expected_count is not None and len(questions) != expected_count:
+        issue(None, '', f"문제 수가 {expected_count}개가 아님: {len(questions)}개")
+
+    for position, q in enumerate(questions, 1):
+        qid = q.get('id') if isinstance(q, dict) else None
+        check_question(q, '', lambda path, message: issue(qid, path, message))
+        if not isinstance(q, dict):
+            continue
+
+        if qid != position:
+            issue(qid, 'id', f"{position}번째 문제의 id가 {qid}")
+
+        answers = [a.get('text', '') for a in q.get('correctAnswers') or [] if isinstance(a, dict)]
+        first = answers[0] if answers and isinstance(answers[0], str) else ''
+        if qid in DYNAMIC_QUESTION_IDS:
+            # 정답 / 오답은 앱에서 사용자 지역으로 채우므로 안내 문구만 확인
+            if '[' not in first or ']' not in first:
+                issue(qid, 'correctAnswers[0].text', "지역별 답 문제에 [안내 문구]가 없음", 'warning')
+            continue
+        if first and PLACEHOLDER_RE.match(first):
+            # 대법원장처럼 시기에 따라 바뀌는 답은 안내 문구만 있을 수 있음
+            issue(qid, 'correctAnswers[0].text', "지역별 답 문제가 아닌데 정답이 [안내 문구]뿐임", 'warning')
+
+        wrong_groups = sum(
+            len(split_answer_groups(w.get('text') or ''))
+            for w in q.get('wrongAnswers') or [] if isinstance(w, dict) and isinstance(w.get('text'), str)
+        )
+        if wrong_groups < MIN_WRONG_GROUPS:
+            issue(qid, 'wrongAnswers', f"오답 보기가 {MIN_WRONG_GROUPS}개 미만 ({wrong_groups}개)")
+
+    return issues
+
+
+def format_issue(issue):
+    where = f"Q.{issue['id']}" if issue['id'] is not None else '전체'
+    lang = f"[{issue['lang']}] " if issue['lang'] else ''
+    path = f" {issue['path']}" if issue['path'] else ''
+    return f"{lang}{where}{path}: {issue['message']}"
+
+
+def print_validation(issues, limit=10):
+    """검증 결과 출력 (오류가 없으면 True, 경고는 실패로 치지 않음)"""
+    errors = [i for i in issues if i['severity'] == 'error']
+    warnings = [i for i in issues if i['severity'] == 'warning']
+
+    print(f"\n🔍 JSON 검증 중...")
+    if errors:
+        print(f"❌ 검증 실패: 오류 {len(errors)}개")
+        for error in errors[:limit]:
+            print(f"  • {format_issue(error)}")
+        if len(errors) > limit:
+            print(f"  ... 외 {len(errors) - limit}개 오류")
+    for warning in warnings[:limit]:
+        print(f"  ⚠️  {format_issue(warning)}")
+    if len(warnings) > limit:
+        print(f"  ... 외 {len(warnings) - limit}개 경고")
+    if not errors:
+        print("✅ 검증 성공: 모든 검사 통과!")
+    return not errors
+
+
+def validate_file(path, lang=None):
+    """파일 하나 로드 후 검증 (병렬 작업 단위)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            questions = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        return [{'lang': lang, 'id': None, 'path': '', 'severity': 'error', 'message': f"읽기 실패: {e}"}]
+    return validate_questions(questions, lang)
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    languages = sys.argv[1:] or LANGUAGES
+
+    print("=" * 60)
+    print("🔍 문제 은행 스키마 검증")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    paths = [data_dir / f'interview_questions_{lang}.json' for lang in languages]
+    with ProcessPoolExecutor() as pool:
+        results = list(pool.map(validate_file, paths, languages))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    failed = 0
+    for lang, issues in zip(languages, results):
+        errors = [i for i in issues if i['severity'] == 'error']
+        warnings = [i for i in issues if i['severity'] == 'warning']
+        status = '❌' if errors else ('⚠️ ' if warnings else '✅')
+        print(f"\n{status} {lang}: 오류 {len(errors)}개, 경고 {len(warnings)}개")
+        for item in (errors + warnings)[:10]:
+            print(f"  • {format_issue(item)}")
+        if len(errors) + len(warnings) > 10:
+            print(f"  ... 외 {len(errors) + len(warnings) - 10}개")
+        failed += bool(errors)
+
+    print(f"\n📊 {len(languages)}개 언어 중 실패 {failed}개 ({elapsed_ms:.0f} ms)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+정치 데이터 갱신 (us_political_data.json, us_representatives.json)
+- 로컬 CSV 폴더에서 읽기:
+    officeholders.csv   office,state,district,name
+                        office: president / vice_president / speaker / governor / senator / representative
+                        (federal은 state 비움, representative는 district='NY-12' / 'AK-AL')
+    zip_districts.csv   zip,district      (선거구가 여러 개인 ZIP은 행을 여러 개, 순서 유지) - 없으면 현재 값 유지
+    zip_states.csv      zip,state         (zipToState.exactMappings) - 없으면 현재 값 유지
+- 검증: 주 코드 / 선거구 형식 / 주마다 주지사 1명, 상원의원 2명 / federal 3개 / ZIP 형식 / 없는 선거구 참조
+- 현재 파일과의 구조화된 diff (섹션별 추가 · 삭제 · 변경)
+- apply: 바뀐 파일만 기록 (lastUpdated, dataSize 갱신, 기존 서식 유지)하고
+  바뀐 섹션이 영향을 주는 색인만 pipeline.py로 다시 생성
+    federal / 주지사 / 상원의원 → all:dynamic_answers (주 × 언어 답 오버레이)
+    ZIP ↔ 선거구 / ZIP ↔ 주      → all:zip_range_index, all:zip_states
+    무엇이든 바뀌면              → data/build/rep_lookup.json (rep_lookup_service)
+  스테이지별 시간 / 출력 크기 보고
+
+사용법:
+  python refresh_political_data.py export <CSV 폴더>   # 현재 파일 → CSV (갱신 작업의 출발점)
+  python refresh_political_data.py diff <CSV 폴더>     # 검증 + diff (파일은 그대로)
+  python refresh_political_data.py apply <CSV 폴더> [--jobs N]
+"""
+
+import copy
+import csv
+import json
+import re
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+from canonical_json import PRETTY_INDENT, atomic_open
+
+POLITICAL_FILE = 'us_political_data.json'
+REPRESENTATIVES_FILE = 'us_representatives.json'
+
+FEDERAL_OFFICES = {'president': 'president', 'vice_president': 'vicePresident', 'speaker': 'speakerOfHouse'}
+STATE_OFFICES = ('governor', 'senator')
+OFFICES = set(FEDERAL_OFFICES) | set(STATE_OFFICES) | {'representative'}
+SENATORS_PER_STATE = 2
+
+# 한 줄에 여러 항목씩 적던 딕셔너리 (키 → 한 줄 항목 수)
+PACKED_KEYS = {'exactMappings': 5}
+
+DISTRICT_RE = re.compile(r'^([A-Z]{2})-(\d+|AL)$')
+ZIP_RE = re.compile(r'^\d{5}$')
+
+# diff 섹션 → 다시 만들 파이프라인 스테이지
+AFFECTED_STAGES = {
+    'federal': ['all:dynamic_answers'],
+    'governor': ['all:dynamic_answers'],
+    'senators': ['all:dynamic_answers'],
+    'representatives': [],
+    'zipToDistrict': ['all:zip_range_index', 'all:zip_states'],
+    'zipToState': ['all:zip_range_index', 'all:zip_states'],
+}
+
+
+def dumps_political(data, level=0, key=None):
+    """
+    손으로 관리하던 서식 그대로: indent 2, 스칼라만 담긴 리스트는 한 줄 (["A", "B"]),
+    PACKED_KEYS의 딕셔너리는 한 줄에 N개씩 (값이 바뀌면 줄바꿈)
+    기존 파일을 읽어서 다시 쓰면 바이트가 같음
+    """
+    if isinstance(data, dict) and data and key in PACKED_KEYS:
+        pad = ' ' * (PRETTY_INDENT * (level + 1))
+        lines = []
+        row = []
+        for k, v in data.items():
+            if row and (len(row) == PACKED_KEYS[key] or data[row[-1]] != v):
+                lines.append(row)
+                row = []
+            row.append(k)
+        lines.append(row)
+        body = ',\n'.join(pad + ', '.join(f'{json.dumps(k, ensure_ascii=False)}: '
+                                          f'{json.dumps(data[k], ensure_ascii=False)}' for k in row)
+                          for row in lines)
+        return '{\n' + body + '\n' + ' ' * (PRETTY_INDENT * level) + '}'
+    if isinstance(data, dict) and data:
+        pad = ' ' * (PRETTY_INDENT * (level + 1))
+        items = [f'{pad}{json.dumps(k, ensure_ascii=False)}: {dumps_political(v, level + 1, k)}' for k, v in data.items()]
+        return '{\n' + ',\n'.join(items) + '\n' + ' ' * (PRETTY_INDENT * level) + '}'
+    if isinstance(data, list) and data and all(not isinstance(v, (dict, list)) for v in data):
+        return '[' + ', '.join(json.dumps(v, ensure_ascii=False) for v in data) + ']'
+    if isinstance(data, list) and data:
+        pad = ' ' * (PRETTY_INDENT * (level + 1))
+        items = [pad + dumps_political(v, level + 1) for v in data]
+        return '[\n' + ',\n'.join(items) + '\n' + ' ' * (PRETTY_INDENT * level) + ']'
+    return json.dumps(data, ensure_ascii=False, allow_nan=False)
+
+
+def read_csv(path):
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return [(line_number, {k: (v or '').strip() for k, v in row.items()})
+                for line_number, row in enumerate(csv.DictReader(f), 2)]
+
+
+def load_sources(source_dir, political, representatives):
+    """
+    CSV 폴더 → (갱신된 두 파일 데이터, 오류 목록, 경고 목록)
+    오류가 있으면 apply하지 않음
+    """
+    errors = []
+    warnings = []
+    states = political['states']
+    new_political = copy.deepcopy(political)
+    new_representatives = copy.deepcopy(representatives)
+
+    federal = {}
+    state_offices = {code: {'governor': [], 'senator': []} for code in states}
+    districts = {}
+    for line_number, row in read_csv(source_dir / 'officeholders.csv'):
+        where = f"officeholders.csv:{line_number}"
+        office, state, name = row['office'].lower(), row['state'].upper(), row['name']
+        if office not in OFFICES:
+            errors.append(f"{where}: 알 수 없는 직책 '{row['office']}'")
+            continue
+        if not name:
+            errors.append(f"{where}: 이름 없음")
+            continue
+        if office in FEDERAL_OFFICES:
+            if office in federal:
+                errors.append(f"{where}: {office} 중복 ('{federal[office]}', '{name}')")
+            federal[office] = name
+        elif office in STATE_OFFICES:
+            if state not in states:
+                errors.append(f"{where}: 알 수 없는 주 '{row['state']}'")
+                continue
+            state_offices[state][office].append(name)
+        else:
+            match = DISTRICT_RE.match(row['district'].upper())
+            if not match or match.group(1) not in states:
+                errors.append(f"{where}: 선거구 형식 오류 '{row['district']}'")
+                continue
+            district = row['district'].upper()
+            if state and state != match.group(1):
+                errors.append(f"{where}: 주 '{state}'와 선거구 '{district}' 불일치")
+            if district in districts:
+                errors.append(f"{where}: 선거구 {district} 중복 ('{districts[district]}', '{name}')")
+            districts[district] = name
+
+    for office, key in FEDERAL_OFFICES.items():
+        if office not in federal:
+            errors.append(f"officeholders.csv: {office} 없음")
+        else:
+            new_political['federal'][key] = federal[office]
+    for code, offices in state_offices.items():
+        if len(offices['governor']) != 1:
+            errors.append(f"officeholders.csv: {code} 주지사 {len(offices['governor'])}명 (1명이어야 함)")
+        else:
+            new_political['states'][code]['governor'] = offices['governor'][0]
+        if len(offices['senator']) != SENATORS_PER_STATE:
+            errors.append(f"officeholders.csv: {code} 상원의원 {len(offices['senator'])}명 "
+                          f"({SENATORS_PER_STATE}명이어야 함)")
+        else:
+            new_political['states'][code]['senators'] = offices['senator']
+
+    # 기존 선거구 순서 유지, 새 선거구는 뒤에
+    order = [d for d in representatives['representatives'] if d in districts]
+    order += [d for d in districts if d not in representatives['representatives']]
+    new_representatives['representatives'] = {d: districts[d] for d in order}
+    removed = sorted(set(representatives['representatives']) - set(districts))
+    if removed:
+        warnings.append(f"CSV에 없는 선거구 {len(removed)}개 (선거구 재조정?): {', '.join(removed[:10])}")
+
+    zip_districts_file = source_dir / 'zip_districts.csv'
+    if zip_districts_file.exists():
+        mappings = {}
+        for line_number, row in read_csv(zip_districts_file):
+            where = f"zip_districts.csv:{line_number}"
+            zip_code, district = row['zip'], row['district'].upper()
+            if not ZIP_RE.match(zip_code):
+                errors.append(f"{where}: ZIP 형식 오류 '{zip_code}'")
+                continue
+            if district not in districts:
+                errors.append(f"{where}: officeholders.csv에 없는 선거구 '{district}'")
+                continue
+            values = mappings.setdefault(zip_code, [])
+            if district in values:
+                warnings.append(f"{where}: {zip_code} → {district} 중복 행")
+            else:
+                values.append(district)
+        new_representatives['zipToDistrict']['mappings'] = {
+            z: v[0] if len(v) == 1 else v for z, v in sorted(mappings.items())
+        }
+    else:
+        stale = sorted({d for v in representatives['zipToDistrict']['mappings'].values()
+                        for d in (v if isinstance(v, list) else [v])} - set(districts))
+        if stale:
+            errors.append(f"zip_districts.csv 없이 현재 ZIP 매핑 유지, 없어진 선거구 참조: {', '.join(stale[:10])}")
+
+    zip_states_file = source_dir / 'zip_states.csv'
+    if zip_states_file.exists():
+        exact = {}
+        for line_number, row in read_csv(zip_states_file):
+            where = f"zip_states.csv:{line_number}"
+            zip_code, state = row['zip'], row['state'].upper()
+            if not ZIP_RE.match(zip_code) or state not in states:
+                errors.append(f"{where}: 형식 오류 '{zip_code},{row['state']}'")
+            elif exact.get(zip_code, state) != state:
+                errors.append(f"{where}: {zip_code}이(가) {exact[zip_code]}와 {state}에 중복 지정됨")
+            else:
+                exact[zip_code] = state
+        new_political['zipToState']['exactMappings'] = exact
+
+    return new_political, new_representatives, errors, warnings
+
+
+def diff_mapping(section, old, new):
+    """{키: 값} 두 개 → [(섹션, 키, 이전 값, 새 값)] (추가: 이전 None, 삭제: 새 None)"""
+    changes = []
+    for key in list(old) + [k for k in new if k not in old]:
+        before, after = old.get(key), new.get(key)
+        if before != after:
+            changes.append((section, key, before, after))
+    return changes
+
+
+def compute_diff(political, representatives, new_political, new_representatives):
+    changes = diff_mapping('federal', political['federal'], new_political['federal'])
+    for office in ('governor', 'senators'):
+        changes += diff_mapping(office,
+                                {c: s.get(office) for c, s in political['states'].items()},
+                                {c: s.get(office) for c, s in new_political['states'].items()})
+    changes += diff_mapping('representatives', representatives['representatives'],
+                            new_representatives['representatives'])
+    changes += diff_mapping('zipToDistrict', representatives['zipToDistrict']['mappings'],
+                            new_representatives['zipToDistrict']['mappings'])
+    changes += diff_mapping('zipToState', political['zipToState']['exactMappings'],
+                            new_political['zipToState']['exactMappings'])
+    return changes
+
+
+def print_diff(changes, limit=20):
+    by_section = {}
+    for change in changes:
+        by_section.setdefault(change[0], []).append(change)
+    for section, items in by_section.items():
+        added = sum(1 for c in items if c[2] is None)
+        removed = sum(1 for c in items if c[3] is None)
+        print(f"\n📝 {section}: 추가 {added}, 삭제 {removed}, 변경 {len(items) - added - removed}")
+        for _, key, before, after in items[:limit]:
+            if before is None:
+                print(f"  + {key}: {json.dumps(after, ensure_ascii=False)}")
+            elif after is None:
+                print(f"  - {key}: {json.dumps(before, ensure_ascii=False)}")
+            else:
+                print(f"  ~ {key}: {json.dumps(before, ensure_ascii=False)} → {json.dumps(after, ensure_ascii=False)}")
+        if len(items) > limit:
+            print(f"  ... 외 {len(items) - limit}건")
+
+
+def write_political(path, data):
+    """lastUpdated / dataSize를 갱신하여 기존 서식으로 기록 → 바이트 수"""
+    data['lastUpdated'] = date.today().isoformat()
+    data['dataSize'] = '약 0KB'
+    size = len((dumps_political(data) + '\n').encode('utf-8'))
+    data['dataSize'] = f"약 {max(1, round(size / 1024))}KB"
+    text = dumps_political(data) + '\n'
+    with atomic_open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    return len(text.encode('utf-8'))
+
+
+def export_sources(source_dir, political, representatives):
+    """현재 파일 → CSV 세 개"""
+    source_dir.mkdir(parents=True, exist_ok=True)
+    with open(source_dir / 'officeholders.csv', 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['office', 'state', 'district', 'name'])
+        for office, key in FEDERAL_OFFICES.items():
+            writer.writerow([office, '', '', political['federal'][key]])
+        for code, info in political['states'].items():
+            writer.writerow(['governor', code, '', info['governor']])
+            for senator in info['senators']:
+                writer.writerow(['senator', code, '', senator])
+        for district, name in representatives['representatives'].items():
+            writer.writerow(['representative', district.split('-')[0], district, name])
+    with open(source_dir / 'zip_districts.csv', 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['zip', 'district'])
+        for zip_code, value in representatives['zipToDistrict']['mappings'].items():
+            for district in (value if isinstance(value, list) else [value]):
+                writer.writerow([zip_code, district])
+    with open(source_dir / 'zip_states.csv', 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['zip', 'state'])
+        writer.writerows(political['zipToState']['exactMappings'].items())
+
+
+def rebuild_indexes(project_dir, sections, jobs):
+    """바뀐 섹션이 영향을 주는 색인만 다시 생성 → [(이름, 상태, 초, 출력 바이트)]"""
+    from pipeline import Pipeline, default_stages
+    from rep_lookup_service import load_index
+
+    targets = sorted({name for section in sections for name in AFFECTED_STAGES[section]})
+    report = []
+    if targets:
+        pipeline = Pipeline(default_stages(), project_dir, in_process=True)
+        for name, state, seconds, message in pipeline.run(targets, jobs):
+            size = sum(pipeline.path(p).stat().st_size for p in pipeline.stages[name]['outputs']
+                       if pipeline.path(p).exists())
+            report.append((name, state, seconds, size, message))
+
+    start = time.perf_counter()
+    load_index(project_dir / 'data')
+    index_file = project_dir / 'data' / 'build' / 'rep_lookup.json'
+    report.append(('rep_lookup', 'ran', time.perf_counter() - start, index_file.stat().st_size, ''))
+    return report
+
+
+def main():
+    args = sys.argv[1:]
+    jobs = int(args[args.index('--jobs') + 1]) if '--jobs' in args else 4
+    positional = [a for i, a in enumerate(args) if not a.startswith('--') and (i == 0 or args[i - 1] != '--jobs')]
+    if len(positional) != 2 or positional[0] not in ('export', 'diff', 'apply'):
+        print(__doc__)
+        sys.exit(1)
+    command, source_dir = positional[0], Path(positional[1])
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+
+    print("=" * 60)
+    print(f"🏛️  정치 데이터 갱신 ({command})")
+    print("=" * 60)
+
+    with open(data_dir / POLITICAL_FILE, 'r', encoding='utf-8') as f:
+        political = json.load(f)
+    with open(data_dir / REPRESENTATIVES_FILE, 'r', encoding='utf-8') as f:
+        representatives = json.load(f)
+
+    if command == 'export':
+        export_sources(source_dir, political, representatives)
+        print(f"💾 {source_dir}: officeholders.csv, zip_districts.csv, zip_states.csv")
+        return
+
+    start = time.perf_counter()
+    new_political, new_representatives, errors, warnings = load_sources(source_dir, political, representatives)
+    for warning in warnings:
+        print(f"⚠️  {warning}")
+    if errors:
+        print(f"\n❌ 검증 실패 {len(errors)}건:")
+        for error in errors[:20]:
+            print(f"  • {error}")
+        sys.exit(1)
+    print(f"✅ 검증 통과 ({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    changes = compute_diff(political, representatives, new_political, new_representatives)
+    if not changes:
+        print("\n✅ 현재 파일과 같음 - 바꿀 것 없음")
+        return
+    print_diff(changes)
+    sections = {change[0] for change in changes}
+
+    if command == 'diff':
+        print(f"\n💡 apply로 기록 (다시 만들 색인: "
+              f"{', '.join(sorted({n for s in sections for n in AFFECTED_STAGES[s]} | {'rep_lookup'}))})")
+        return
+
+    print()
+    if sections & {'federal', 'governor', 'senators', 'zipToState'}:
+        size = write_political(data_dir / POLITICAL_FILE, new_political)
+        print(f"💾 {POLITICAL_FILE}: {size:,} B")
+    if sections & {'representatives', 'zipToDistrict'}:
+        size = write_political(data_dir / REPRESENTATIVES_FILE, new_representatives)
+        print(f"💾 {REPRESENTATIVES_FILE}: {size:,} B")
+
+    start = time.perf_counter()
+    report = rebuild_indexes(project_dir, sections, jobs)
+    print(f"\n  {'색인':<28}{'상태':<12}{'시간':>10}{'크기':>12}")
+    for name, state, seconds, size, message in report:
+        print(f"  {name:<28}{state:<12}{seconds * 1000:>8.0f} ms{size:>10,} B  {message}")
+    print(f"\n⏱️  색인 재생성 {(time.perf_counter() - start) * 1000:.0f} ms")
+    if any(state == 'failed' for _, state, _, _, _ in report):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 
+from canonical_json import write_json
+
 def backup_file(json_file_path, backup_dir):
     """파일 백업"""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -46,8 +48,7 @@ def remove_wrong_answer_rationales(json_file_path, backup_dir):
                     rationale_count += 1
     
     # 파일 저장
-    with open(json_file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    write_json(json_file_path, data)
     
     new_size = os.path.getsize(json_file_path)
     size_reduction = original_size - new_size
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 ZIP → 주 → 선거구 → 하원의원 / 상원의원 / 주지사 조회 서비스
+- us_representatives.json, us_political_data.json을 미리 색인으로 컴파일
+  (ZIP 매핑은 zip_range_index의 구간 색인, 원본 해시가 바뀌면 자동으로 다시 컴파일)
+- ZIP → 주는 bundles/zip_states.min.json (build_zip_state_table.py)의 접두어 테이블로 항상 하나로 결정
+- 라이브러리: RepresentativeLookup.lookup / lookup_batch (프로세스 내 LRU 캐시)
+- HTTP 서버 (표준 라이브러리):
+    GET  /lookup?zip=10001[&state=NY]
+    GET  /lookup/batch?zips=10001,11361     POST /lookup/batch  {"zips": [...], "state": "NY"}
+    GET  /getall_mems.php?zip=10001&output=json   ← whoismyrepresentative.com 응답 형식 그대로
+    GET  /stats
+  테스트에서 LocationManager.setRepresentativeApiBase('http://127.0.0.1:8765')로 외부 API 대신 사용
+
+사용법:
+  python rep_lookup_service.py build
+  python rep_lookup_service.py lookup <ZIP> [ZIP ...] [--state NY]
+  python rep_lookup_service.py serve [--host 127.0.0.1] [--port 8765]
+  python rep_lookup_service.py benchmark
+"""
+
+import hashlib
+import json
+import sys
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from build_zip_state_table import state_for_zip
+from canonical_json import write_json
+from zip_range_index import build_range_index, lookup as range_lookup, to_json_arrays
+
+INDEX_VERSION = 2
+SOURCE_FILES = ('us_representatives.json', 'us_political_data.json', 'bundles/zip_states.min.json')
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+LRU_SIZE = 4096
+MAX_BATCH = 1000
+AT_LARGE_SUFFIX = '-AL'
+
+
+def source_hashes(data_dir):
+    return {name: hashlib.sha256((data_dir / name).read_bytes()).hexdigest() for name in SOURCE_FILES}
+
+
+def compile_index(data_dir):
+    """원본 JSON 세 개 → 조회용 색인 딕셔너리"""
+    with open(data_dir / 'us_representatives.json', 'r', encoding='utf-8') as f:
+        representatives = json.load(f)
+    with open(data_dir / 'us_political_data.json', 'r', encoding='utf-8') as f:
+        political = json.load(f)
+    with open(data_dir / 'bundles' / 'zip_states.min.json', 'r', encoding='utf-8') as f:
+        zip_states = json.load(f)
+
+    zip_to_state = political.get('zipToState', {})
+
+    return {
+        'version': INDEX_VERSION,
+        'sources': source_hashes(data_dir),
+        'districts': to_json_arrays(build_range_index(representatives['zipToDistrict']['mappings'])),
+        'states': to_json_arrays(build_range_index(zip_to_state.get('exactMappings', {}))),
+        'zipStates': zip_states,
+        'representatives': representatives['representatives'],
+        'stateInfo': political['states'],
+        'federal': political.get('federal', {}),
+    }
+
+
+def load_index(data_dir, index_file=None, rebuild=False):
+    """컴파일된 색인 로드 (없거나 원본이 바뀌었으면 다시 컴파일하여 저장)"""
+    index_file = index_file or data_dir / 'build' / 'rep_lookup.json'
+    if not rebuild and index_file.exists():
+        with open(index_file, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') == INDEX_VERSION and index.get('sources') == source_hashes(data_dir):
+            return index
+
+    index = compile_index(data_dir)
+    write_json(index_file, index, pretty=False, schema=False)
+    return index
+
+
+def normalize_zip(zip_code):
+    """'10001', '10001-1234', 10001 → '10001' (형식이 틀리면 None)"""
+    text = str(zip_code).strip().split('-')[0]
+    if len(text) < 5 and text.isdigit():
+        text = text.zfill(5)
+    return text if len(text) == 5 and text.isdigit() else None
+
+
+class RepresentativeLookup:
+    """ZIP 조회 라이브러리 (결과 딕셔너리는 캐시와 공유되므로 수정하지 말 것)"""
+
+    def __init__(self, index, cache_size=LRU_SIZE):
+        self.index = index
+        self._cached_lookup = lru_cache(maxsize=cache_size)(self._lookup)
+
+    def resolve_state(self, zip_code, districts=()):
+        """
+        ZIP → 주 코드
+        정확한 매핑 → 선거구 접두어 → ZIP 접두어 테이블 순서
+        테이블에도 없는 ZIP(USPS 미사용 접두어)은 (None, 선거구 주 후보 또는 None)
+        주 정보(stateInfo)가 없는 코드(DC, 해외 영토, 군사 우편 AE/AA/AP)는 주로 보지 않음
+        """
+        state = range_lookup(self.index['states'], zip_code)
+        if state:
+            return state, None
+        prefixes = sorted({district.split('-')[0] for district in districts} & self.index['stateInfo'].keys())
+        if len(prefixes) == 1:
+            return prefixes[0], None
+
+        state = state_for_zip(self.index['zipStates'], zip_code)
+        if state in self.index['stateInfo']:
+            return state, None
+        return None, prefixes or None
+
+    def _lookup(self, zip_code, state_code):
+        districts = range_lookup(self.index['districts'], zip_code) or []
+        if isinstance(districts, str):
+            districts = [districts]
+
+        state, candidates = self.resolve_state(zip_code, districts)
+        if state is None and state_code and (candidates is None or state_code in candidates):
+            state, candidates = state_code, None
+        if state_code:
+            districts = [d for d in districts if d.startswith(state_code + '-')] or districts
+
+        representatives = [
+            {'district': district, 'name': self.index['representatives'][district]}
+            for district in districts if district in self.index['representatives']
+        ]
+        # 전역구(at-large) 주(AK, DE, ND, SD, VT, WY)는 ZIP 구간이 없어도 의원이 한 명
+        at_large = f'{state}{AT_LARGE_SUFFIX}'
+        if state and not representatives and at_large in self.index['representatives']:
+            representatives = [{'district': at_large, 'name': self.index['representatives'][at_large]}]
+        if state is None and not representatives and not candidates:
+            return None
+
+        info = self.index['stateInfo'].get(state, {}) if state else {}
+        result = {
+            'zip': zip_code,
+            'state': state,
+            'stateName': info.get('name'),
+            'representatives': representatives,
+            'multiple': len(representatives) > 1,
+            'senators': info.get('senators', []),
+            'governor': info.get('governor'),
+            'capital': info.get('capital'),
+            'source': 'local',
+        }
+        if candidates:
+            result['stateCandidates'] = candidates
+        return result
+
+    def lookup(self, zip_code, state_code=None):
+        """ZIP 하나 조회 (형식이 틀리거나 아무 정보도 없으면 None)"""
+        zip_code = normalize_zip(zip_code)
+        if zip_code is None:
+            return None
+        return self._cached_lookup(zip_code, state_code.upper() if state_code else None)
+
+    def lookup_batch(self, zip_codes, state_code=None):
+        return {str(z): self.lookup(z, state_code) for z in zip_codes}
+
+    def getall_mems(self, zip_code):
+        """whoismyrepresentative.com getall_mems.php 응답 형식"""
+        result = self.lookup(zip_code)
+        members = []
+        if result:
+            for rep in result['representatives']:
+                state, _, district = rep['district'].partition('-')
+                members.append({'name': rep['name'], 'party': '', 'state': state, 'district': district,
+                                'phone': '', 'office': '', 'link': ''})
+            for senator in result['senators']:
+                members.append({'name': senator, 'party': '', 'state': result['state'], 'district': '',
+                                'phone': '', 'office': '', 'link': ''})
+        return {'results': members}
+
+    def stats(self):
+        info = self._cached_lookup.cache_info()
+        return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'maxsize': info.maxsize}
+
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status, payload):
+            body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _batch(self, zips, state):
+            if len(zips) > MAX_BATCH:
+                self._send(400, {'error': f'한 번에 최대 {MAX_BATCH}개'})
+            else:
+                self._send(200, {'results': service.lookup_batch(zips, state)})
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            if url.path == '/lookup':
+                result = service.lookup(query.get('zip', ''), query.get('state'))
+                self._send(200 if result else 404, result or {'error': 'not found'})
+            elif url.path == '/lookup/batch':
+                self._batch([z for z in query.get('zips', '').split(',') if z], query.get('state'))
+            elif url.path == '/getall_mems.php':
+                self._send(200, service.getall_mems(query.get('zip', '')))
+            elif url.path == '/stats':
+                self._send(200, service.stats())
+            else:
+                self._send(404, {'error': 'not found'})
+
+        def do_POST(self):
+            if urlparse(self.path).path != '/lookup/batch':
+                self._send(404, {'error': 'not found'})
+                return
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                payload = json.loads(self.rfile.read(length) or b'{}')
+                zips = [str(z) for z in payload.get('zips', [])]
+            except (ValueError, AttributeError):
+                self._send(400, {'error': 'JSON 본문 {"zips": [...]} 필요'})
+                return
+            self._batch(zips, payload.get('state'))
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def make_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """테스트에서 port=0으로 만들면 빈 포트를 사용 (server.server_address로 확인)"""
+    return ThreadingHTTPServer((host, port), make_handler(service))
+
+
+def benchmark(service):
+    zips = sorted(set(service.index['districts']['starts']))
+    probes = [f'{z:05d}' for z in zips] + [f'{n:05d}' for n in range(0, 100000, 997)]
+
+    start = time.perf_counter()
+    for zip_code in probes:
+        service._lookup(zip_code, None)
+    cold_us = (time.perf_counter() - start) * 1e6 / len(probes)
+
+    for zip_code in probes:
+        service.lookup(zip_code)
+    start = time.perf_counter()
+    for zip_code in probes:
+        service.lookup(zip_code)
+    warm_us = (time.perf_counter() - start) * 1e6 / len(probes)
+
+    print(f"\n⏱️  조회 {len(probes)}개: 색인 {cold_us:.2f} µs / LRU {warm_us:.2f} µs (ZIP당)")
+
+    import threading
+    import urllib.request
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f'http://{server.server_address[0]}:{server.server_address[1]}'
+    rounds = 50
+    start = time.perf_counter()
+    for i in range(rounds):
+        with urllib.request.urlopen(f'{base}/getall_mems.php?zip={probes[i]}&output=json') as response:
+            response.read()
+    http_ms = (time.perf_counter() - start) * 1000 / rounds
+    server.shutdown()
+    print(f"⏱️  로컬 HTTP 왕복: {http_ms:.2f} ms (요청당)")
+
+
+def main():
+    args = sys.argv[1:]
+    command = args[0] if args else 'build'
+    if command not in ('build', 'lookup', 'serve', 'benchmark'):
+        print(__doc__)
+        sys.exit(1)
+
+    def option(name, default=None):
+        return args[args.index(name) + 1] if name in args else default
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+
+    print("=" * 60)
+    print("🏛️  로컬 ZIP → 의원 조회 서비스")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    index = load_index(data_dir, rebuild=command == 'build')
+    service = RepresentativeLookup(index)
+    print(f"📦 색인: 선거구 구간 {len(index['districts']['starts'])}개, 주 {len(index['stateInfo'])}개, "
+          f"의원 {len(index['representatives'])}명 ({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    if command == 'lookup':
+        state = option('--state')
+        skip = {args.index('--state') + 1} if '--state' in args else set()
+        for i, zip_code in enumerate(args[1:], 1):
+            if zip_code.startswith('--') or i in skip:
+                continue
+            print(f"\n📮 {zip_code}: {json.dumps(service.lookup(zip_code, state), ensure_ascii=False, indent=2)}")
+    elif command == 'serve':
+        host = option('--host', DEFAULT_HOST)
+        port = int(option('--port', DEFAULT_PORT))
+        server = make_server(service, host, port)
+        print(f"🌐 http://{host}:{server.server_address[1]} (Ctrl+C로 종료)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 종료")
+    elif command == 'benchmark':
+        benchmark(service)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스토리 content_<lang> 조각 배열을 영어(content_en)에 정렬하고 최소 수정(edit)을 계산
+- 조각을 토큰으로 나눔
+    answer 조각                      → a (story_spans.QuestionLinker로 문제 id)
+    normal 조각 안의 '(Q.35)'         → q (문제 번호 앵커)
+    normal 조각 안의 '[回答：…]' 등   → a (인라인 answer, 번역 과정에서 answer 조각이 본문에 섞인 것)
+    나머지 normal 텍스트              → n
+- 섹션마다 Needleman-Wunsch 전역 정렬 (토큰 서명 튜플 기준 lru_cache로 비용 / 정렬 결과 재사용)
+    같은 Q 번호끼리만 일치, 같은 문제 id의 answer끼리는 가산점, answer ↔ normal 대체는 금지
+- 수정 종류
+    split   인라인 answer가 영어 answer와 정렬됨 → normal 조각을 normal / answer / normal로 나눔
+    demote  영어에 짝이 없는 answer 조각 → normal로 바꾸고 앞뒤 normal과 합침
+    missing 영어 answer에 짝이 없음 → 번역이 필요하므로 보고만 함
+  영어 섹션에 answer가 하나도 없으면 (영어 쪽 표시 누락) 수정하지 않고 reference-unmarked로 보고
+- 모든 언어를 프로세스 풀로 한 번에 처리, data/build/story_alignment.json에 수정 목록 저장
+- --apply: split / demote를 question_story.json에 적용
+    split은 인라인 answer의 괄호 표시('[回答：…]', '[الإجابة: …]'의 '[', 라벨과 ':', ']')를 지우고
+    안쪽 답만 answer 조각으로 남김, demote는 텍스트 그대로 유형만 변경
+    적용 후 본문이 '원래 본문에서 split 구간의 괄호 표시만 지운 것'과 같은지 확인하고, 다르면 중단
+
+사용법:
+  python story_aligner.py [--apply] [--jobs N] [언어 ...]
+"""
+
+import json
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from answer_grader import build_index
+from canonical_json import write_json
+from story_spans import NO_QUESTION, QuestionLinker
+from story_stream import iter_story
+from text_normalize import LANGUAGES
+
+REFERENCE_LANG = 'en'
+
+INLINE_ANSWER_RE = re.compile(r'\[(?:[^\[\]:：]{1,20}[:：]\s*)?([^\[\]]+?)\s*\]')
+LABELED_ANSWER_RE = re.compile(r'^\[[^\[\]:：]{1,20}[:：]')
+MARKER_RE = re.compile(r'Q\.\s*(\d+)')
+TOKEN_RE = re.compile(f'{INLINE_ANSWER_RE.pattern}|{MARKER_RE.pattern}')
+
+GAP_COST = {'n': 0.5, 'a': 1.0, 'q': 1.0}
+MISMATCH = float('inf')
+SAME_QUESTION_BONUS = -0.5
+OTHER_QUESTION_COST = 1.0
+# 라벨 없는 괄호('[residents of their state]')는 영어 본문에도 있으므로 남는 경우 비용 없음
+BRACKET_GAP_COST = 0.0
+
+
+def tokenize_segments(segments, lang, question_ids, linker):
+    """
+    조각 리스트 → 토큰 리스트
+    토큰: {'kind', 'segment', 'start', 'end', 'text', 'qid', 'inline', 'labeled'}
+    """
+    tokens = []
+    for index, segment in enumerate(segments):
+        text = segment.get('text', '')
+        if segment.get('type') == 'answer':
+            qid = linker.link(lang, question_ids, text) if linker else NO_QUESTION
+            tokens.append({'kind': 'a', 'segment': index, 'start': 0, 'end': len(text), 'text': text,
+                           'qid': qid, 'inline': False, 'labeled': False})
+            continue
+        position = 0
+        for match in TOKEN_RE.finditer(text):
+            if match.start() > position:
+                tokens.append({'kind': 'n', 'segment': index, 'start': position, 'end': match.start(),
+                               'text': text[position:match.start()], 'qid': NO_QUESTION,
+                               'inline': False, 'labeled': False})
+            if match.group(1) is not None:
+                answer = match.group(1)
+                qid = linker.link(lang, question_ids, answer) if linker else NO_QUESTION
+                tokens.append({'kind': 'a', 'segment': index, 'start': match.start(), 'end': match.end(),
+                               'text': answer, 'qid': qid, 'inline': True,
+                               'labeled': bool(LABELED_ANSWER_RE.match(match.group()))})
+            else:
+                tokens.append({'kind': 'q', 'segment': index, 'start': match.start(), 'end': match.end(),
+                               'text': match.group(), 'qid': int(match.group(2)), 'inline': False,
+                               'labeled': False})
+            position = match.end()
+        if position < len(text) or not text:
+            tokens.append({'kind': 'n', 'segment': index, 'start': position, 'end': len(text),
+                           'text': text[position:], 'qid': NO_QUESTION, 'inline': False, 'labeled': False})
+    return tokens
+
+
+def signature(token):
+    """정렬 비용에 영향을 주는 값만 (lru_cache 키)"""
+    return token['kind'], token['qid'], token['inline'] and not token['labeled']
+
+
+@lru_cache(maxsize=None)
+def pair_cost(a, b):
+    kind_a, qid_a, _ = a
+    kind_b, qid_b, _ = b
+    if kind_a != kind_b:
+        return MISMATCH
+    if kind_a == 'q':
+        return 0.0 if qid_a == qid_b else MISMATCH
+    if kind_a == 'a' and qid_a and qid_b:
+        return SAME_QUESTION_BONUS if qid_a == qid_b else OTHER_QUESTION_COST
+    return 0.0
+
+
+def gap_cost(sig):
+    kind, _, bare_bracket = sig
+    return BRACKET_GAP_COST if bare_bracket else GAP_COST[kind]
+
+
+@lru_cache(maxsize=4096)
+def align(reference, target):
+    """
+    두 서명 튜플의 전역 정렬 → (비용, ((기준 위치 또는 None, 대상 위치 또는 None), ...))
+    같은 섹션 구조가 다시 나오면 (재실행, 다른 언어) 캐시에서 바로 반환
+    """
+    rows, cols = len(reference), len(target)
+    cost = [[0.0] * (cols + 1) for _ in range(rows + 1)]
+    move = [[''] * (cols + 1) for _ in range(rows + 1)]
+    for i in range(1, rows + 1):
+        cost[i][0] = cost[i - 1][0] + gap_cost(reference[i - 1])
+        move[i][0] = 'up'
+    for j in range(1, cols + 1):
+        cost[0][j] = cost[0][j - 1] + gap_cost(target[j - 1])
+        move[0][j] = 'left'
+    for i in range(1, rows + 1):
+        for j in range(1, cols + 1):
+            options = (
+                (cost[i - 1][j - 1] + pair_cost(reference[i - 1], target[j - 1]), 'diag'),
+                (cost[i - 1][j] + gap_cost(reference[i - 1]), 'up'),
+                (cost[i][j - 1] + gap_cost(target[j - 1]), 'left'),
+            )
+            cost[i][j], move[i][j] = min(options)
+
+    pairs = []
+    i, j = rows, cols
+    while i or j:
+        step = move[i][j]
+        if step == 'diag':
+            pairs.append((i - 1, j - 1))
+            i, j = i - 1, j - 1
+        elif step == 'up':
+            pairs.append((i - 1, None))
+            i -= 1
+        else:
+            pairs.append((None, j - 1))
+            j -= 1
+    return cost[rows][cols], tuple(reversed(pairs))
+
+
+def section_edits(reference_tokens, target_tokens):
+    """정렬 결과 → (비용, 수정 목록)"""
+    total, pairs = align(tuple(map(signature, reference_tokens)), tuple(map(signature, target_tokens)))
+    edits = []
+    for ref_index, target_index in pairs:
+        ref = reference_tokens[ref_index] if ref_index is not None else None
+        token = target_tokens[target_index] if target_index is not None else None
+        if ref and token and ref['kind'] == 'a' and token['inline']:
+            edits.append({'op': 'split', 'segment': token['segment'], 'start': token['start'],
+                          'end': token['end'], 'text': token['text'], 'qid': token['qid'] or ref['qid']})
+        elif token and ref is None and token['kind'] == 'a' and not token['inline']:
+            edits.append({'op': 'demote', 'segment': token['segment'], 'text': token['text']})
+        elif ref and token is None and ref['kind'] == 'a' and not ref['inline']:
+            edits.append({'op': 'missing', 'reference': ref['text'], 'qid': ref['qid']})
+    return total, edits
+
+
+def align_language(story_file, data_dir, lang):
+    """워커: 한 언어의 모든 섹션 정렬 → (언어, {'챕터.섹션': {'cost', 'edits'} 또는 {'skipped'}}, 초)"""
+    start = time.perf_counter()
+    index = build_index(Path(data_dir), [REFERENCE_LANG, lang])
+    linker = QuestionLinker(index)
+    results = {}
+    with open(story_file, 'r', encoding='utf-8') as f:
+        for event in iter_story(f, languages={REFERENCE_LANG, lang}, fields={'content', 'linkedQuestions'}):
+            if event[0] != 'section':
+                continue
+            _, chapter_id, section_index, section = event
+            key = f'{chapter_id}.{section_index}'
+            reference = section['content'].get(REFERENCE_LANG)
+            target = section['content'].get(lang)
+            if not reference or target is None:
+                continue
+            question_ids = section.get('linkedQuestions', [])
+            reference_tokens = tokenize_segments(reference, REFERENCE_LANG, question_ids, linker)
+            if not any(t['kind'] == 'a' and not t['inline'] for t in reference_tokens):
+                if any(s.get('type') == 'answer' for s in target):
+                    results[key] = {'skipped': 'reference-unmarked'}
+                continue
+            total, edits = section_edits(reference_tokens, tokenize_segments(target, lang, question_ids, linker))
+            if edits:
+                results[key] = {'cost': total, 'edits': edits}
+    return lang, results, time.perf_counter() - start
+
+
+def apply_edits(segments, edits):
+    """
+    split / demote 적용 → 새 조각 리스트 (인접 normal은 합침)
+    split 구간은 괄호 표시를 빼고 안쪽 답만 answer 조각으로 남기므로 본문에서 괄호 표시가 사라짐
+    """
+    splits = {}
+    demoted = set()
+    for edit in edits:
+        if edit['op'] == 'split':
+            splits.setdefault(edit['segment'], []).append(edit)
+        elif edit['op'] == 'demote':
+            demoted.add(edit['segment'])
+
+    pieces = []
+    for index, segment in enumerate(segments):
+        text = segment.get('text', '')
+        if index in demoted:
+            pieces.append({'type': 'normal', 'text': text})
+        elif index in splits:
+            position = 0
+            for edit in sorted(splits[index], key=lambda e: e['start']):
+                pieces.append({'type': 'normal', 'text': text[position:edit['start']]})
+                pieces.append({'type': 'answer', 'text': edit['text']})
+                position = edit['end']
+            pieces.append({'type': 'normal', 'text': text[position:]})
+        else:
+            pieces.append(dict(segment))
+
+    merged = []
+    for piece in pieces:
+        if piece['type'] == 'normal' and not piece['text'] and merged:
+            continue
+        if merged and piece['type'] == 'normal' and merged[-1]['type'] == 'normal':
+            merged[-1] = {**merged[-1], 'text': merged[-1]['text'] + piece['text']}
+        else:
+            merged.append(piece)
+    if len(merged) > 1 and merged[0]['type'] == 'normal' and not merged[0]['text']:
+        merged.pop(0)
+    return merged
+
+
+def markup_stripped_text(segments, edits):
+    """
+    원래 본문에서 split 구간의 괄호 표시만 지운 전체 텍스트 (apply_edits 결과 검증용)
+    split 구간이 괄호 표시 + 그 안의 답이 아니면 ValueError
+    """
+    splits = {}
+    for edit in edits:
+        if edit['op'] == 'split':
+            splits.setdefault(edit['segment'], []).append(edit)
+
+    parts = []
+    for index, segment in enumerate(segments):
+        text = segment.get('text', '')
+        position = 0
+        for edit in sorted(splits.get(index, []), key=lambda e: e['start']):
+            match = INLINE_ANSWER_RE.fullmatch(text, edit['start'], edit['end'])
+            if not match or match.group(1) != edit['text']:
+                raise ValueError(f"조각 {index}: split 구간이 괄호 표시가 아님 — {text[edit['start']:edit['end']]!r}")
+            parts.append(text[position:edit['start']])
+            parts.append(edit['text'])
+            position = edit['end']
+        parts.append(text[position:])
+    return ''.join(parts)
+
+
+def main():
+    args = sys.argv[1:]
+    jobs = int(args[args.index('--jobs') + 1]) if '--jobs' in args else None
+    selected = [a for i, a in enumerate(args) if not a.startswith('--') and (i == 0 or args[i - 1] != '--jobs')]
+    languages = [lang for lang in (selected or LANGUAGES) if lang != REFERENCE_LANG]
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    story_file = data_dir / 'question_story.json'
+
+    print("=" * 60)
+    print(f"🧬 스토리 조각 정렬 (기준: {REFERENCE_LANG}){' - 적용' if '--apply' in args else ''}")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(align_language, str(story_file), str(data_dir), lang) for lang in languages]
+        results = [future.result() for future in futures]
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    report = {}
+    print(f"\n  {'언어':<6}{'섹션':>6}{'split':>8}{'demote':>8}{'missing':>9}{'건너뜀':>8}{'시간':>10}")
+    for lang, sections, seconds in results:
+        counts = {'split': 0, 'demote': 0, 'missing': 0}
+        skipped = 0
+        for result in sections.values():
+            skipped += 'skipped' in result
+            for edit in result.get('edits', []):
+                counts[edit['op']] += 1
+        report[lang] = sections
+        print(f"  {lang:<6}{len(sections):>6}{counts['split']:>8}{counts['demote']:>8}{counts['missing']:>9}"
+              f"{skipped:>8}{seconds * 1000:>8.0f} ms")
+    print(f"\n⏱️  전체 {elapsed_ms:.0f} ms (언어 {len(languages)}개 병렬)")
+
+    write_json(data_dir / 'build' / 'story_alignment.json', report, pretty=False, schema=False)
+    print("💾 수정 목록: data/build/story_alignment.json")
+
+    if '--apply' not in args:
+        if any(e['op'] in ('split', 'demote') for s in report.values() for r in s.values() for e in r.get('edits', [])):
+            print("\n💡 --apply로 split / demote 적용 (missing은 번역 필요)")
+        return
+
+    with open(story_file, 'r', encoding='utf-8') as f:
+        story = json.load(f)
+    changed = 0
+    for chapter in story.get('civicsStory', []):
+        for section_index, section in enumerate(chapter.get('sections', []), 1):
+            for lang, sections in report.items():
+                edits = [e for e in sections.get(f"{chapter['chapterId']}.{section_index}", {}).get('edits', [])
+                         if e['op'] in ('split', 'demote')]
+                if not edits:
+                    continue
+                before = section[f'content_{lang}']
+                after = apply_edits(before, edits)
+                # 괄호 표시 외에 본문이 바뀌었으면 중단 (split이 없으면 본문 전체가 그대로여야 함)
+                if ''.join(s['text'] for s in after) != markup_stripped_text(before, edits):
+                    raise ValueError(f"{chapter['chapterId']}.{section_index} [{lang}]: 괄호 표시 외의 본문이 바뀜")
+                section[f'content_{lang}'] = after
+                changed += 1
+    write_json(story_file, story)
+    print(f"\n💾 {story_file.name}: 섹션 × 언어 {changed}개 수정")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+question_story.json 다국어 구조 일치(parity) 행렬
+- 챕터 × 섹션 × 언어 셀: 조각 수, answer 수, 조각 유형 순서, 본문 길이, answer가 가리키는 문제 id
+  (문제 id는 story_spans.QuestionLinker로 판정)
+- 언어마다 프로세스 하나: story_stream.iter_story로 그 언어만 읽고 나머지는 건너뜀
+- 영어(en) 셀과 비교하여 차이를 모두 기록
+    error:   섹션 / 본문 / 챕터 제목 · 소개 없음, 빈 answer, answer 수 다름
+    warning: 조각 유형 순서 다름, 영어에서 찾은 문제가 없음, 본문 길이 비율이 그 언어 중앙값의 절반 ~ 2배 밖
+- 커밋 게이트: 기준선(story_parity_baseline.json)에 없는 새 error가 있으면 종료 코드 1
+  (기존 check_story_structure.js / scan_story_mismatches.js는 일부 언어만 보고 순서가 다르면 전부 실패)
+- data/build/story_parity.json에 행렬과 차이 목록 저장
+
+사용법:
+  python story_parity.py                    # 행렬 + 차이 + 게이트
+  python story_parity.py --update-baseline  # 현재 error를 기준선으로 저장
+  python story_parity.py --jobs N
+"""
+
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from answer_grader import build_index
+from canonical_json import write_json
+from story_spans import QuestionLinker
+from story_stream import iter_story
+from text_normalize import LANGUAGES
+
+REFERENCE_LANG = 'en'
+TYPE_CODES = {'normal': 'n', 'answer': 'a'}
+LENGTH_RATIO_BAND = 2.0
+BASELINE_FILE = 'story_parity_baseline.json'
+
+
+def analyze_language(story_file, data_dir, lang):
+    """워커: 한 언어의 셀 → {'chapters': {chapterId: {'title', 'introduction'}}, 'cells': {'챕터.섹션': 셀}}"""
+    linker = QuestionLinker(build_index(Path(data_dir), [lang]))
+    chapters = {}
+    cells = {}
+    with open(story_file, 'r', encoding='utf-8') as f:
+        for event in iter_story(f, languages={lang}):
+            if event[0] == 'chapter':
+                translation = event[1]['translations'].get(lang, {})
+                chapters[event[1]['chapterId']] = {
+                    'title': bool((translation.get('title') or '').strip()),
+                    'introduction': bool((translation.get('introduction') or '').strip()),
+                }
+            elif event[0] == 'section':
+                _, chapter_id, index, section = event
+                content = section['content'].get(lang)
+                if content is None:
+                    cells[f'{chapter_id}.{index}'] = None
+                    continue
+                answers = [item.get('text', '') for item in content if item.get('type') == 'answer']
+                questions = {linker.link(lang, section.get('linkedQuestions', []), text) for text in answers if text}
+                cells[f'{chapter_id}.{index}'] = {
+                    'pieces': len(content),
+                    'answers': len(answers),
+                    'emptyAnswers': sum(1 for text in answers if not text.strip()),
+                    'types': ''.join(TYPE_CODES.get(item.get('type'), '?') for item in content),
+                    'chars': sum(len(item.get('text', '')) for item in content),
+                    'questions': sorted(questions - {0}),
+                }
+    return lang, {'chapters': chapters, 'cells': cells}
+
+
+def deviation(severity, key, lang, kind, message):
+    return {'severity': severity, 'key': key, 'lang': lang, 'kind': kind, 'message': message}
+
+
+def compare(results, reference=REFERENCE_LANG):
+    """모든 언어 셀을 기준 언어와 비교 → 차이 목록"""
+    base = results[reference]
+    deviations = []
+    for lang, result in results.items():
+        if lang == reference:
+            continue
+        for chapter_id, fields in base['chapters'].items():
+            mine = result['chapters'].get(chapter_id, {})
+            for field, present in fields.items():
+                if present and not mine.get(field):
+                    deviations.append(deviation('error', str(chapter_id), lang, f'missing-{field}',
+                                                f"챕터 {field} 없음"))
+
+        ratios = [result['cells'][k]['chars'] / cell['chars'] for k, cell in base['cells'].items()
+                  if cell and cell['chars'] and result['cells'].get(k)]
+        median_ratio = statistics.median(ratios) if ratios else 1.0
+
+        for key, cell in base['cells'].items():
+            mine = result['cells'].get(key)
+            if cell is None:
+                continue
+            if mine is None:
+                deviations.append(deviation('error', key, lang, 'missing-content',
+                                            f"content_{lang} 없음" if key in result['cells'] else "섹션 없음"))
+                continue
+            if mine['emptyAnswers']:
+                deviations.append(deviation('error', key, lang, 'empty-answer',
+                                            f"빈 answer {mine['emptyAnswers']}개"))
+            if mine['answers'] != cell['answers']:
+                deviations.append(deviation('error', key, lang, 'answer-count',
+                                            f"answer {mine['answers']}개 (en {cell['answers']}개)"))
+            elif mine['types'] != cell['types']:
+                deviations.append(deviation('warning', key, lang, 'type-sequence',
+                                            f"조각 {mine['pieces']}개 순서 다름 (en {cell['pieces']}개)"))
+            missing_questions = sorted(set(cell['questions']) - set(mine['questions']))
+            if missing_questions:
+                deviations.append(deviation('warning', key, lang, 'questions',
+                                            f"en에서 찾은 문제 {missing_questions} 없음"))
+            if cell['chars'] and median_ratio:
+                ratio = mine['chars'] / cell['chars'] / median_ratio
+                if not 1 / LENGTH_RATIO_BAND <= ratio <= LENGTH_RATIO_BAND:
+                    deviations.append(deviation('warning', key, lang, 'length',
+                                                f"길이 {mine['chars']}자 (en {cell['chars']}자, "
+                                                f"언어 평균 대비 ×{ratio:.2f})"))
+
+        for key in result['cells']:
+            if key not in base['cells']:
+                deviations.append(deviation('error', key, lang, 'extra-section', "en에 없는 섹션"))
+    return deviations
+
+
+def deviation_id(item):
+    return f"{item['key']}:{item['lang']}:{item['kind']}"
+
+
+def print_matrix(results, deviations, languages):
+    """섹션 × 언어 answer 수 (✗ error, △ warning)"""
+    marks = {}
+    for item in deviations:
+        cell = (item['key'], item['lang'])
+        if item['severity'] == 'error' or cell not in marks:
+            marks[cell] = '✗' if item['severity'] == 'error' else '△'
+    keys = list(results[REFERENCE_LANG]['cells'])
+    print(f"\n  {'섹션':<8}" + ''.join(f"{lang:>7}" for lang in languages))
+    for key in keys:
+        row = []
+        for lang in languages:
+            cell = results[lang]['cells'].get(key)
+            text = '-' if cell is None else str(cell['answers'])
+            row.append(f"{text + marks.get((key, lang), ' '):>7}")
+        print(f"  {key:<8}" + ''.join(row))
+
+
+def main():
+    args = sys.argv[1:]
+    jobs = int(args[args.index('--jobs') + 1]) if '--jobs' in args else None
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    story_file = data_dir / 'question_story.json'
+    baseline_file = script_dir / BASELINE_FILE
+
+    print("=" * 60)
+    print("🧭 스토리 다국어 구조 일치 행렬")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(analyze_language, str(story_file), str(data_dir), lang) for lang in LANGUAGES]
+        results = dict(future.result() for future in futures)
+    deviations = compare(results)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    languages = [lang for lang in LANGUAGES if results[lang]['cells']
+                 and any(cell is not None for cell in results[lang]['cells'].values())]
+    absent = [lang for lang in LANGUAGES if lang not in languages]
+    print_matrix(results, deviations, languages)
+    if absent:
+        print(f"\n  ⏭️  스토리 본문이 없는 언어: {', '.join(absent)}")
+    deviations = [d for d in deviations if d['lang'] in languages]
+
+    errors = [d for d in deviations if d['severity'] == 'error']
+    warnings = [d for d in deviations if d['severity'] == 'warning']
+    by_kind = {}
+    for item in deviations:
+        by_kind[item['kind']] = by_kind.get(item['kind'], 0) + 1
+    print(f"\n📊 차이 {len(deviations)}건: error {len(errors)}, warning {len(warnings)} "
+          f"({', '.join(f'{k} {v}' for k, v in sorted(by_kind.items()))})")
+    print(f"⏱️  {elapsed_ms:.0f} ms (언어 {len(LANGUAGES)}개 병렬)")
+
+    write_json(data_dir / 'build' / 'story_parity.json', {
+        'reference': REFERENCE_LANG,
+        'languages': languages,
+        'cells': {lang: results[lang]['cells'] for lang in languages},
+        'deviations': deviations,
+    }, pretty=False, schema=False)
+
+    if '--update-baseline' in args:
+        write_json(baseline_file, sorted(deviation_id(d) for d in errors), schema=False)
+        print(f"\n💾 기준선 저장: {baseline_file.name} (error {len(errors)}건)")
+        return
+
+    baseline = set()
+    if baseline_file.exists():
+        with open(baseline_file, 'r', encoding='utf-8') as f:
+            baseline = set(json.load(f))
+    new_errors = [d for d in errors if deviation_id(d) not in baseline]
+    fixed = baseline - {deviation_id(d) for d in errors}
+    if fixed:
+        print(f"\n🎉 기준선 대비 해결된 error {len(fixed)}건 (--update-baseline으로 기준선 갱신)")
+    if new_errors:
+        print(f"\n❌ 기준선에 없는 새 error {len(new_errors)}건:")
+        for item in new_errors[:20]:
+            print(f"  • {item['key']} [{item['lang']}] {item['message']}")
+        sys.exit(1)
+    print("\n✅ 새 error 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스토리 본문 span 인코딩
+- question_story.json의 섹션 content_<lang>은 {"type": "normal"|"answer", "text": ...} 조각 리스트
+  (1장 한 섹션만 해도 언어마다 수십 개) → 섹션 × 언어마다 이어 붙인 문자열 하나 + 정수 배열 하나로 변환
+    "content_en": {"text": "Once upon a time ...", "spans": [start, length, type, questionId, ...]}
+  · start / length: UTF-16 코드 단위 (JS String.slice와 같은 단위)
+  · type: SPAN_TYPES의 인덱스 (0 normal, 1 answer)
+  · questionId: answer 조각이 섹션 linkedQuestions 중 어느 문제의 정답인지 (answer_grader로 판정,
+    한 문제로 정해지지 않거나 normal 조각이면 0)
+- 리더: iter_spans / decode_content / decode_story (원래 조각 리스트로 복원)
+- 검증: decode_story(encode_story(스토리)) == 원본
+- data/bundles/question_story.spans.min.json 생성, 객체 수 / 바이트 / 파싱 시간 비교 출력
+
+사용법:
+  python story_spans.py
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+from answer_grader import DEFAULT_THRESHOLD, best_match, build_index, prepare_transcript
+from canonical_json import dumps, write_json
+from text_normalize import LANGUAGES
+
+STORY_FILE = 'question_story.json'
+SPANS_FILE = 'question_story.spans.min.json'
+
+CONTENT_PREFIX = 'content_'
+SPAN_TYPES = ['normal', 'answer']
+SPAN_TYPE_IDS = {name: i for i, name in enumerate(SPAN_TYPES)}
+SPAN_WIDTH = 4  # start, length, type, questionId
+NO_QUESTION = 0
+
+
+def utf16_length(text):
+    return len(text.encode('utf-16-le')) // 2
+
+
+class QuestionLinker:
+    """answer 조각 → 섹션 linkedQuestions 중 정답이 가장 잘 맞는 문제 id (동점이거나 기준 미달이면 0)"""
+
+    def __init__(self, index, threshold=DEFAULT_THRESHOLD):
+        self.index = index
+        self.threshold = threshold
+
+    def link(self, lang, question_ids, text):
+        bank = self.index.get(lang)
+        if not bank:
+            return NO_QUESTION
+        prepared = prepare_transcript(text, lang)
+        scores = sorted(
+            ((best_match(bank[q]['answers'], prepared, lang)[0], q) for q in question_ids
+             if q in bank and not bank[q]['dynamic']),
+            reverse=True)
+        if not scores or scores[0][0] < self.threshold:
+            return NO_QUESTION
+        if len(scores) > 1 and scores[1][0] == scores[0][0]:
+            return NO_QUESTION
+        return scores[0][1]
+
+
+def encode_content(items, lang, question_ids, linker=None):
+    """조각 리스트 → {'text', 'spans'}"""
+    pieces = []
+    spans = []
+    position = 0
+    for item in items:
+        text = item['text']
+        length = utf16_length(text)
+        type_id = SPAN_TYPE_IDS[item['type']]
+        question_id = NO_QUESTION
+        if linker and item['type'] == 'answer':
+            question_id = linker.link(lang, question_ids, text)
+        spans.extend((position, length, type_id, question_id))
+        pieces.append(text)
+        position += length
+    return {'text': ''.join(pieces), 'spans': spans}
+
+
+def iter_spans(encoded):
+    """{'text', 'spans'} → (조각 문자열, 유형 이름, 문제 id)"""
+    text = encoded['text']
+    spans = encoded['spans']
+    if utf16_length(text) == len(text):
+        slice_at = lambda start, length: text[start:start + length]
+    else:
+        # BMP 밖 문자(이모지 등)가 있으면 UTF-16 단위로 잘라야 JS와 같은 위치
+        units = text.encode('utf-16-le')
+        slice_at = lambda start, length: units[start * 2:(start + length) * 2].decode('utf-16-le')
+    for i in range(0, len(spans), SPAN_WIDTH):
+        start, length, type_id, question_id = spans[i:i + SPAN_WIDTH]
+        yield slice_at(start, length), SPAN_TYPES[type_id], question_id
+
+
+def decode_content(encoded):
+    """{'text', 'spans'} → 원래 조각 리스트"""
+    return [{'type': span_type, 'text': text} for text, span_type, _ in iter_spans(encoded)]
+
+
+def map_sections(story, convert):
+    """모든 섹션의 content_<lang> 값에 convert(값, 언어, 섹션)를 적용한 복사본"""
+    chapters = []
+    for chapter in story.get('civicsStory', []):
+        sections = []
+        for section in chapter.get('sections', []):
+            sections.append({
+                key: convert(value, key[len(CONTENT_PREFIX):], section) if key.startswith(CONTENT_PREFIX) else value
+                for key, value in section.items()
+            })
+        chapters.append({**chapter, 'sections': sections})
+    return {**story, 'civicsStory': chapters}
+
+
+def encode_story(story, linker=None):
+    return map_sections(story, lambda items, lang, section: encode_content(
+        items, lang, section.get('linkedQuestions', []), linker))
+
+
+def decode_story(encoded_story):
+    return map_sections(encoded_story, lambda encoded, lang, section: decode_content(encoded))
+
+
+def count_objects(value):
+    """JSON 객체 / 배열 수 (파서가 만드는 컨테이너 수)"""
+    if isinstance(value, dict):
+        return 1 + sum(count_objects(v) for v in value.values())
+    if isinstance(value, list):
+        return 1 + sum(count_objects(v) for v in value)
+    return 0
+
+
+def verify(story, encoded_story):
+    """원래 조각 리스트로 복원되는지 + span이 문자열을 빈틈없이 덮는지"""
+    errors = []
+    if decode_story(encoded_story) != story:
+        errors.append("복원 결과가 원본과 다름")
+    for chapter in encoded_story.get('civicsStory', []):
+        for section_index, section in enumerate(chapter.get('sections', [])):
+            for key, encoded in section.items():
+                if not key.startswith(CONTENT_PREFIX):
+                    continue
+                spans = encoded['spans']
+                position = 0
+                for i in range(0, len(spans), SPAN_WIDTH):
+                    if spans[i] != position:
+                        errors.append(f"{chapter['chapterId']}장 섹션 {section_index + 1} {key}: "
+                                      f"span {i // SPAN_WIDTH} 시작 {spans[i]} ≠ {position}")
+                        break
+                    position += spans[i + 1]
+                if position != utf16_length(encoded['text']):
+                    errors.append(f"{chapter['chapterId']}장 섹션 {section_index + 1} {key}: "
+                                  f"span 합계 {position} ≠ 문자열 길이")
+    return errors
+
+
+def link_coverage(encoded_story):
+    """언어별 (answer span 수, 문제 id가 정해진 수)"""
+    coverage = {}
+    for chapter in encoded_story.get('civicsStory', []):
+        for section in chapter.get('sections', []):
+            for key, encoded in section.items():
+                if key.startswith(CONTENT_PREFIX):
+                    total, linked = coverage.get(key[len(CONTENT_PREFIX):], (0, 0))
+                    for _, span_type, question_id in iter_spans(encoded):
+                        if span_type == 'answer':
+                            total += 1
+                            linked += question_id != NO_QUESTION
+                    coverage[key[len(CONTENT_PREFIX):]] = (total, linked)
+    return coverage
+
+
+def parse_ms(text, rounds=20):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        json.loads(text)
+    return (time.perf_counter() - start) * 1000 / rounds
+
+
+def main():
+    print("=" * 60)
+    print("📖 스토리 span 인코딩")
+    print("=" * 60)
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+
+    with open(data_dir / STORY_FILE, 'r', encoding='utf-8') as f:
+        story = json.load(f)
+
+    start = time.perf_counter()
+    linker = QuestionLinker(build_index(data_dir, LANGUAGES))
+    encoded_story = encode_story(story, linker)
+    print(f"🔨 인코딩: {(time.perf_counter() - start) * 1000:.0f} ms (채점 색인 포함)")
+
+    errors = verify(story, encoded_story)
+    if errors:
+        print(f"\n❌ 검증 실패 {len(errors)}건:")
+        for error in errors[:10]:
+            print(f"  • {error}")
+        sys.exit(1)
+    print("✅ 검증: 모든 섹션 × 언어가 원래 조각 리스트로 복원됨")
+
+    output_file = data_dir / 'bundles' / SPANS_FILE
+    result = write_json(output_file, encoded_story, pretty=False, schema=False)
+
+    plain = dumps(story, pretty=False, schema=False)
+    encoded = dumps(encoded_story, pretty=False, schema=False)
+    plain_bytes = len(plain.encode('utf-8'))
+    before_objects = count_objects(story)
+    after_objects = count_objects(encoded_story)
+    print(f"\n📊 {'':<12}{'원본':>12}{'span':>12}{'감소':>10}")
+    print(f"  {'객체 / 배열':<10}{before_objects:>12,}{after_objects:>12,}{1 - after_objects / before_objects:>10.1%}")
+    print(f"  {'바이트':<10}{plain_bytes:>12,}{result['bytes']:>12,}{1 - result['bytes'] / plain_bytes:>10.1%}")
+    before_ms, after_ms = parse_ms(plain), parse_ms(encoded)
+    print(f"  {'파싱 (ms)':<10}{before_ms:>12.2f}{after_ms:>12.2f}{1 - after_ms / before_ms:>10.1%}")
+
+    print("\n🔗 answer span → 문제 id")
+    for lang, (total, linked) in link_coverage(encoded_story).items():
+        print(f"  {lang}: {linked}/{total}" + (f" ({linked / total:.0%})" if total else ""))
+    print(f"\n💾 {output_file.name}: {result['bytes']:,} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+question_story.json 스트리밍 내보내기
+- JsonStream: 파일을 조각 단위로 읽는 증분 JSON 파서 (표준 라이브러리만 사용)
+  객체 / 배열은 키·항목 단위로 순회하고, 필요 없는 값은 파이썬 객체를 만들지 않고 건너뜀
+- iter_story: 챕터 → 섹션 순서로 이벤트를 생성하며 선택한 언어 / 필드만 읽음
+- 언어별 JSON(extract_*_story) / CSV(story_to_csv) writer가 이벤트를 받는 즉시 기록
+  → 스토리가 커져도 메모리는 섹션 하나 크기로 유지되고, 첫 챕터부터 바로 출력
+- 한 번 읽으면서 여러 언어 파일을 동시에 기록
+
+사용법:
+  python story_stream.py [--format json|csv] [--lang en,ko] [--fields content,linkedQuestions] [--out-dir 경로]
+  python story_stream.py --benchmark [--lang en]
+"""
+
+import csv
+import json
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import ExitStack
+from pathlib import Path
+
+from canonical_json import PRETTY_INDENT, atomic_open, dumps, write_json
+
+CHUNK_SIZE = 1 << 16
+
+# 챕터 / 섹션에서 선택할 수 있는 필드 (chapterId는 항상 포함)
+STORY_FIELDS = ('title', 'introduction', 'content', 'linkedQuestions')
+
+CSV_COLUMNS = {
+    'ChapterID': None,
+    'ChapterTitle': 'title',
+    'ChapterIntroduction': 'introduction',
+    'SectionNumber': None,
+    'SectionContent': 'content',
+    'Answers': 'content',
+    'LinkedQuestions': 'linkedQuestions',
+}
+
+WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.S)
+SCALAR_RE = re.compile(r'[^,\]}\s]*')
+# 괄호가 아닌 부분과 완결된 문자열을 한 번에 건너뜀 (버퍼 끝에서 잘린 문자열은 _skip_string이 처리)
+SKIP_RE = re.compile(r'(?:[^"\[\]{}]+|"(?:[^"\\]|\\.)*")*', re.S)
+
+
+class JsonStream:
+    """
+    증분 JSON 파서
+    iter_object()는 키를, iter_array()는 인덱스를 넘겨주며 멈추고,
+    호출한 쪽이 그 값을 read_value() / skip_value() / 중첩 iter_*()로 소비해야 다음으로 진행
+    """
+
+    def __init__(self, fp, chunk_size=CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _grow(self):
+        """읽은 부분을 버리고 다음 조각을 붙임 (남은 버퍼 크기만큼 읽어 재시도가 선형이 되도록)"""
+        if self.eof:
+            return False
+        chunk = self.fp.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _error(self, message):
+        return ValueError(f"{message} (버퍼 위치 {self.pos}: {self.buf[self.pos:self.pos + 30]!r})")
+
+    def peek(self):
+        """공백을 건너뛴 다음 문자"""
+        while True:
+            self.pos = WHITESPACE_RE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._grow():
+                raise self._error("JSON이 예상보다 일찍 끝남")
+
+    def _expect(self, char):
+        if self.peek() != char:
+            raise self._error(f"'{char}'가 와야 함")
+        self.pos += 1
+
+    def read_value(self):
+        """현재 위치의 값 하나를 파이썬 객체로 읽음"""
+        first = self.peek()
+        if first not in '"[{':
+            # 숫자 / true / false / null은 구분자(, ] } 공백)나 EOF가 나올 때까지 읽은 뒤 해석
+            # ('1.'까지만 읽힌 상태에서 해석하면 1로 끝나고 다음 읽기가 '.5'에서 실패)
+            while SCALAR_RE.match(self.buf, self.pos).end() == len(self.buf) and self._grow():
+                pass
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._grow():
+                    continue
+                raise
+            self.pos = end
+            return value
+
+    def _skip_string(self):
+        while True:
+            match = STRING_RE.match(self.buf, self.pos)
+            if match:
+                self.pos = match.end()
+                return
+            if not self._grow():
+                raise self._error("문자열이 끝나지 않음")
+
+    def skip_value(self):
+        """현재 위치의 값을 객체로 만들지 않고 건너뜀"""
+        first = self.peek()
+        if first == '"':
+            self._skip_string()
+            return
+        if first not in '[{':
+            self.read_value()
+            return
+
+        depth = 0
+        while True:
+            self.pos = SKIP_RE.match(self.buf, self.pos).end()
+            if self.pos >= len(self.buf):
+                if not self._grow():
+                    raise self._error("괄호가 닫히지 않음")
+                continue
+            char = self.buf[self.pos]
+            if char == '"':
+                self._skip_string()
+                continue
+            self.pos += 1
+            depth += 1 if char in '[{' else -1
+            if depth == 0:
+                return
+
+    def iter_object(self):
+        """객체의 키를 순서대로 생성 (값은 호출한 쪽이 소비)"""
+        self._expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("객체 키가 와야 함")
+            key = self.read_value()
+            self._expect(':')
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise self._error("',' 또는 '}'가 와야 함")
+
+    def iter_array(self):
+        """배열 항목 인덱스를 순서대로 생성 (항목은 호출한 쪽이 소비)"""
+        self._expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            char = self.peek()
+            self.pos += 1
+            if char == ']':
+                return
+            if char != ',':
+                raise self._error("',' 또는 ']'가 와야 함")
+
+
+def _selected(name, fields):
+    return fields is None or name in fields
+
+
+def _read_section(stream, languages, fields):
+    """섹션 하나 → {'content': {lang: [...]}, 'linkedQuestions': [...], ...}"""
+    section = {'content': {}}
+    for key in stream.iter_object():
+        if key.startswith('content_'):
+            lang = key[len('content_'):]
+            if (languages is None or lang in languages) and _selected('content', fields):
+                section['content'][lang] = stream.read_value()
+            else:
+                stream.skip_value()
+        elif _selected(key, fields):
+            section[key] = stream.read_value()
+        else:
+            stream.skip_value()
+    return section
+
+
+def _iter_chapter(stream, languages, fields):
+    header = {'chapterId': None, 'translations': {}}
+    announced = False
+    for key in stream.iter_object():
+        if key == 'chapterId':
+            header['chapterId'] = stream.read_value()
+        elif key == 'translations':
+            for lang in stream.iter_object():
+                if languages is not None and lang not in languages:
+                    stream.skip_value()
+                    continue
+                entry = {}
+                for field in stream.iter_object():
+                    if _selected(field, fields):
+                        entry[field] = stream.read_value()
+                    else:
+                        stream.skip_value()
+                header['translations'][lang] = entry
+        elif key == 'sections':
+            # 챕터 정보(chapterId, translations)는 파일에서 sections보다 앞에 있음
+            yield ('chapter', header)
+            announced = True
+            for index in stream.iter_array():
+                yield ('section', header['chapterId'], index + 1, _read_section(stream, languages, fields))
+        else:
+            stream.skip_value()
+    if not announced:
+        yield ('chapter', header)
+    yield ('end', header['chapterId'])
+
+
+def iter_story(fp, languages=None, fields=None):
+    """
+    스토리 이벤트 생성
+      ('chapter', {'chapterId', 'translations': {lang: {title, introduction}}})
+      ('section', chapterId, 섹션 번호(1부터), section)
+      ('end', chapterId)
+    languages / fields가 None이면 전부, 아니면 선택한 것만 읽고 나머지는 건너뜀
+    """
+    stream = JsonStream(fp)
+    for key in stream.iter_object():
+        if key != 'civicsStory':
+            stream.skip_value()
+            continue
+        for _ in stream.iter_array():
+            yield from _iter_chapter(stream, languages, fields)
+
+
+def content_text(content, separator=''):
+    """content 배열에서 텍스트만 추출"""
+    return separator.join(item['text'] for item in content or [] if isinstance(item, dict) and 'text' in item)
+
+
+def content_answers(content):
+    """content 배열에서 answer 타입만 추출"""
+    return [item.get('text', '') for item in content or [] if isinstance(item, dict) and item.get('type') == 'answer']
+
+
+def _indented(value, level):
+    """pretty 표준 JSON을 level 칸 들여쓴 위치에 넣을 문자열로"""
+    return dumps(value).replace('\n', '\n' + ' ' * level)
+
+
+class StoryJsonWriter:
+    """
+    한 언어의 스토리 JSON을 챕터 / 섹션 단위로 바로 기록
+    결과는 전체를 모아 write_json으로 쓴 것과 바이트 단위로 같음
+    """
+
+    def __init__(self, fp, lang, fields=None):
+        self.fp = fp
+        self.lang = lang
+        self.fields = fields
+        self.chapters = 0
+        self.sections = 0
+        self.chapter_sections = 0
+        self.sample = None
+        fp.write('{\n' + ' ' * PRETTY_INDENT + '"civicsStory": [')
+
+    def chapter(self, header):
+        translation = header['translations'].get(self.lang, {})
+        chapter = {'chapterId': header['chapterId']}
+        for field in ('title', 'introduction'):
+            if _selected(field, self.fields):
+                chapter[field] = translation.get(field, '')
+        if self.sample is None:
+            self.sample = dict(chapter, sections=0, firstSection='')
+
+        pad = ' ' * (PRETTY_INDENT * 3)
+        parts = [(',' if self.chapters else '') + '\n' + ' ' * (PRETTY_INDENT * 2) + '{']
+        for key, value in chapter.items():
+            parts.append(f'\n{pad}{json.dumps(key)}: {_indented(value, PRETTY_INDENT * 3)},')
+        parts.append(f'\n{pad}"sections": [')
+        self.fp.write(''.join(parts))
+        self.chapters += 1
+        self.chapter_sections = 0
+
+    def section(self, chapter_id, number, section):
+        content = section['content'].get(self.lang)
+        if _selected('content', self.fields) and content is None:
+            # 이 언어의 내용이 없는 섹션은 건너뜀
+            return
+        out = {'content': content} if content is not None else {}
+        out.update((key, value) for key, value in section.items() if key != 'content')
+        if not out:
+            return
+
+        level = PRETTY_INDENT * 4
+        self.fp.write((',' if self.chapter_sections else '') + '\n' + ' ' * level + _indented(out, level))
+        self.chapter_sections += 1
+        self.sections += 1
+        if self.chapters == 1:
+            self.sample['sections'] += 1
+            if self.chapter_sections == 1:
+                self.sample['firstSection'] = content_text(content, ' ')
+
+    def end_chapter(self, chapter_id):
+        closing = '\n' + ' ' * (PRETTY_INDENT * 3) + ']' if self.chapter_sections else ']'
+        self.fp.write(closing + '\n' + ' ' * (PRETTY_INDENT * 2) + '}')
+
+    def close(self):
+        self.fp.write(('\n' + ' ' * PRETTY_INDENT + ']' if self.chapters else ']') + '\n}')
+
+
+class StoryCsvWriter:
+    """한 언어의 스토리를 챕터 행 + 섹션 행 CSV로 바로 기록"""
+
+    def __init__(self, fp, lang, fields=None):
+        self.lang = lang
+        self.fields = fields
+        self.columns = [c for c, field in CSV_COLUMNS.items() if field is None or _selected(field, fields)]
+        self.writer = csv.DictWriter(fp, fieldnames=self.columns, extrasaction='ignore')
+        self.writer.writeheader()
+        self.chapters = 0
+        self.sections = 0
+        self.sample = None
+
+    def chapter(self, header):
+        translation = header['translations'].get(self.lang, {})
+        row = {
+            'ChapterID': header['chapterId'],
+            'ChapterTitle': translation.get('title', ''),
+            'ChapterIntroduction': translation.get('introduction', ''),
+        }
+        self.writer.writerow(row)
+        self.chapters += 1
+        if self.sample is None:
+            self.sample = dict(row)
+
+    def section(self, chapter_id, number, section):
+        content = section['content'].get(self.lang)
+        if _selected('content', self.fields) and not content:
+            # 이 언어의 내용이 없거나 비어 있는 섹션은 빈 행을 남기지 않고 건너뜀
+            return
+        self.writer.writerow({
+            'ChapterID': chapter_id,
+            'SectionNumber': number,
+            'SectionContent': content_text(content),
+            'Answers': ', '.join(content_answers(content)),
+            'LinkedQuestions': ', '.join(str(q) for q in section.get('linkedQuestions') or []),
+        })
+        self.sections += 1
+
+    def end_chapter(self, chapter_id):
+        pass
+
+    def close(self):
+        pass
+
+
+WRITERS = {'json': StoryJsonWriter, 'csv': StoryCsvWriter}
+
+
+def export_story(input_file, outputs, fmt='json', fields=None):
+    """
+    스토리를 한 번 읽으면서 언어별 파일로 기록
+    outputs: {lang: 출력 경로}
+    반환: {lang: {'chapters', 'sections', 'sample'}}, 첫 출력까지 걸린 ms
+    """
+    writer_class = WRITERS[fmt]
+    fields = set(fields) if fields is not None else None
+    started = time.perf_counter()
+    first_output_ms = None
+
+    with ExitStack() as stack:
+        writers = {
+            lang: writer_class(stack.enter_context(atomic_open(path, 'w', encoding='utf-8', newline='')), lang, fields)
+            for lang, path in outputs.items()
+        }
+        with open(input_file, 'r', encoding='utf-8') as f:
+            for event in iter_story(f, set(outputs), fields):
+                kind = event[0]
+                for writer in writers.values():
+                    if kind == 'chapter':
+                        writer.chapter(event[1])
+                    elif kind == 'section':
+                        writer.section(*event[1:])
+                    else:
+                        writer.end_chapter(event[1])
+                if first_output_ms is None:
+                    first_output_ms = (time.perf_counter() - started) * 1000
+        for writer in writers.values():
+            writer.close()
+
+    stats = {
+        lang: {'chapters': w.chapters, 'sections': w.sections, 'sample': w.sample}
+        for lang, w in writers.items()
+    }
+    return stats, first_output_ms
+
+
+def _load_all_and_export(input_file, output_file, lang):
+    """비교용: 기존 방식 (전체 json.load → 언어별 리스트 누적 → write_json)"""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    chapters = []
+    for chapter in data['civicsStory']:
+        translation = chapter.get('translations', {}).get(lang, {})
+        sections = [
+            {'content': s[f'content_{lang}'], 'linkedQuestions': s['linkedQuestions']}
+            for s in chapter.get('sections', []) if f'content_{lang}' in s
+        ]
+        chapters.append({
+            'chapterId': chapter.get('chapterId'),
+            'title': translation.get('title', ''),
+            'introduction': translation.get('introduction', ''),
+            'sections': sections,
+        })
+    write_json(output_file, {'civicsStory': chapters})
+
+
+def _measure(function, *args):
+    """실행 시간(tracemalloc 없이)과 최대 메모리(tracemalloc)를 따로 측정"""
+    started = time.perf_counter()
+    result = function(*args)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    tracemalloc.start()
+    function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed_ms, peak
+
+
+def benchmark(input_file, lang):
+    print(f"\n⏱️  벤치마크: {input_file.name} → {lang} ({input_file.stat().st_size / 1024:.0f} KB)")
+    with tempfile.TemporaryDirectory() as tmp:
+        full_path = Path(tmp) / 'full.json'
+        stream_path = Path(tmp) / 'stream.json'
+        _, full_ms, full_peak = _measure(_load_all_and_export, input_file, full_path, lang)
+        (_, first_ms), stream_ms, stream_peak = _measure(export_story, input_file, {lang: stream_path})
+        same = full_path.read_bytes() == stream_path.read_bytes()
+
+    print(f"  • 전체 로드:  {full_ms:7.1f} ms, 최대 메모리 {full_peak / 1024:8.0f} KB")
+    print(f"  • 스트리밍:   {stream_ms:7.1f} ms, 최대 메모리 {stream_peak / 1024:8.0f} KB, 첫 출력 {first_ms:.1f} ms")
+    print(f"  • 출력 동일: {'✅' if same else '❌'}")
+    return same
+
+
+def main():
+    args = sys.argv[1:]
+
+    def option(name, default=None):
+        return args[args.index(name) + 1] if name in args else default
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    input_file = Path(option('--input', data_dir / 'question_story.json'))
+
+    print("=" * 60)
+    print("🎯 스토리 스트리밍 내보내기")
+    print("=" * 60)
+
+    if '--benchmark' in args:
+        if not benchmark(input_file, option('--lang', 'en')):
+            sys.exit(1)
+        return
+
+    fmt = option('--format', 'json')
+    if fmt not in WRITERS:
+        print(f"❌ 지원하지 않는 형식: {fmt} (json, csv)")
+        sys.exit(1)
+    fields = option('--fields')
+    fields = fields.split(',') if fields else None
+    unknown = set(fields or []) - set(STORY_FIELDS)
+    if unknown:
+        print(f"❌ 알 수 없는 필드: {', '.join(sorted(unknown))} (가능: {', '.join(STORY_FIELDS)})")
+        sys.exit(1)
+
+    languages = option('--lang')
+    if languages:
+        languages = languages.split(',')
+    else:
+        # 언어 목록만 필요하므로 첫 챕터의 translations까지만 읽음
+        with open(input_file, 'r', encoding='utf-8') as f:
+            header = next(event[1] for event in iter_story(f) if event[0] == 'chapter')
+        languages = list(header['translations'])
+
+    out_dir = Path(option('--out-dir', data_dir / 'build' / 'story'))
+    outputs = {lang: out_dir / f'question_story_{lang}.{fmt}' for lang in languages}
+
+    stats, first_ms = export_story(input_file, outputs, fmt, fields)
+    for lang, s in stats.items():
+        print(f"  ✅ {outputs[lang].relative_to(project_dir) if outputs[lang].is_absolute() and project_dir in outputs[lang].parents else outputs[lang]}: "
+              f"챕터 {s['chapters']}개, 섹션 {s['sections']}개")
+    print(f"\n⏱️  첫 출력까지 {first_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
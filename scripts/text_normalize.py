@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+언어별 텍스트 정규화 / 토큰화 공용 모듈
+- 라틴 문자 언어(en/es/fr/vi/tl): 소문자 + 발음 구별 기호 제거
+- 아랍어: 하라카트/타트윌 제거, 알리프·야·타 마르부타 통일
+- 힌디어(데바나가리): 누크타 제거, 찬드라빈두 → 아누스바라
+- 중국어: CJK 바이그램, 한국어: 음절 바이그램
+"""
+
+import re
+import unicodedata
+
+LANGUAGES = ['en', 'ko', 'es', 'zh', 'tl', 'vi', 'hi', 'fr', 'ar']
+
+LATIN_LANGUAGES = {'en', 'es', 'fr', 'vi', 'tl'}
+
+# 답변 텍스트의 쉼표 그룹 구분자 (영문/중문/아랍어 쉼표, 중문 나열 쉼표, 세미콜론)
+# 괄호 안의 구분자는 제외: '(boarding, quartering)'은 한 답변의 설명
+ANSWER_SEPARATOR_RE = re.compile(r'\s*[,，、،;；]\s*(?![^(（]*[)）])')
+
+# "[Answers will vary]" 같은 대괄호 플레이스홀더
+PLACEHOLDER_RE = re.compile(r'^\s*\[.*\]\s*$')
+
+PAREN_RE = re.compile(r'\s*[(（][^)）]*[)）]\s*')
+
+ARABIC_DIACRITICS_RE = re.compile(r'[\u0610-\u061A\u064B-\u065F\u0670\u06D6-\u06ED\u0640]')
+ARABIC_CHAR_MAP = str.maketrans({
+    '\u0623': '\u0627', '\u0625': '\u0627', '\u0622': '\u0627', '\u0671': '\u0627',  # 알리프 변형 → ا
+    '\u0649': '\u064A',  # ى → ي
+    '\u0629': '\u0647',  # ة → ه
+    '\u0624': '\u0648',  # ؤ → و
+    '\u0626': '\u064A',  # ئ → ي
+})
+
+DEVANAGARI_CHAR_MAP = str.maketrans({
+    '\u093C': None,      # 누크타
+    '\u0901': '\u0902',  # 찬드라빈두 → 아누스바라
+})
+
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+CJK_RE = re.compile(r'[\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF]+')
+HANGUL_RE = re.compile(r'[\uAC00-\uD7A3]+')
+PUNCT_RE = re.compile(r'[^\w\s]', re.UNICODE)
+
+
+def fold_diacritics(text):
+    """NFKD 분해 후 결합 문자 제거 (é → e, ệ → e, đ → d)"""
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return stripped.replace('đ', 'd').replace('Đ', 'D')
+
+
+def normalize_text(text, lang):
+    """언어별 정규화: 비교/색인용 표준 형태로 변환"""
+    if not text:
+        return ''
+
+    text = unicodedata.normalize('NFKC', text).lower()
+
+    if lang in LATIN_LANGUAGES:
+        text = fold_diacritics(text)
+    elif lang == 'ar':
+        text = ARABIC_DIACRITICS_RE.sub('', text).translate(ARABIC_CHAR_MAP)
+    elif lang == 'hi':
+        text = text.translate(DEVANAGARI_CHAR_MAP)
+
+    text = PUNCT_RE.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def _ngrams(run, n=2):
+    """문자열 run을 n-gram 목록으로 (짧으면 run 그대로)"""
+    if len(run) <= n:
+        return [run]
+    return [run[i:i + n] for i in range(len(run) - n + 1)]
+
+
+def tokenize(text, lang, normalized=False):
+    """
+    언어별 토큰화
+    - zh: 한자 구간은 바이그램, 나머지는 단어
+    - ko: 한글 구간은 음절 바이그램 (조사가 붙어도 매칭되도록)
+    - 그 외: 단어 토큰
+    """
+    if not normalized:
+        text = normalize_text(text, lang)
+
+    ngram_re = {'zh': CJK_RE, 'ko': HANGUL_RE}.get(lang)
+
+    tokens = []
+    for word in WORD_RE.findall(text):
+        if ngram_re is None or not ngram_re.search(word):
+            tokens.append(word)
+            continue
+        pos = 0
+        for match in ngram_re.finditer(word):
+            if match.start() > pos:
+                tokens.append(word[pos:match.start()])
+            tokens.extend(_ngrams(match.group()))
+            pos = match.end()
+        if pos < len(word):
+            tokens.append(word[pos:])
+    return tokens
+
+
+def char_trigrams(text):
+    """정규화된 문자열의 문자 트라이그램 집합 (공백은 경계 표시로 유지)"""
+    padded = f' {text} '
+    if len(padded) < 3:
+        return {padded}
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def split_answer_groups(text):
+    """'Congress, legislative' 처럼 한 필드에 묶인 쉼표 그룹을 개별 답변으로 분리"""
+    if not text or PLACEHOLDER_RE.match(text):
+        return []
+    return [part.strip() for part in ANSWER_SEPARATOR_RE.split(text) if part.strip()]
+
+
+def answer_variants(answer, lang):
+    """답변 하나의 정규화 변형들 (괄호 포함/제외)"""
+    variants = []
+    for candidate in (answer, PAREN_RE.sub(' ', answer), answer.replace('(', '').replace(')', '')):
+        normalized = normalize_text(candidate, lang)
+        if normalized and normalized not in variants:
+            variants.append(normalized)
+    return variants
@@ -8,6 +8,8 @@ import csv
 import json
 from pathlib import Path
 
+from canonical_json import write_json
+
 def get_arabic_categories_from_csv(csv_file):
     """CSV에서 카테고리 매핑 추출"""
     
@@ -111,8 +113,7 @@ def update_arabic_json_categories(csv_file, json_file):
     # JSON 저장
     print(f"\n💾 JSON 파일 저장: {json_file.name}")
     
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(questions, f, ensure_ascii=False, indent=2)
+    write_json(json_file, questions)
     
     # 검증
     print(f"\n🔍 검증:")
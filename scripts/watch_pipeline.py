@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파이프라인 watch 모드
+- pipeline.py의 스테이지 입력 파일, 스크립트, 스크립트가 import하는 scripts/ 모듈
+  (text_normalize.py, answer_grader.py 등)을 감시 (inotify, 안 되면 폴링)
+  · 아직 없는 디렉터리(data/script_work 등)는 존재하는 가장 가까운 상위 디렉터리를 감시하다가
+    생기면 그 디렉터리를 감시에 추가
+- 바뀐 파일 → 그 파일(또는 그 모듈)을 쓰는 스테이지 + 하위 스테이지만 다시 실행
+- 스크립트는 현재 프로세스에서 실행하여 import 비용을 아끼고, 스크립트나 도우미 모듈이
+  바뀌면 다시 import함 (스테이지가 읽는 데이터는 실행할 때마다 새로 읽음 — 캐시하지 않음)
+- 검증용 문제 은행만 내용 해시가 같으면 다시 파싱하지 않음
+- 저장 후 결과(스테이지 상태, 문제 은행 검증)와 지연 시간을 바로 표시
+
+사용법:
+  python watch_pipeline.py [--poll] [--interval 초]
+"""
+
+import ctypes
+import ctypes.util
+import importlib
+import json
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+import question_schema
+from pipeline import STATUS_ICONS, Pipeline, default_stages, file_sha256, local_imports
+
+DEBOUNCE_SECONDS = 0.15
+DEFAULT_POLL_INTERVAL = 0.5
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_MODIFY
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def nearest_existing(directory):
+    """directory 자신 또는 존재하는 가장 가까운 상위 디렉터리"""
+    while not directory.exists() and directory.parent != directory:
+        directory = directory.parent
+    return directory
+
+
+class InotifyWatcher:
+    """디렉터리 단위 inotify 감시 (Linux)"""
+
+    def __init__(self, directories):
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name:
+            raise OSError("libc를 찾을 수 없음")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self.libc, 'inotify_init1'):
+            raise OSError("inotify를 지원하지 않는 시스템")
+
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+
+        self.wanted = {Path(directory) for directory in directories}
+        self.directories = {}
+        self.watch_existing()
+
+    def watch_existing(self):
+        """감시할 디렉터리마다 존재하는 가장 가까운 디렉터리에 감시 추가 → 새로 추가한 디렉터리 목록"""
+        added = []
+        watched = set(self.directories.values())
+        for directory in sorted(self.wanted):
+            target = nearest_existing(directory)
+            if target in watched:
+                continue
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(target), WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch 실패: {target}")
+            self.directories[wd] = target
+            watched.add(target)
+            added.append(target)
+        return added
+
+    def wait(self, timeout):
+        """바뀐 파일 경로 집합 (timeout 동안 이벤트가 없으면 빈 집합)"""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        changed = set()
+        try:
+            buffer = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        new_directory = False
+        while offset < len(buffer):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = buffer[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if name and wd in self.directories:
+                changed.add(self.directories[wd] / os.fsdecode(name))
+                new_directory |= bool(mask & IN_ISDIR)
+
+        if new_directory:
+            # 감시를 추가하기 전에 이미 생긴 파일도 바뀐 것으로 처리
+            for directory in self.watch_existing():
+                changed.update(path for path in directory.iterdir() if path.is_file())
+        return changed
+
+
+class PollingWatcher:
+    """inotify를 쓸 수 없을 때 mtime / 크기 비교"""
+
+    def __init__(self, files, interval):
+        self.files = list(files)
+        self.interval = interval
+        self.snapshot = {path: self._stat(path) for path in self.files}
+
+    @staticmethod
+    def _stat(path):
+        try:
+            stat = path.stat()
+            return stat.st_mtime_ns, stat.st_size
+        except FileNotFoundError:
+            return None
+
+    def wait(self, timeout):
+        time.sleep(min(timeout, self.interval))
+        changed = set()
+        for path in self.files:
+            current = self._stat(path)
+            if current != self.snapshot[path]:
+                self.snapshot[path] = current
+                changed.add(path)
+        return changed
+
+
+class BankCache:
+    """내용 해시별로 파싱한 문제 은행 보관 (바뀐 파일만 다시 파싱)"""
+
+    def __init__(self):
+        self.entries = {}
+
+    def load(self, path):
+        digest = file_sha256(path)
+        cached = self.entries.get(path)
+        if cached and cached[0] == digest:
+            return cached[1]
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.entries[path] = (digest, data)
+        return data
+
+
+class Watch:
+    """바뀐 파일 → 영향받는 스테이지 계산 → 실행 → 검증"""
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.banks = BankCache()
+
+        # 감시 대상: 모든 스테이지 입력 + 스크립트 + 스크립트가 import하는 로컬 모듈
+        self.consumers = {}
+        for name, s in pipeline.stages.items():
+            for relative in s['inputs']:
+                self.consumers.setdefault(pipeline.path(relative), set()).add(name)
+            if s['script']:
+                for script in [s['script']] + sorted(local_imports(pipeline.script_dir, s['script'])):
+                    self.consumers.setdefault(pipeline.script_dir / script, set()).add(name)
+        self.schema_digest = self.schema_code_digest()
+
+        self.hashes = {path: self._hash(path) for path in self.consumers}
+
+    @staticmethod
+    def _hash(path):
+        return file_sha256(path) if path.exists() else None
+
+    def schema_code_digest(self):
+        return self.pipeline.code_digest('question_schema.py')
+
+    def directories(self):
+        """감시할 디렉터리 (아직 없는 것 포함 — InotifyWatcher가 상위 디렉터리로 대신 감시)"""
+        return sorted({path.parent for path in self.consumers})
+
+    def affected(self, changed_paths):
+        """내용이 실제로 바뀐 파일과 그 파일을 쓰는 스테이지 + 하위 스테이지"""
+        really_changed = []
+        for path in changed_paths:
+            if path not in self.consumers:
+                continue
+            digest = self._hash(path)
+            if digest != self.hashes.get(path):
+                self.hashes[path] = digest
+                really_changed.append(path)
+
+        stages = set()
+        pending = [name for path in really_changed for name in self.consumers[path]]
+        while pending:
+            name = pending.pop()
+            if name not in stages:
+                stages.add(name)
+                pending.extend(self.pipeline.dependents[name])
+        return really_changed, stages
+
+    def rebuild(self, changed_paths, started):
+        changed, stages = self.affected(changed_paths)
+        if not changed:
+            return
+
+        project_dir = self.pipeline.project_dir
+        print(f"\n📝 변경: {', '.join(str(p.relative_to(project_dir)) for p in changed)}")
+        results = self.pipeline.run(stages, jobs=1)
+        for name, state, seconds, message in results:
+            print(f"  {STATUS_ICONS[state]} {name:<30}{state:<12}{seconds * 1000:>7.0f} ms  {message}")
+
+        # 스테이지가 쓴 파일은 이미 반영했으므로 다음 이벤트에서 다시 처리하지 않음
+        for name in stages:
+            for relative in self.pipeline.stages[name]['outputs']:
+                path = self.pipeline.path(relative)
+                if path in self.hashes:
+                    self.hashes[path] = self._hash(path)
+
+        self.validate(changed, stages)
+        print(f"⏱️  저장 → 결과 {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    def validate(self, changed, stages):
+        """바뀌었거나 다시 만든 문제 은행 검증"""
+        banks = set(p for p in changed if p.name.startswith('interview_questions_') and p.suffix == '.json')
+        for name in stages:
+            for relative in self.pipeline.stages[name]['outputs']:
+                if Path(relative).name.startswith('interview_questions_') and relative.endswith('.json') \
+                        and '/bundles/' not in relative:
+                    banks.add(self.pipeline.path(relative))
+
+        # 검증 규칙(question_schema.py, text_normalize.py)이 바뀌었으면 다시 import
+        digest = self.schema_code_digest()
+        if digest != self.schema_digest:
+            for helper in local_imports(self.pipeline.script_dir, 'question_schema.py'):
+                sys.modules.pop(helper[:-len('.py')], None)
+            importlib.reload(question_schema)
+            self.schema_digest = digest
+
+        for path in sorted(banks):
+            if not path.exists():
+                continue
+            lang = path.stem[len('interview_questions_'):]
+            try:
+                issues = question_schema.validate_questions(self.banks.load(path), lang)
+            except json.JSONDecodeError as e:
+                print(f"  ❌ {path.name}: JSON 파싱 실패 — {e}")
+                continue
+            errors = [i for i in issues if i['severity'] == 'error']
+            if errors:
+                print(f"  ❌ {path.name}: 오류 {len(errors)}개 — {question_schema.format_issue(errors[0])}")
+            else:
+                print(f"  ✅ {path.name}: 검증 통과")
+
+
+def main():
+    args = sys.argv[1:]
+    interval = DEFAULT_POLL_INTERVAL
+    if '--interval' in args:
+        interval = float(args[args.index('--interval') + 1])
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    pipeline = Pipeline(default_stages(), project_dir, in_process=True)
+    watch = Watch(pipeline)
+
+    watcher = None
+    if '--poll' not in args:
+        try:
+            watcher = InotifyWatcher(watch.directories())
+            mode = 'inotify'
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify 사용 불가 ({e}), 폴링으로 전환")
+    if watcher is None:
+        watcher = PollingWatcher(watch.consumers, interval)
+        mode = f'폴링 {interval}s'
+
+    print("=" * 60)
+    print(f"👀 파이프라인 watch 모드 ({mode})")
+    print("=" * 60)
+    print(f"감시 파일 {len(watch.consumers)}개, 디렉터리 {len(watch.directories())}개 — Ctrl+C로 종료")
+
+    try:
+        while True:
+            changed = watcher.wait(1.0)
+            if not changed:
+                continue
+            started = time.perf_counter()
+            # 에디터가 여러 번 나눠 저장하는 경우를 한 번에 처리
+            while True:
+                more = watcher.wait(DEBOUNCE_SECONDS)
+                if not more:
+                    break
+                changed |= more
+            watch.rebuild(changed, started)
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        print("\n👋 종료")
+
+
+if __name__ == "__main__":
+    main()
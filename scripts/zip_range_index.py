@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZIP 코드 구간(range) 색인
+- us_representatives.json의 zipToDistrict.mappings와
+  us_political_data.json의 zipToState.exactMappings를
+  같은 값이 이어지는 ZIP 구간들로 압축
+- 여러 선거구에 걸친 ZIP(예: '11361' → ['NY-6', 'NY-3'])은 overflow 테이블로
+- 정렬된 배열(starts / lengths / valueIds) + 문자열 테이블 형태로 저장하고
+  bisect로 조회
+- 딕셔너리 형태와 크기 / 로드 시간 / 조회 지연 비교 벤치마크
+
+사용법:
+  python zip_range_index.py              # 색인 생성 + 벤치마크
+  python zip_range_index.py --synthetic  # 전국 규모(약 4.2만 ZIP) 가상 데이터로 벤치마크
+"""
+
+import json
+import random
+import struct
+import sys
+import time
+import zlib
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+
+from canonical_json import dumps, write_json
+
+INDEX_MAGIC = b'CTZI'
+INDEX_VERSION = 1
+
+SYNTHETIC_MAX_GAP = 50
+
+U16_MAX = 0xFFFF
+
+
+def build_range_index(mappings, max_gap=0):
+    """
+    {ZIP 문자열 → 값 또는 값 리스트}를 구간 색인으로 압축
+    - max_gap: 같은 값 사이에 이 개수 이하의 빈 ZIP이 있으면 한 구간으로 합침
+      (0이면 연속된 ZIP만 합쳐서 원본에 없는 ZIP은 조회되지 않음)
+    반환: {'starts', 'lengths', 'valueIds', 'values', 'overflow'}
+      valueIds[i] < len(values)      → values[valueIds[i]]
+      valueIds[i] >= len(values)     → overflow[valueIds[i] - len(values)] (values 인덱스 리스트)
+    """
+    values = []
+    value_ids = {}
+    overflow = []
+    overflow_ids = {}
+
+    def value_id(value):
+        if value not in value_ids:
+            value_ids[value] = len(values)
+            values.append(value)
+        return value_ids[value]
+
+    encoded = []
+    for zip_code in sorted(mappings, key=int):
+        value = mappings[zip_code]
+        if isinstance(value, list):
+            key = tuple(value_id(v) for v in value)
+            if key not in overflow_ids:
+                overflow_ids[key] = len(overflow)
+                overflow.append(list(key))
+            encoded.append((int(zip_code), ('overflow', overflow_ids[key])))
+        else:
+            encoded.append((int(zip_code), ('value', value_id(value))))
+
+    starts = array('I')
+    lengths = array('H')
+    ids = []
+    for zip_number, code in encoded:
+        if ids and ids[-1] == code:
+            end = starts[-1] + lengths[-1] - 1
+            # 구간 길이는 u16이므로 넘치면 새 구간 시작
+            if zip_number - end - 1 <= max_gap and zip_number - starts[-1] + 1 <= U16_MAX:
+                lengths[-1] = zip_number - starts[-1] + 1
+                continue
+        starts.append(zip_number)
+        lengths.append(1)
+        ids.append(code)
+
+    value_count = len(values)
+    if value_count + len(overflow) > U16_MAX + 1:
+        raise ValueError(f"값 {value_count}개 + overflow {len(overflow)}개가 u16 valueIds 범위를 넘음")
+    value_id_array = array('H', (
+        index if kind == 'value' else value_count + index for kind, index in ids
+    ))
+
+    return {
+        'starts': starts,
+        'lengths': lengths,
+        'valueIds': value_id_array,
+        'values': values,
+        'overflow': overflow,
+    }
+
+
+def lookup(index, zip_code):
+    """
+    ZIP 조회 (bisect)
+    반환: 값 문자열, 여러 값이면 리스트, 없으면 None
+    """
+    try:
+        zip_number = int(zip_code)
+    except (TypeError, ValueError):
+        return None
+
+    position = bisect_right(index['starts'], zip_number) - 1
+    if position < 0:
+        return None
+    if zip_number >= index['starts'][position] + index['lengths'][position]:
+        return None
+
+    value_id = index['valueIds'][position]
+    values = index['values']
+    if value_id < len(values):
+        return values[value_id]
+    return [values[i] for i in index['overflow'][value_id - len(values)]]
+
+
+def to_json_arrays(index):
+    """앱(JS)에서 바로 쓸 수 있는 배열 형태"""
+    return {
+        'starts': list(index['starts']),
+        'lengths': list(index['lengths']),
+        'valueIds': list(index['valueIds']),
+        'values': index['values'],
+        'overflow': index['overflow'],
+    }
+
+
+def little_endian_bytes(values):
+    """배열을 리틀 엔디언 바이트로 (헤더의 '<'와 같게, 빅 엔디언 호스트에서는 바이트 순서를 뒤집음)"""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def from_little_endian(typecode, data):
+    """little_endian_bytes의 역변환"""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def save_binary(index, output_file):
+    """
+    디스크 형식: MAGIC(4) | version(u16) | 구간 수(u32) | 테이블 길이(u32)
+                | zlib(테이블 JSON) | zlib(starts u32[] + lengths u16[] + valueIds u16[])
+    모든 정수는 리틀 엔디언 (호스트 바이트 순서와 무관)
+    """
+    count = len(index['starts'])
+    arrays = b''.join(little_endian_bytes(index[key]) for key in ('starts', 'lengths', 'valueIds'))
+    table = dumps({'values': index['values'], 'overflow': index['overflow']}, pretty=False).encode('utf-8')
+    table_bytes = zlib.compress(table, 9)
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'wb') as f:
+        f.write(INDEX_MAGIC)
+        f.write(struct.pack('<HII', INDEX_VERSION, count, len(table_bytes)))
+        f.write(table_bytes)
+        f.write(zlib.compress(arrays, 9))
+
+
+def load_binary(index_file):
+    """save_binary로 저장한 색인 로드"""
+    with open(index_file, 'rb') as f:
+        raw = f.read()
+
+    if raw[:4] != INDEX_MAGIC:
+        raise ValueError(f"ZIP 색인 파일이 아님: {index_file}")
+    version, count, table_length = struct.unpack_from('<HII', raw, 4)
+    if version != INDEX_VERSION:
+        raise ValueError(f"지원하지 않는 색인 버전: {version}")
+
+    offset = 4 + struct.calcsize('<HII')
+    table = json.loads(zlib.decompress(raw[offset:offset + table_length]).decode('utf-8'))
+    arrays = zlib.decompress(raw[offset + table_length:])
+
+    starts = from_little_endian('I', arrays[:count * 4])
+    lengths = from_little_endian('H', arrays[count * 4:count * 6])
+    value_ids = from_little_endian('H', arrays[count * 6:count * 8])
+
+    return {
+        'starts': starts,
+        'lengths': lengths,
+        'valueIds': value_ids,
+        'values': table['values'],
+        'overflow': table['overflow'],
+    }
+
+
+def verify(index, mappings):
+    """원본 딕셔너리의 모든 ZIP이 같은 값으로 조회되는지 확인"""
+    errors = []
+    for zip_code, expected in mappings.items():
+        actual = lookup(index, zip_code)
+        if actual != expected:
+            errors.append(f"{zip_code}: {expected} ≠ {actual}")
+    return errors
+
+
+def synthetic_mappings(zip_count=42000, seed=128):
+    """전국 규모 벤치마크용 가상 ZIP → 선거구 데이터 (인접 ZIP은 대부분 같은 선거구)"""
+    rng = random.Random(seed)
+    zip_numbers = sorted(rng.sample(range(501, 99951), zip_count))
+    mappings = {}
+    district = 'AL-1'
+    for zip_number in zip_numbers:
+        if rng.random() < 0.08:
+            district = f"ST{rng.randint(1, 50)}-{rng.randint(1, 52)}"
+        if rng.random() < 0.01:
+            mappings[f'{zip_number:05d}'] = [district, f"ST{rng.randint(1, 50)}-{rng.randint(1, 52)}"]
+        else:
+            mappings[f'{zip_number:05d}'] = district
+    return mappings
+
+
+def benchmark(name, mappings, output_dir, max_gap=0):
+    """딕셔너리 JSON과 구간 색인의 크기 / 로드 시간 / 조회 지연 비교"""
+    print(f"\n📊 {name}: ZIP {len(mappings):,}개")
+
+    index = build_range_index(mappings, max_gap)
+    errors = verify(index, mappings)
+    if errors:
+        print(f"  ❌ 검증 실패 {len(errors)}건: {errors[:3]}")
+    else:
+        print("  ✅ 검증: 모든 ZIP 조회 일치")
+
+    dict_json = json.dumps(mappings, ensure_ascii=False, separators=(',', ':'))
+    array_json = json.dumps(to_json_arrays(index), ensure_ascii=False, separators=(',', ':'))
+    binary_file = output_dir / f'{name}.zipidx'
+    save_binary(index, binary_file)
+
+    print(f"  • 구간 수: {len(index['starts']):,}개 (값 {len(index['values'])}개, overflow {len(index['overflow'])}개)")
+    print(f"  • 크기: 딕셔너리 JSON {len(dict_json):,} B / 배열 JSON {len(array_json):,} B"
+          f" / 바이너리 {binary_file.stat().st_size:,} B")
+
+    rounds = 20
+    start = time.perf_counter()
+    for _ in range(rounds):
+        json.loads(dict_json)
+    dict_load_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        load_binary(binary_file)
+    binary_load_ms = (time.perf_counter() - start) * 1000 / rounds
+    print(f"  • 로드: 딕셔너리 {dict_load_ms:.3f} ms / 바이너리 {binary_load_ms:.3f} ms")
+
+    probes = list(mappings) + [f'{n:05d}' for n in range(0, 100000, 997)]
+    start = time.perf_counter()
+    for zip_code in probes:
+        mappings.get(zip_code)
+    dict_us = (time.perf_counter() - start) * 1e6 / len(probes)
+
+    start = time.perf_counter()
+    for zip_code in probes:
+        lookup(index, zip_code)
+    range_us = (time.perf_counter() - start) * 1e6 / len(probes)
+    print(f"  • 조회: 딕셔너리 {dict_us:.3f} µs / 구간 색인 {range_us:.3f} µs")
+
+    return index
+
+
+def main():
+    print("=" * 60)
+    print("🎯 ZIP 코드 구간 색인 생성")
+    print("=" * 60)
+
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+    data_dir = project_dir / 'data'
+    output_dir = data_dir / 'build'
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if '--synthetic' in sys.argv:
+        mappings = synthetic_mappings()
+        benchmark('synthetic_district', mappings, output_dir)
+        # 빈 ZIP을 앞뒤 구간에 흡수하면 구간 수가 크게 줄어듦 (존재하지 않는 ZIP도 조회됨)
+        benchmark('synthetic_district_gap', mappings, output_dir, max_gap=SYNTHETIC_MAX_GAP)
+        return
+
+    with open(data_dir / 'us_representatives.json', 'r', encoding='utf-8') as f:
+        district_mappings = json.load(f)['zipToDistrict']['mappings']
+    with open(data_dir / 'us_political_data.json', 'r', encoding='utf-8') as f:
+        state_mappings = json.load(f)['zipToState']['exactMappings']
+
+    for name, mappings in (('zip_to_district', district_mappings), ('zip_to_state', state_mappings)):
+        index = benchmark(name, mappings, output_dir)
+        array_file = output_dir / f'{name}.json'
+        write_json(array_file, to_json_arrays(index), pretty=False)
+        print(f"  💾 저장됨: {array_file.name}, {name}.zipidx")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+// 공유 문자열 테이블로 압축된 번들 해석 (scripts/build_question_bundles.py로 생성)
+// 번들 형식: { numericFields: [...], data: ... }
+// data의 정수 값은 strings.min.json의 인덱스이고, 숫자 필드(numericFields)의 정수와 한 번만 나오는 문자열은 그대로 저장됨
+// 같은 문자열은 테이블의 한 인스턴스를 공유하므로 여러 언어를 로드해도 메모리에 중복되지 않음
+
+let stringTable = null;
+
+// 문자열 테이블은 처음 해석할 때 한 번만 require
+const getStringTable = () => {
+  if (!stringTable) {
+    stringTable = require('../data/bundles/strings.min.json');
+  }
+  return stringTable;
+};
+
+// 컨테이너(객체 / 배열)의 값을 제자리에서 복원
+const resolveInPlace = (container, numericFields, table, parentKey = null) => {
+  for (const childKey of Object.keys(container)) {
+    // 배열 요소는 배열을 담은 필드의 이름을 따름 (linkedQuestions: [3, 5] 등)
+    const key = Array.isArray(container) ? parentKey : childKey;
+    const value = container[childKey];
+    if (typeof value === 'number') {
+      if (!numericFields.has(key)) {
+        container[childKey] = table[value];
+      }
+    } else if (value && typeof value === 'object') {
+      resolveInPlace(value, numericFields, table, key);
+    }
+  }
+};
+
+// 번들을 원래 JSON으로 복원하여 반환
+// require한 모듈 객체를 제자리에서 고치므로 압축본과 복원본이 메모리에 따로 남지 않음 (두 번째 호출부터는 바로 반환)
+export const resolveBundle = (bundle) => {
+  if (!bundle.resolved) {
+    const container = { data: bundle.data };
+    resolveInPlace(container, new Set(bundle.numericFields), getStringTable());
+    bundle.data = container.data;
+    bundle.resolved = true;
+  }
+  return bundle.data;
+};
+
+export default resolveBundle;
@@ -1,9 +1,13 @@
 import AsyncStorage from '@react-native-async-storage/async-storage';
 import US_POLITICAL_DATA from '../data/us_political_data.json';
 import US_REPRESENTATIVES from '../data/us_representatives.json';
+import ZIP_STATES from '../data/bundles/zip_states.min.json';
 
 const LOCATION_KEY = '@user_location_info';
 
+// 하원의원 조회 API 주소 (테스트에서는 scripts/rep_lookup_service.py 로컬 서버로 교체)
+let REPRESENTATIVE_API_BASE = 'https://whoismyrepresentative.com';
+
 class LocationManager {
   // 사용자 위치 정보 저장
   static async saveUserLocation(locationInfo) {
@@ -27,6 +31,11 @@ class LocationManager {
     }
   }
 
+  // 하원의원 조회 API 주소 변경 (예: 'http://127.0.0.1:8765')
+  static setRepresentativeApiBase(baseUrl) {
+    REPRESENTATIVE_API_BASE = baseUrl.replace(/\/+$/, '');
+  }
+
   // 주 목록 가져오기
   static getStates() {
     return US_POLITICAL_DATA.states;
@@ -214,7 +223,7 @@ class LocationManager {
     console.log('호출 시간:', new Date().toISOString());
     
     try {
-      const apiUrl = `https://whoismyrepresentative.com/getall_mems.php?zip=${zipCode}&output=json`;
+      const apiUrl = `${REPRESENTATIVE_API_BASE}/getall_mems.php?zip=${zipCode}&output=json`;
       console.log('요청 URL:', apiUrl);
       console.log('요청 시작 시간:', new Date().toISOString());
       
@@ -344,31 +353,19 @@ class LocationManager {
     return US_REPRESENTATIVES.representatives[district] || null;
   }
 
-  // ZIP 코드로 주 찾기
+  // ZIP 코드로 주 찾기 (scripts/build_zip_state_table.py로 생성한 테이블, 네트워크 없이 O(1))
+  // 5자리 예외 → 3자리 접두어 순서, 주 하나 또는 빈 배열(USPS 미사용 접두어)
+  // 테이블에는 DC, 해외 영토(PR, GU 등), 군사 우편(AE/AA/AP)도 있지만 주 정보(US_POLITICAL_DATA.states)가
+  // 없는 코드는 빈 배열 (getStateInfo가 null이 되지 않도록)
   static getStateFromZipCode(zipCode) {
-    // 1단계: 정확한 ZIP 코드 매핑 확인
-    if (US_POLITICAL_DATA.zipToState.exactMappings[zipCode]) {
-      return [US_POLITICAL_DATA.zipToState.exactMappings[zipCode]];
+    const zip = String(zipCode).trim().slice(0, 5);
+    if (!/^\d{5}$/.test(zip)) {
+      return [];
     }
-    
-    // 2단계: 범위로 찾기 (기존 방식)
-    const firstDigit = zipCode.charAt(0);
-    
-    const zipToStateMap = {
-      '0': ['CT', 'MA', 'ME', 'NH', 'NJ', 'RI', 'VT'],
-      '1': ['DE', 'NY', 'PA'],
-      '2': ['MD', 'NC', 'SC', 'VA', 'WV', 'DC'],
-      '3': ['AL', 'FL', 'GA', 'MS', 'TN'],
-      '4': ['IN', 'KY', 'MI', 'OH'],
-      '5': ['IA', 'MN', 'MT', 'ND', 'SD', 'WI'],
-      '6': ['IL', 'KS', 'MO', 'NE'],
-      '7': ['AR', 'LA', 'OK', 'TX'],
-      '8': ['AZ', 'CO', 'ID', 'NM', 'NV', 'UT', 'WY'],
-      '9': ['AK', 'CA', 'HI', 'OR', 'WA']
-    };
-    
-    const possibleStates = zipToStateMap[firstDigit];
-    return possibleStates || [];
+
+    const offset = parseInt(zip.slice(0, 3), 10) * 2;
+    const state = ZIP_STATES.exceptions[zip] || ZIP_STATES.prefixes.slice(offset, offset + 2);
+    return US_POLITICAL_DATA.states[state] ? [state] : [];
   }
 
   // ZIP 코드로 주 정보 자동 설정
@@ -1,17 +1,71 @@
 import { getCurrentLanguage } from './i18n';
 import QuestionProcessor from './questionProcessor';
+import { resolveBundle } from './internedStrings';
+import BUNDLE_MANIFEST from '../data/bundles/manifest.json';
 
-// 언어별 질문 파일 매핑
-const QUESTION_FILES = {
-  ko: require('../data/interview_questions_ko.json'),
-  en: require('../data/interview_questions_en.json'),
-  es: require('../data/interview_questions_es.json'),
-  zh: require('../data/interview_questions_zh.json'),
-  tl: require('../data/interview_questions_tl.json'),
-  vi: require('../data/interview_questions_vi.json'),
-  hi: require('../data/interview_questions_hi.json'),
-  fr: require('../data/interview_questions_fr.json'),
-  ar: require('../data/interview_questions_ar.json')
+// 언어별 질문 번들 (scripts/build_question_bundles.py로 생성)
+// 사용하는 언어의 번들만 처음 요청될 때 require / 해석하여 앱 시작 시 9개 언어를 모두 파싱하지 않음
+const QUESTION_BUNDLES = {
+  ko: () => require('../data/bundles/interview_questions_ko.min.json'),
+  en: () => require('../data/bundles/interview_questions_en.min.json'),
+  es: () => require('../data/bundles/interview_questions_es.min.json'),
+  zh: () => require('../data/bundles/interview_questions_zh.min.json'),
+  tl: () => require('../data/bundles/interview_questions_tl.min.json'),
+  vi: () => require('../data/bundles/interview_questions_vi.min.json'),
+  hi: () => require('../data/bundles/interview_questions_hi.min.json'),
+  fr: () => require('../data/bundles/interview_questions_fr.min.json'),
+  ar: () => require('../data/bundles/interview_questions_ar.min.json')
+};
+
+// 언어 번들 가져오기 (manifest에 없는 언어는 null)
+// require가 모듈을 캐시하고 resolveBundle이 제자리에서 한 번만 해석하므로 따로 보관하지 않음
+const getQuestionBundle = (languageCode) => {
+  if (!BUNDLE_MANIFEST.languages[languageCode] || !QUESTION_BUNDLES[languageCode]) {
+    return null;
+  }
+  return resolveBundle(QUESTION_BUNDLES[languageCode]());
+};
+
+// 언어별 N-400 연습 번들 (scripts/build_n400_bundles.py로 생성)
+// 질문과 해설이 빌드 시점에 결합되어 있고 index가 q_id → items 위치
+const N400_BUNDLES = {
+  en: () => require('../data/bundles/n400_en.min.json'),
+  ko: () => require('../data/bundles/n400_ko.min.json')
+};
+
+const loadedN400 = {};
+
+// 번들 행 → { id, q_id, category, question, question_en, explanation }
+const toN400Question = (fields, row) => {
+  const record = {};
+  fields.forEach((field, i) => {
+    record[field] = row[i];
+  });
+  return {
+    id: record.id,
+    q_id: record.q_id,
+    category: record.category,
+    question: record.question,
+    question_en: record.question_en || record.question,
+    explanation: {
+      title: record.title,
+      intent: record.intent,
+      answer_guidance: record.answer_guidance
+    }
+  };
+};
+
+// 언어 N-400 번들 가져오기 (번들이 없는 언어는 영어)
+const getN400Bundle = (languageCode) => {
+  const language = N400_BUNDLES[languageCode] ? languageCode : 'en';
+  if (!loadedN400[language]) {
+    const bundle = N400_BUNDLES[language]();
+    loadedN400[language] = {
+      index: bundle.index,
+      questions: bundle.items.map(row => toN400Question(bundle.fields, row))
+    };
+  }
+  return loadedN400[language];
 };
 
 class QuestionLoader {
@@ -24,14 +78,13 @@ class QuestionLoader {
       const currentLanguage = getCurrentLanguage();
       
       // 해당 언어의 질문 파일이 있는지 확인
-      let questions;
-      if (QUESTION_FILES[currentLanguage]) {
+      let questions = getQuestionBundle(currentLanguage);
+      if (questions) {
         console.log(`${currentLanguage} 언어 질문 로드 중...`);
-        questions = QUESTION_FILES[currentLanguage];
       } else {
         // 해당 언어가 없으면 영어로 폴백
         console.warn(`${currentLanguage} 언어 파일이 없습니다. 영어로 폴백합니다.`);
-        questions = QUESTION_FILES.en;
+        questions = getQuestionBundle('en');
       }
       
       // 사용자 설정에 따라 질문 처리 (위치 기반 답변 등)
@@ -51,7 +104,7 @@ class QuestionLoader {
     } catch (error) {
       console.error('질문 로드 중 오류:', error);
       // 오류 발생 시 영어로 폴백
-      const questions = QUESTION_FILES.en;
+      const questions = getQuestionBundle('en');
       const processedQuestions = await QuestionProcessor.processQuestions(questions);
       return processedQuestions;
     }
@@ -64,22 +117,22 @@ class QuestionLoader {
    */
   static async loadQuestionsForLanguage(languageCode) {
     try {
-      if (QUESTION_FILES[languageCode]) {
+      const questions = getQuestionBundle(languageCode);
+      if (questions) {
         console.log(`${languageCode} 언어 질문 로드 중...`);
-        const questions = QUESTION_FILES[languageCode];
         
         // 사용자 설정에 따라 질문 처리 (위치 기반 답변 등)
         const processedQuestions = await QuestionProcessor.processQuestions(questions);
         return processedQuestions;
       } else {
         console.warn(`${languageCode} 언어 파일이 없습니다. 영어로 폴백합니다.`);
-        const questions = QUESTION_FILES.en;
-        const processedQuestions = await QuestionProcessor.processQuestions(questions);
+        const fallbackQuestions = getQuestionBundle('en');
+        const processedQuestions = await QuestionProcessor.processQuestions(fallbackQuestions);
         return processedQuestions;
       }
     } catch (error) {
       console.error(`${languageCode} 질문 로드 중 오류:`, error);
-      const questions = QUESTION_FILES.en;
+      const questions = getQuestionBundle('en');
       const processedQuestions = await QuestionProcessor.processQuestions(questions);
       return processedQuestions;
     }
@@ -103,12 +156,42 @@ class QuestionLoader {
     }
   }
 
+  /**
+   * 스토리 챕터들을 로드합니다.
+   * @returns {Array} civicsStory 챕터 배열
+   */
+  static loadStory() {
+    const story = resolveBundle(require('../data/bundles/question_story.min.json'));
+    return story.civicsStory || [];
+  }
+
+  /**
+   * N-400 연습 질문(해설 포함)을 로드합니다.
+   * @param {string} languageCode - 언어 코드 (선택사항, 현재 언어 사용)
+   * @returns {Array} { id, q_id, category, question, question_en, explanation } 배열
+   */
+  static loadN400Questions(languageCode = null) {
+    return getN400Bundle(languageCode || getCurrentLanguage()).questions;
+  }
+
+  /**
+   * q_id로 N-400 질문 하나를 찾습니다.
+   * @param {string} qId - 질문 q_id
+   * @param {string} languageCode - 언어 코드 (선택사항, 현재 언어 사용)
+   * @returns {Object|null} 질문 객체
+   */
+  static getN400Question(qId, languageCode = null) {
+    const bundle = getN400Bundle(languageCode || getCurrentLanguage());
+    const offset = bundle.index[qId];
+    return offset === undefined ? null : bundle.questions[offset];
+  }
+
   /**
    * 지원되는 언어 목록을 반환합니다.
    * @returns {Array} 지원되는 언어 코드 배열
    */
   static getSupportedLanguages() {
-    return Object.keys(QUESTION_FILES);
+    return Object.keys(BUNDLE_MANIFEST.languages);
   }
 
   /**
@@ -117,7 +200,7 @@ class QuestionLoader {
    * @returns {boolean} 파일 존재 여부
    */
   static isLanguageSupported(languageCode) {
-    return QUESTION_FILES.hasOwnProperty(languageCode);
+    return BUNDLE_MANIFEST.languages.hasOwnProperty(languageCode);
   }
 
   /**
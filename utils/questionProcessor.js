@@ -1,5 +1,6 @@
 import LocationManager from './locationManager';
 import { getCurrentLanguage, t } from './i18n';
+import DYNAMIC_ANSWERS from '../data/bundles/dynamic_answers.min.json';
 
 // 지역별로 답이 다른 문제들의 ID 목록 (128문제 기준)
 const LOCATION_DEPENDENT_QUESTIONS = {
@@ -12,49 +13,73 @@ const LOCATION_DEPENDENT_QUESTIONS = {
   62: 'state_capital'   // "What is the capital of your state?"
 };
 
+// 주 × 언어 오버레이 {문제 id: correctAnswers} (scripts/build_dynamic_answers.py로 생성, overlay_for와 같음)
+// 주를 모르면 주와 무관한 답(대통령 등)만 포함
+const getStateOverlay = (stateCode, languageCode) => {
+  const rationale = DYNAMIC_ANSWERS.rationales[languageCode] || DYNAMIC_ANSWERS.rationales.en;
+  const answers = { ...DYNAMIC_ANSWERS.federal, ...(DYNAMIC_ANSWERS.states[stateCode] || {}) };
+  const overlay = {};
+  for (const questionId of Object.keys(answers)) {
+    overlay[questionId] = [{ text: answers[questionId], rationale }];
+  }
+  return overlay;
+};
+
+// 사용자가 위치 설정에서 직접 정한 답 (없으면 null → 주 기본값 사용)
+const getUserSetAnswer = (questionType, userLocation) => {
+  switch (questionType) {
+    case 'senator':
+      if (userLocation.senators && userLocation.senators.length > 0) {
+        return userLocation.senators.length >= 2
+          ? `${userLocation.senators[0]} or ${userLocation.senators[1]}`
+          : userLocation.senators[0];
+      }
+      return null;
+    case 'governor':
+      return userLocation.governor && userLocation.governor !== 'auto' ? userLocation.governor : null;
+    case 'representative':
+      return userLocation.representatives && userLocation.representatives.length > 0
+        ? userLocation.representatives[0].name
+        : null;
+    default:
+      return null;
+  }
+};
+
 class QuestionProcessor {
-  // 문제 데이터를 처리하여 사용자 설정에 맞는 답으로 변경
-  static async processQuestion(question) {
-    const questionId = question.id;
-    
-    // 지역별 답이 필요한 문제인지 확인
-    if (LOCATION_DEPENDENT_QUESTIONS[questionId]) {
-      const questionType = LOCATION_DEPENDENT_QUESTIONS[questionId];
-      const userAnswer = await LocationManager.getLocationBasedAnswer(questionType);
-      
-      // 사용자가 설정한 답이 있으면 정답을 업데이트
+  // 사용자 위치로 이번 세션의 오버레이 {문제 id: correctAnswers} 생성 (위치 정보가 없으면 빈 오버레이)
+  static buildOverlay(userLocation, languageCode = getCurrentLanguage()) {
+    if (!userLocation) {
+      return {};
+    }
+
+    const overlay = getStateOverlay(userLocation.state, languageCode);
+    for (const questionId of Object.keys(LOCATION_DEPENDENT_QUESTIONS)) {
+      const userAnswer = getUserSetAnswer(LOCATION_DEPENDENT_QUESTIONS[questionId], userLocation);
       if (userAnswer && userAnswer !== 'Answers will vary') {
-        const processedQuestion = { ...question };
-        
-        // 정답 업데이트 (새로운 파일 구조에 맞게)
-        processedQuestion.correctAnswers = [
-          {
-            text: userAnswer,
-            rationale: t('interview.userSetAnswer')
-          }
-        ];
-        
-        return processedQuestion;
+        overlay[questionId] = [{ text: userAnswer, rationale: t('interview.userSetAnswer') }];
       }
     }
-    
-    return question;
+    return overlay;
+  }
+
+  // 문제 데이터를 처리하여 사용자 설정에 맞는 답으로 변경
+  static async processQuestion(question) {
+    const [processedQuestion] = await this.processQuestions([question]);
+    return processedQuestion;
   }
 
-  // 문제 배열을 처리
+  // 문제 배열을 처리 (위치 정보는 한 번만 읽고 오버레이 하나를 적용)
   static async processQuestions(questions) {
     console.log('🔄 QuestionProcessor.processQuestions 시작');
     console.log('처리할 문제 수:', questions.length);
     
-    // 먼저 사용자 위치 정보 디버깅
-    await LocationManager.debugUserLocation();
-    
-    const processedQuestions = [];
+    const userLocation = await LocationManager.getUserLocation();
+    const overlay = this.buildOverlay(userLocation);
     
-    for (const question of questions) {
-      const processedQuestion = await this.processQuestion(question);
-      processedQuestions.push(processedQuestion);
-    }
+    const processedQuestions = questions.map(question => (
+      overlay[question.id] ? { ...question, correctAnswers: overlay[question.id] } : question
+    ));
     
     console.log('✅ QuestionProcessor.processQuestions 완료');
     return processedQuestions;